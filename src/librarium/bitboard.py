@@ -0,0 +1,157 @@
+"""
+Bitboard: a boolean grid layer packed into one Python int, bit r * (cols + 1) + c per cell.
+
+Main idea:
+- Every row is followed by one always-zero padding bit, so shifting the whole board
+  by one column never moves a cell into the next or previous row.
+- Moving a board by a direction is one shift and one mask, whole-grid logic is
+  a handful of &, |, ^ on big ints instead of a Python loop per cell.
+- Neighbor counts are kept bit-sliced: plane i holds bit i of every cell count,
+  adding a board to the counter is a ripple-carry add over the planes.
+"""
+
+from collections.abc import Iterable, Iterator
+from typing import Self
+
+from librarium.grid import FULL_GRID, PosDelta, Position
+
+
+class BitBoard:
+    def __init__(self, *, rows: int, cols: int, bits: int = 0) -> None:
+        self.rows = rows
+        self.cols = cols
+        self.stride = cols + 1
+        # Set for every cell, clear for padding bits and everything past the last row
+        self.cells_mask = ((1 << cols) - 1) * _repeat_rows(rows, self.stride)
+        self.bits = bits & self.cells_mask
+
+    @classmethod
+    def from_rows(cls, rows: list[str], on: str) -> Self:
+        n_rows = len(rows)
+        n_cols = len(rows[0]) if n_rows > 0 else 0
+        bits = 0
+        for r, row in enumerate(rows):
+            if len(row) != n_cols:
+                raise ValueError("All rows must have the same length.")
+            # Column 0 is the lowest bit of the row, so the row string is read reversed
+            row_bits = int("".join("1" if ch == on else "0" for ch in reversed(row)) or "0", 2)
+            bits |= row_bits << (r * (n_cols + 1))
+        return cls(rows=n_rows, cols=n_cols, bits=bits)
+
+    def _with_bits(self, bits: int) -> "BitBoard":
+        board = BitBoard.__new__(BitBoard)
+        board.rows, board.cols, board.stride = self.rows, self.cols, self.stride
+        board.cells_mask = self.cells_mask
+        board.bits = bits & self.cells_mask
+        return board
+
+    def _bit(self, pos: Position) -> int:
+        if not (0 <= pos.row < self.rows and 0 <= pos.col < self.cols):
+            raise IndexError("Position out of bounds")
+        return 1 << (pos.row * self.stride + pos.col)
+
+    def get(self, pos: Position) -> bool:
+        return bool(self.bits & self._bit(pos))
+
+    def set(self, pos: Position, value: bool) -> None:
+        if value:
+            self.bits |= self._bit(pos)
+        else:
+            self.bits &= ~self._bit(pos)
+
+    def count(self) -> int:
+        return self.bits.bit_count()
+
+    def shifted(self, direction: PosDelta) -> "BitBoard":
+        """Cell (r, c) of the result holds cell (r + d_row, c + d_col), outside is off."""
+        offset = direction.d_row * self.stride + direction.d_col
+        return self._with_bits(self.bits >> offset if offset >= 0 else self.bits << -offset)
+
+    def neighbor_counts(self, directions: Iterable[PosDelta] = FULL_GRID) -> "BitCounter":
+        counter = BitCounter(self)
+        for direction in directions:
+            counter.add(self.shifted(direction))
+        return counter
+
+    def positions(self) -> Iterator[Position]:
+        bits = self.bits
+        while bits:
+            low = bits & -bits
+            row, col = divmod(low.bit_length() - 1, self.stride)
+            yield Position(row, col)
+            bits ^= low
+
+    def __and__(self, other: "BitBoard") -> "BitBoard":
+        return self._with_bits(self.bits & other.bits)
+
+    def __or__(self, other: "BitBoard") -> "BitBoard":
+        return self._with_bits(self.bits | other.bits)
+
+    def __xor__(self, other: "BitBoard") -> "BitBoard":
+        return self._with_bits(self.bits ^ other.bits)
+
+    def __invert__(self) -> "BitBoard":
+        return self._with_bits(self.bits ^ self.cells_mask)
+
+    def __bool__(self) -> bool:
+        return self.bits != 0
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, BitBoard):
+            return NotImplemented
+        return (self.rows, self.cols, self.bits) == (other.rows, other.cols, other.bits)
+
+    def to_string(self, on: str = "#", off: str = ".") -> str:
+        lines = []
+        for r in range(self.rows):
+            row_bits = (self.bits >> (r * self.stride)) & ((1 << self.cols) - 1)
+            lines.append("".join(on if row_bits >> c & 1 else off for c in range(self.cols)))
+        return "\n".join(lines) + "\n"
+
+    def __repr__(self) -> str:
+        return f"BitBoard(rows={self.rows}, cols={self.cols}, count={self.count()})"
+
+
+class BitCounter:
+    """Small per-cell counters over a board shape, bit-sliced into one board per bit."""
+
+    def __init__(self, shape: BitBoard) -> None:
+        self._shape = shape._with_bits(0)
+        self.planes: list[int] = []
+
+    def add(self, board: BitBoard) -> None:
+        carry = board.bits
+        for i, plane in enumerate(self.planes):
+            if not carry:
+                return
+            self.planes[i], carry = plane ^ carry, plane & carry
+        if carry:
+            self.planes.append(carry)
+
+    def less_than(self, limit: int) -> BitBoard:
+        """Cells whose count is below limit, compared from the most significant plane down."""
+        cells = self._shape.cells_mask
+        if limit <= 0:
+            return self._shape._with_bits(0)
+        if limit >= 1 << len(self.planes):
+            return self._shape._with_bits(cells)
+
+        less, equal = 0, cells
+        for i in reversed(range(len(self.planes))):
+            plane = self.planes[i]
+            if limit >> i & 1:
+                less |= equal & ~plane
+                equal &= plane
+            else:
+                equal &= ~plane
+        return self._shape._with_bits(less)
+
+    def at_least(self, limit: int) -> BitBoard:
+        return ~self.less_than(limit)
+
+
+def _repeat_rows(rows: int, stride: int) -> int:
+    # Bit 0 of every row: 1 + 2^stride + 2^(2 * stride) + ...
+    if rows == 0:
+        return 0
+    return ((1 << (rows * stride)) - 1) // ((1 << stride) - 1)
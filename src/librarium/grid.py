@@ -1,6 +1,21 @@
+import importlib
+from array import array
 from collections import deque
+from collections.abc import Callable, Generator, Iterable, Iterator, MutableSequence
+from functools import cache
+from importlib.util import find_spec
 from io import StringIO
-from typing import Callable, Generator, Iterable, Iterator, NamedTuple, Self, TypeVar
+from itertools import product
+from typing import Any, NamedTuple, Self, TypeVar
+
+# NumPy is optional (the `numpy` extra), grids asking for it without it keep the Python storage
+HAS_NUMPY = find_spec("numpy") is not None
+
+
+@cache
+def _numpy() -> Any:
+    # Imported by the first NumPy grid only, the import alone costs more than most solutions
+    return importlib.import_module("numpy")
 
 
 class Position(NamedTuple):
@@ -37,20 +52,138 @@ FULL_GRID = (UP, UP_RIGHT, RIGHT, DOWN_RIGHT, DOWN, DOWN_LEFT, LEFT, UP_LEFT)
 T = TypeVar("T")
 
 
+UNREACHED = -1
+
+
+class Traversal(NamedTuple):
+    """Result of an index-based traversal, arrays are indexed by flat cell index."""
+
+    distances: array  # Steps (or 0-1 cost) from the nearest source, UNREACHED if not reached
+    parents: array  # Cell the traversal came from, UNREACHED for sources and unreached cells
+    order: array  # Cells in the order they were visited
+    found: int | None  # First visited cell matching the target predicate
+
+    def path_to(self, idx: int) -> list[int]:
+        """Cells from a source to idx, both included."""
+        if self.distances[idx] == UNREACHED:
+            raise ValueError(f"Cell {idx} was not reached.")
+        path = [idx]
+        while self.parents[idx] != UNREACHED:
+            idx = self.parents[idx]
+            path.append(idx)
+        path.reverse()
+        return path
+
+
+class NeighborTable(NamedTuple):
+    """
+    CSR layout: neighbor indices of the cell at flat index idx are
+    targets[offsets[idx]:offsets[idx + 1]]. Cached on the grid, must not be modified.
+    """
+
+    offsets: array
+    targets: array
+
+    def of(self, idx: int) -> memoryview:
+        # A memoryview slice does not copy the indices
+        return memoryview(self.targets)[self.offsets[idx] : self.offsets[idx + 1]]
+
+
+def _index_typecode(bound: int) -> str:
+    # Signed 32-bit entries halve the table size while every value fits, up to the bound
+    return "i" if bound < 2**31 else "q"
+
+
+def _build_neighbor_table(rows: int, cols: int, directions: tuple[PosDelta, ...]) -> NeighborTable:
+    # Only the shape decides neighbors. Rows with the same in-bounds directions
+    # (all but the edge rows) share one template of row-relative indices,
+    # shifted by the row start
+    # Targets are cell indices, offsets count neighbors, up to one per direction and cell
+    size = rows * cols
+    offsets = array(_index_typecode(len(directions) * size), [0])
+    targets = array(_index_typecode(size))
+    templates: dict[tuple[PosDelta, ...], tuple[list[int], list[int]]] = {}
+    for row in range(rows):
+        row_dirs = tuple(d for d in directions if 0 <= row + d.d_row < rows)
+        if row_dirs not in templates:
+            rel_targets: list[int] = []
+            rel_ends: list[int] = []
+            for col in range(cols):
+                rel_targets.extend(
+                    d_row * cols + col + d_col
+                    for d_row, d_col in row_dirs
+                    if 0 <= col + d_col < cols
+                )
+                rel_ends.append(len(rel_targets))
+            templates[row_dirs] = rel_targets, rel_ends
+        rel_targets, rel_ends = templates[row_dirs]
+        row_start, targets_start = row * cols, len(targets)
+        targets.extend([row_start + t for t in rel_targets])
+        offsets.extend([targets_start + end for end in rel_ends])
+    return NeighborTable(offsets, targets)
+
+
+def _numpy_dtype(typecode: str | None, default_value: Any) -> Any:
+    # array.array typecodes are NumPy dtype codes too, except for characters. Without one
+    # the dtype follows a bool, int or float default value, so sums and comparisons run
+    # in C; anything else stays object references like in a list, a string dtype truncates
+    if typecode is not None:
+        return "U1" if typecode == "w" else typecode
+    for value_type, dtype in ((bool, "?"), (int, "q"), (float, "d")):
+        if type(default_value) is value_type:
+            return dtype
+    return object
+
+
+def _typed_values[V](typecode: str, values: Iterable[V], repeat: int = 1) -> MutableSequence[V]:
+    # array.array of the typecode, V are the ints, floats or characters it holds
+    typed: array[Any] = array(typecode)
+    typed.extend(values)
+    return typed * repeat
+
+
 class Grid[T]:
-    def __init__(self, *, rows: int, cols: int, default_value: T | Callable[[], T]) -> None:
+    """
+    Values are kept row by row in one flat sequence, positions are computed when iterating.
+    With a typecode the sequence is an array.array of it (e.g. "q" for ints, "w" for
+    single characters), otherwise a list of references. With use_numpy and NumPy installed
+    it is a flat ndarray instead, and whole-grid operations (convolve, masks) are vectorized.
+    Without a typecode the dtype follows the default value: int64, float64 or bool for those,
+    object references for anything else.
+    """
+
+    def __init__(
+        self,
+        *,
+        rows: int,
+        cols: int,
+        default_value: T | Callable[[], T],
+        typecode: str | None = None,
+        use_numpy: bool = False,
+    ) -> None:
         self.rows = rows
         self.cols = cols
-        self._grid: list[tuple[Position, T]] = self._prepare_grid_base(default_value)
-        self._grid_len = len(self._grid)
-
-    def _prepare_grid_base(self, default_value: T | Callable[[], T]) -> list[tuple[Position, T]]:
-        def _make_value() -> T:
+        self.typecode = typecode
+        self.uses_numpy = use_numpy and HAS_NUMPY
+        self._values: Any = self._prepare_grid_base(default_value)
+        self._grid_len = len(self._values)
+        # Per direction set, built on first use and freed with the grid
+        self._neighbor_tables: dict[tuple[PosDelta, ...], NeighborTable] = {}
+
+    def _prepare_grid_base(self, default_value: T | Callable[[], T]) -> Any:
+        size = self.rows * self.cols
+        if self.uses_numpy:
             if isinstance(default_value, Callable):
-                return default_value()
-            return default_value
-
-        return [(self.pos_from_idx(i), _make_value()) for i in range(self.rows * self.cols)]
+                raise TypeError("NumPy grids need a plain default value, not a factory.")
+            dtype = _numpy_dtype(self.typecode, default_value)
+            return _numpy().full(size, default_value, dtype=dtype)
+        if self.typecode is not None:
+            if isinstance(default_value, Callable):
+                raise TypeError("Typed grids need a plain default value, not a factory.")
+            return _typed_values(self.typecode, [default_value], repeat=size)
+        if isinstance(default_value, Callable):
+            return [default_value() for _ in range(size)]
+        return [default_value] * size
 
     def valid_pos(self, pos: Position) -> bool:
         return 0 <= pos.row < self.rows and 0 <= pos.col < self.cols
@@ -70,57 +203,91 @@ class Grid[T]:
         return Position(row, col)
 
     def get(self, pos: Position) -> T:
-        _, val = self._grid[self.to_idx(pos)]
-        return val
+        # Bounds are checked inline, get and set are the hottest grid calls
+        row, col = pos
+        if not (0 <= row < self.rows and 0 <= col < self.cols):
+            raise IndexError("Position out of bounds")
+        return self._values[row * self.cols + col]
 
     def set(self, pos: Position, value: T) -> None:
-        self._grid[self.to_idx(pos)] = (pos, value)
+        row, col = pos
+        if not (0 <= row < self.rows and 0 <= col < self.cols):
+            raise IndexError("Position out of bounds")
+        self._values[row * self.cols + col] = value
+
+    def get_idx(self, idx: int) -> T:
+        """Value at a flat row-major index, as found in neighbor tables. Not bounds checked."""
+        return self._values[idx]
+
+    def set_idx(self, idx: int, value: T) -> None:
+        self._values[idx] = value
+
+    def neighbor_table(self, directions: Iterable[PosDelta] = GRID_DIRS) -> NeighborTable:
+        """
+        Neighbor indices of every cell, built on first use and kept on the grid. Hot loops
+        can walk `for j in range(offsets[i], offsets[i + 1])` over plain ints.
+        """
+        directions = tuple(directions)
+        table = self._neighbor_tables.get(directions)
+        if table is None:
+            table = _build_neighbor_table(self.rows, self.cols, directions)
+            self._neighbor_tables[directions] = table
+        return table
+
+    def neighbors_idx(self, idx: int, directions: Iterable[PosDelta] = GRID_DIRS) -> memoryview:
+        """Flat indices of the neighbors of the cell at flat index idx."""
+        return self.neighbor_table(directions).of(idx)
 
     def neighbors(
         self, pos: Position, directions: Iterable[PosDelta] = GRID_DIRS
-    ) -> Generator[Position, None, None]:
+    ) -> Generator[Position]:
+        rows, cols = self.rows, self.cols
         for d_row, d_col in directions:
-            neighbor = Position(pos.row + d_row, pos.col + d_col)
-            if self.valid_pos(neighbor):
-                yield neighbor
+            row, col = pos.row + d_row, pos.col + d_col
+            if 0 <= row < rows and 0 <= col < cols:
+                yield Position(row, col)
 
     def neighbors_with_values(
         self, pos: Position, directions: Iterable[PosDelta] = GRID_DIRS
-    ) -> Generator[tuple[Position, T], None, None]:
+    ) -> Generator[tuple[Position, T]]:
+        rows, cols, values = self.rows, self.cols, self._values
         for d_row, d_col in directions:
-            neighbor = Position(pos.row + d_row, pos.col + d_col)
-            if self.valid_pos(neighbor):
-                yield (neighbor, self.get(neighbor))
+            row, col = pos.row + d_row, pos.col + d_col
+            if 0 <= row < rows and 0 <= col < cols:
+                yield (Position(row, col), values[row * cols + col])
 
     def neigh_filter(
         self,
         pos: Position,
         predicate: Callable[[T], bool],
         directions: Iterable[PosDelta] = GRID_DIRS,
-    ) -> Generator[Position, None, None]:
+    ) -> Generator[Position]:
+        rows, cols, values = self.rows, self.cols, self._values
         for d_row, d_col in directions:
-            neighbor = Position(pos.row + d_row, pos.col + d_col)
-            if self.valid_pos(neighbor) and predicate(self.get(neighbor)):
-                yield neighbor
+            row, col = pos.row + d_row, pos.col + d_col
+            if 0 <= row < rows and 0 <= col < cols and predicate(values[row * cols + col]):
+                yield Position(row, col)
 
     def neigh_values(
         self, pos: Position, directions: Iterable[PosDelta] = GRID_DIRS
-    ) -> Generator[T, None, None]:
+    ) -> Generator[T]:
+        rows, cols, values = self.rows, self.cols, self._values
         for d_row, d_col in directions:
-            neighbor = Position(pos.row + d_row, pos.col + d_col)
-            if self.valid_pos(neighbor):
-                yield self.get(neighbor)
+            row, col = pos.row + d_row, pos.col + d_col
+            if 0 <= row < rows and 0 <= col < cols:
+                yield values[row * cols + col]
 
     def neigh_values_filter(
         self,
         pos: Position,
         predicate: Callable[[T], bool],
         directions: Iterable[PosDelta] = GRID_DIRS,
-    ) -> Generator[T, None, None]:
+    ) -> Generator[T]:
+        rows, cols, values = self.rows, self.cols, self._values
         for d_row, d_col in directions:
-            neighbor = Position(pos.row + d_row, pos.col + d_col)
-            if self.valid_pos(neighbor):
-                val = self.get(neighbor)
+            row, col = pos.row + d_row, pos.col + d_col
+            if 0 <= row < rows and 0 <= col < cols:
+                val = values[row * cols + col]
                 if predicate(val):
                     yield val
 
@@ -129,48 +296,152 @@ class Grid[T]:
         pos: Position,
         predicate: Callable[[T], bool],
         directions: Iterable[PosDelta] = GRID_DIRS,
-    ) -> Generator[tuple[Position, T], None, None]:
+    ) -> Generator[tuple[Position, T]]:
+        rows, cols, values = self.rows, self.cols, self._values
         for d_row, d_col in directions:
-            neighbor = Position(pos.row + d_row, pos.col + d_col)
-            if self.valid_pos(neighbor):
-                val = self.get(neighbor)
+            row, col = pos.row + d_row, pos.col + d_col
+            if 0 <= row < rows and 0 <= col < cols:
+                val = values[row * cols + col]
                 if predicate(val):
-                    yield (neighbor, val)
+                    yield (Position(row, col), val)
 
     @classmethod
-    def from_values(cls, values: list[list[T]], default_value: T) -> Self:
+    def from_values(
+        cls,
+        values: list[list[T]],
+        default_value: T,
+        typecode: str | None = None,
+        use_numpy: bool = False,
+    ) -> Self:
         rows = len(values)
         cols = len(values[0]) if rows > 0 else 0
-        grid = cls(rows=rows, cols=cols, default_value=default_value)
+        grid = cls(
+            rows=rows,
+            cols=cols,
+            default_value=default_value,
+            typecode=typecode,
+            use_numpy=use_numpy,
+        )
+        if grid.uses_numpy:
+            if any(len(row) != cols for row in values):
+                raise ValueError("All rows must have the same length.")
+            # One bulk conversion instead of a copy per row
+            grid._values[:] = _numpy().asarray(values, dtype=grid._values.dtype).reshape(-1)
+            return grid
 
         for r in range(rows):
-            for c in range(cols):
-                grid.set(Position(r, c), values[r][c])
+            if len(values[r]) != cols:
+                raise ValueError("All rows must have the same length.")
+            grid._values[r * cols : (r + 1) * cols] = (
+                _typed_values(typecode, values[r]) if typecode is not None else values[r]
+            )
+
+        return grid
 
+    def _positions(self) -> Iterator[Position]:
+        # Row-major, in the order of the flat values
+        return map(Position._make, product(range(self.rows), range(self.cols)))
+
+    @property
+    def values_array(self) -> Any:
+        """2-D ndarray view of a NumPy-backed grid, writes to it change the grid."""
+        if not self.uses_numpy:
+            raise TypeError("Grid is not backed by NumPy.")
+        return self._values.reshape(self.rows, self.cols)
+
+    def _with_values(self, values: Any) -> "Grid[Any]":
+        # Same shape and backend, values are a flat sequence of the matching storage
+        grid = Grid(rows=self.rows, cols=self.cols, default_value=0, use_numpy=self.uses_numpy)
+        grid._values = values
+        # Same shape, so the neighbor tables built so far apply as they are
+        grid._neighbor_tables = self._neighbor_tables
         return grid
 
+    def convolve(
+        self, offsets: Iterable[PosDelta], weights: Iterable[float] | None = None
+    ) -> "Grid[Any]":
+        """
+        Grid of weighted sums of the values at the offsets from every cell,
+        values outside of the grid count as zero. Booleans are summed as 0 and 1.
+        """
+        offsets = list(offsets)
+        weights = [1] * len(offsets) if weights is None else list(weights)
+        if len(weights) != len(offsets):
+            raise ValueError("Every offset needs a weight.")
+        rows, cols = self.rows, self.cols
+
+        if self.uses_numpy:
+            np = _numpy()
+            src = self.values_array
+            out = np.zeros((rows, cols), dtype=np.result_type(src.dtype, np.int64, *weights))
+            for (d_row, d_col), weight in zip(offsets, weights, strict=True):
+                # out[r, c] += weight * src[r + d_row, c + d_col] over the overlapping window
+                r0, r1 = max(0, -d_row), min(rows, rows - d_row)
+                c0, c1 = max(0, -d_col), min(cols, cols - d_col)
+                if r0 < r1 and c0 < c1:
+                    window = src[r0 + d_row : r1 + d_row, c0 + d_col : c1 + d_col]
+                    out[r0:r1, c0:c1] += weight * window
+            return self._with_values(out.reshape(-1))
+
+        values = self._values
+        sums = [0] * (rows * cols)
+        for (d_row, d_col), weight in zip(offsets, weights, strict=True):
+            for r in range(max(0, -d_row), min(rows, rows - d_row)):
+                offset = r * cols
+                src_offset = (r + d_row) * cols + d_col
+                for c in range(max(0, -d_col), min(cols, cols - d_col)):
+                    sums[offset + c] += weight * values[src_offset + c]
+        return self._with_values(sums)
+
+    def neighbor_sum(self, directions: Iterable[PosDelta] = GRID_DIRS) -> "Grid[Any]":
+        return self.convolve(directions)
+
+    def mask(self, predicate: Callable[[Any], Any], vectorized: bool = False) -> "Grid[bool]":
+        """
+        Grid of predicate results, called once per cell. With vectorized, NumPy-backed grids
+        call it once on the whole value array instead (comparisons such as `lambda v: v < 4`
+        vectorize), and it must return an array of the grid shape.
+        """
+        if self.uses_numpy:
+            np = _numpy()
+            if vectorized:
+                result = predicate(self._values)
+                if not (isinstance(result, np.ndarray) and result.shape == self._values.shape):
+                    raise ValueError("Vectorized predicate must return an array of the grid shape.")
+            else:
+                result = np.fromiter(map(predicate, self._values), dtype=bool, count=self._grid_len)
+            return self._with_values(result.astype(bool, copy=False))
+        return self._with_values([bool(predicate(value)) for value in self._values])
+
+    def select(self, mask: "Grid[bool]") -> Generator[tuple[Position, T]]:
+        """Cells where the mask of the same shape is set, in row-major order."""
+        if (mask.rows, mask.cols) != (self.rows, self.cols):
+            raise ValueError("Mask must have the shape of the grid.")
+        values, cols = self._values, self.cols
+        if mask.uses_numpy:
+            indices: Iterable[int] = _numpy().flatnonzero(mask._values).tolist()
+        else:
+            indices = (idx for idx, selected in enumerate(mask._values) if selected)
+        for idx in indices:
+            row, col = divmod(idx, cols)
+            yield (Position(row, col), values[idx])
+
     def __iter__(self) -> Iterator[tuple[Position, T]]:
-        return iter(self._grid)
+        return zip(self._positions(), self._values, strict=True)
 
-    def filter(self, predicate: Callable[[T], bool]) -> Generator[tuple[Position, T], None, None]:
+    def filter(self, predicate: Callable[[T], bool]) -> Generator[tuple[Position, T]]:
+        if self.uses_numpy:
+            yield from self.select(self.mask(predicate))
+            return
         for position, value in self:
             if predicate(value):
                 yield (position, value)
 
     def iter_positions(self) -> Iterable[Position]:
-        def _generator():
-            for i in range(self._grid_len):
-                position, _ = self._grid[i]
-                yield position
-
-        return _generator()
+        return self._positions()
 
     def iter_values(self) -> Iterable[T]:
-        def _generator():
-            for _, value in self:
-                yield value
-
-        return _generator()
+        return iter(self._values)
 
     def to_string(
         self,
@@ -190,6 +461,153 @@ class Grid[T]:
 
         return buf.getvalue()
 
+    def _start_traversal(self, sources: Iterable[int]) -> tuple[array, array, bytearray, list[int]]:
+        size = self._grid_len
+        distances = array("q", [UNREACHED]) * size
+        parents = array("q", [UNREACHED]) * size
+        visited = bytearray(size)
+        starts = []
+        for src in sources:
+            if not 0 <= src < size:
+                raise IndexError("Source index out of bounds")
+            if distances[src] == UNREACHED:
+                distances[src] = 0
+                starts.append(src)
+        return distances, parents, visited, starts
+
+    def bfs_idx(
+        self,
+        sources: Iterable[int],
+        passable: Callable[[T], bool] | None = None,
+        directions: Iterable[PosDelta] = GRID_DIRS,
+        target: Callable[[int], bool] | None = None,
+    ) -> Traversal:
+        """
+        Multi-source BFS over flat indices, distances are the fewest steps from any source.
+        Cells whose value fails passable are never entered. Stops at the first dequeued
+        cell index matching target, which is then one of the nearest ones.
+        """
+        offsets, targets = self.neighbor_table(directions)
+        values = self._values
+        distances, parents, visited, starts = self._start_traversal(sources)
+        # Cells are marked when queued, so each one is queued at most once
+        queue = array("q", [0]) * self._grid_len
+        tail = 0
+        for src in starts:
+            visited[src] = 1
+            queue[tail] = src
+            tail += 1
+
+        head = 0
+        found = None
+        while head < tail:
+            idx = queue[head]
+            head += 1
+            if target is not None and target(idx):
+                found = idx
+                break
+            next_dist = distances[idx] + 1
+            for j in range(offsets[idx], offsets[idx + 1]):
+                n_idx = targets[j]
+                if visited[n_idx] or (passable is not None and not passable(values[n_idx])):
+                    continue
+                visited[n_idx] = 1
+                distances[n_idx] = next_dist
+                parents[n_idx] = idx
+                queue[tail] = n_idx
+                tail += 1
+        return Traversal(distances, parents, queue[:head], found)
+
+    def dfs_idx(
+        self,
+        sources: Iterable[int],
+        passable: Callable[[T], bool] | None = None,
+        directions: Iterable[PosDelta] = GRID_DIRS,
+        target: Callable[[int], bool] | None = None,
+    ) -> Traversal:
+        """
+        Like bfs_idx with a stack: every reachable cell is visited once, but distances are
+        depths in the traversal tree rather than shortest paths.
+        """
+        offsets, targets = self.neighbor_table(directions)
+        values = self._values
+        distances, parents, visited, starts = self._start_traversal(sources)
+        stack = array("q", [0]) * self._grid_len
+        top = 0
+        for src in reversed(starts):
+            visited[src] = 1
+            stack[top] = src
+            top += 1
+
+        order = array("q")
+        found = None
+        while top:
+            top -= 1
+            idx = stack[top]
+            order.append(idx)
+            if target is not None and target(idx):
+                found = idx
+                break
+            next_dist = distances[idx] + 1
+            for j in range(offsets[idx], offsets[idx + 1]):
+                n_idx = targets[j]
+                if visited[n_idx] or (passable is not None and not passable(values[n_idx])):
+                    continue
+                visited[n_idx] = 1
+                distances[n_idx] = next_dist
+                parents[n_idx] = idx
+                stack[top] = n_idx
+                top += 1
+        return Traversal(distances, parents, order, found)
+
+    def zero_one_bfs_idx(
+        self,
+        sources: Iterable[int],
+        weight: Callable[[int, int], int | None],
+        directions: Iterable[PosDelta] = GRID_DIRS,
+        target: Callable[[int], bool] | None = None,
+    ) -> Traversal:
+        """
+        Cheapest paths when every step costs 0 or 1: weight(from_idx, to_idx) gives the cost,
+        None for a blocked step. Zero cost steps go to the front of the deque, so cells
+        are settled in cost order and the first settled target is a cheapest one.
+        """
+        offsets, targets = self.neighbor_table(directions)
+        distances, parents, settled, starts = self._start_traversal(sources)
+        queue = deque(starts)
+
+        order = array("q")
+        found = None
+        while queue:
+            idx = queue.popleft()
+            if settled[idx]:
+                # Queued again after a cheaper path was found
+                continue
+            settled[idx] = 1
+            order.append(idx)
+            if target is not None and target(idx):
+                found = idx
+                break
+            dist = distances[idx]
+            for j in range(offsets[idx], offsets[idx + 1]):
+                n_idx = targets[j]
+                if settled[n_idx]:
+                    continue
+                step = weight(idx, n_idx)
+                if step is None:
+                    continue
+                if step not in (0, 1):
+                    raise ValueError(f"0-1 BFS step weights must be 0 or 1, got {step}.")
+                n_dist = dist + step
+                if distances[n_idx] == UNREACHED or n_dist < distances[n_idx]:
+                    distances[n_idx] = n_dist
+                    parents[n_idx] = idx
+                    if step:
+                        queue.append(n_idx)
+                    else:
+                        queue.appendleft(n_idx)
+        return Traversal(distances, parents, order, found)
+
     def bfs(
         self,
         start_queue: list[tuple[Position, T]],
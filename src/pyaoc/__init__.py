@@ -1,6 +1,3 @@
-from pyaoc import y_2020, y_2025
-
-__all__ = [
-    "y_2020",
-    "y_2025",
-]
+# Year packages are not imported here: day modules are discovered and imported lazily
+# by SOLUTION_REGISTRY when one of their keys is requested
+__all__ = []
@@ -0,0 +1,175 @@
+import json
+import statistics
+import subprocess
+from math import erfc, sqrt
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from pyaoc.bench import KeyBench
+from pyaoc.config import BASELINES_FILE, LATEST_BASELINE, PROJECT_ROOT_DIR
+from pyaoc.keys import SolKey
+
+
+def git_revision(repo_dir: Path = PROJECT_ROOT_DIR) -> str:
+    try:
+        revision = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=repo_dir,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+        status = subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no"],
+            cwd=repo_dir,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+    return f"{revision}-dirty" if status else revision
+
+
+def baseline_key(key: SolKey, sample: bool) -> str:
+    year, day, part = key
+    return f"{year}/{day:02}/{part}/{'sample' if sample else 'actual'}"
+
+
+def mann_whitney_greater(sample: list[int], reference: list[int]) -> float:
+    """
+    One-sided Mann-Whitney U test, returns the p-value for `sample` values being
+    stochastically greater than `reference` ones. Uses the normal approximation
+    with tie and continuity corrections, which is rough but fine for a handful of repeats.
+    """
+    n1, n2 = len(sample), len(reference)
+    if n1 == 0 or n2 == 0:
+        raise ValueError("Both samples must be non-empty.")
+
+    combined = sorted([(v, True) for v in sample] + [(v, False) for v in reference])
+    n = n1 + n2
+
+    # Average ranks for ties, ranks start from 1
+    rank_sum, tie_term = 0.0, 0
+    i = 0
+    while i < n:
+        j = i
+        while j + 1 < n and combined[j + 1][0] == combined[i][0]:
+            j += 1
+        ties = j - i + 1
+        avg_rank = (i + j) / 2 + 1
+        rank_sum += avg_rank * sum(1 for _, is_sample in combined[i : j + 1] if is_sample)
+        tie_term += ties**3 - ties
+        i = j + 1
+
+    u1 = rank_sum - n1 * (n1 + 1) / 2
+    mu = n1 * n2 / 2
+    variance = n1 * n2 / 12 * ((n + 1) - tie_term / (n * (n - 1))) if n > 1 else 0.0
+    if variance <= 0:
+        return 1.0 if u1 <= mu else 0.0
+
+    z = (u1 - mu - 0.5) / sqrt(variance)
+    return 0.5 * erfc(z / sqrt(2))
+
+
+class Regression(NamedTuple):
+    key: SolKey
+    baseline_median_ns: float
+    current_median_ns: float
+    p_value: float
+
+    @property
+    def slowdown(self) -> float:
+        return self.current_median_ns / self.baseline_median_ns - 1
+
+
+def _total_samples(key_bench: KeyBench) -> list[int]:
+    return [p + s for p, s in zip(key_bench.parse_samples, key_bench.solve_samples, strict=True)]
+
+
+class BaselineStore:
+    """
+    Bench samples persisted per git revision and solution key:
+    {revision: {"2025/04/2/actual": {"parse_samples_ns": [...], "solve_samples_ns": [...]}}}
+    Revisions are kept in the order they were saved, the last one being the latest.
+    """
+
+    def __init__(self, path: Path = BASELINES_FILE) -> None:
+        self.path = path
+        self._data: dict[str, dict[str, dict[str, Any]]] = (
+            json.loads(path.read_text()) if path.exists() else {}
+        )
+
+    def revisions(self) -> list[str]:
+        return list(self._data)
+
+    def resolve_revision(self, revision: str, current: str) -> str | None:
+        if revision != LATEST_BASELINE:
+            return revision if revision in self._data else None
+        previous = [rev for rev in self._data if rev != current]
+        return previous[-1] if previous else None
+
+    def save(self, revision: str, benches: list[KeyBench], sample: bool) -> None:
+        entries = self._data.pop(revision, {})
+        for key_bench in benches:
+            entries[baseline_key(key_bench.key, sample)] = {
+                "solution": key_bench.solution_name,
+                "parse_samples_ns": key_bench.parse_samples,
+                "solve_samples_ns": key_bench.solve_samples,
+            }
+        self._data[revision] = entries
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(json.dumps(self._data, indent=2) + "\n")
+
+    def compare(
+        self,
+        revision: str,
+        benches: list[KeyBench],
+        sample: bool,
+        threshold: float = 0.1,
+        alpha: float = 0.05,
+    ) -> list[Regression]:
+        """
+        A key regresses when its median total (parse + solve) time is more than `threshold`
+        slower than the baseline one and the slowdown is significant at `alpha` level.
+        Keys missing from the baseline are skipped.
+        """
+        entries = self._data.get(revision, {})
+        regressions = []
+        for key_bench in benches:
+            entry = entries.get(baseline_key(key_bench.key, sample))
+            if entry is None:
+                continue
+
+            reference = [
+                p + s
+                for p, s in zip(entry["parse_samples_ns"], entry["solve_samples_ns"], strict=True)
+            ]
+            current = _total_samples(key_bench)
+            base_median, cur_median = statistics.median(reference), statistics.median(current)
+            if cur_median <= base_median * (1 + threshold):
+                continue
+
+            p_value = mann_whitney_greater(current, reference)
+            if p_value < alpha:
+                regressions.append(Regression(key_bench.key, base_median, cur_median, p_value))
+
+        return regressions
+
+
+def print_regressions(revision: str, regressions: list[Regression]) -> None:
+    if not regressions:
+        print(f"No regressions against baseline {revision}.")
+        return
+
+    print(f"Regressions against baseline {revision}:")
+    for regression in regressions:
+        year, day, part = regression.key
+        print(
+            f"    {year} day {day:02} part {part}: "
+            f"{regression.baseline_median_ns / 1_000_000:.3f} ms -> "
+            f"{regression.current_median_ns / 1_000_000:.3f} ms "
+            f"(+{regression.slowdown:.1%}, p={regression.p_value:.4f})"
+        )
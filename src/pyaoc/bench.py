@@ -0,0 +1,157 @@
+import gc
+import json
+import os
+import statistics
+from contextlib import redirect_stdout
+from pathlib import Path
+from time import perf_counter_ns
+from typing import Any, NamedTuple
+
+from pyaoc.input import map_input_file
+from pyaoc.keys import SolKey, short_key
+from pyaoc.solution import SOLUTION_REGISTRY
+
+
+class BenchStats(NamedTuple):
+    min_ns: int
+    median_ns: float
+    p95_ns: float
+    stddev_ns: float
+
+    @classmethod
+    def from_samples(cls, samples: list[int]) -> "BenchStats":
+        if not samples:
+            raise ValueError("Cannot compute stats without samples.")
+
+        if len(samples) > 1:
+            p95 = statistics.quantiles(samples, n=20, method="inclusive")[-1]
+            stddev = statistics.stdev(samples)
+        else:
+            p95, stddev = float(samples[0]), 0.0
+
+        return cls(
+            min_ns=min(samples),
+            median_ns=statistics.median(samples),
+            p95_ns=p95,
+            stddev_ns=stddev,
+        )
+
+
+class KeyBench(NamedTuple):
+    key: SolKey
+    solution_name: str
+    result: int
+    parse_samples: list[int]
+    solve_samples: list[int]
+
+    @property
+    def parse(self) -> BenchStats:
+        return BenchStats.from_samples(self.parse_samples)
+
+    @property
+    def solve(self) -> BenchStats:
+        return BenchStats.from_samples(self.solve_samples)
+
+    def to_json(self) -> dict[str, Any]:
+        year, day, part = self.key
+        return {
+            "year": year,
+            "day": day,
+            "part": part,
+            "solution": self.solution_name,
+            "result": self.result,
+            "parse": {**self.parse._asdict(), "samples_ns": self.parse_samples},
+            "solve": {**self.solve._asdict(), "samples_ns": self.solve_samples},
+        }
+
+
+class Bencher:
+    """
+    Unlike Solver, every repeat constructs a fresh instance straight from the solution
+    class: the registry parse cache is bypassed, so parse time is measured every time.
+    Input is read once, outside of the measurements, and solution prints are discarded.
+    """
+
+    def __init__(
+        self,
+        to_solve: list[SolKey],
+        with_sample: bool = True,
+        warmup: int = 1,
+        repeat: int = 5,
+    ) -> None:
+        if warmup < 0:
+            raise ValueError("Warmup runs count must be non-negative.")
+        if repeat < 1:
+            raise ValueError("Repeat count must be a positive integer.")
+
+        self._to_solve = to_solve
+        self._with_sample = with_sample
+        self._warmup = warmup
+        self._repeat = repeat
+        self.registry = SOLUTION_REGISTRY
+
+    def bench(self, key: SolKey) -> KeyBench:
+        solution_cls = self.registry.get_solution(key)
+        input_lines = map_input_file(solution_cls.YEAR, solution_cls.DAY, self._with_sample)
+
+        parse_samples: list[int] = []
+        solve_samples: list[int] = []
+        result = 0
+
+        with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+            for i in range(self._warmup + self._repeat):
+                gc.collect()
+                start = perf_counter_ns()
+                solution_instance = solution_cls(input_lines, self._with_sample)
+                solution_instance.parse()
+                parsed = perf_counter_ns()
+                result = solution_instance.solve()
+                solved = perf_counter_ns()
+
+                if i < self._warmup:
+                    continue
+                parse_samples.append(parsed - start)
+                solve_samples.append(solved - parsed)
+
+        return KeyBench(
+            key=key,
+            solution_name=solution_cls.__name__,
+            result=result,
+            parse_samples=parse_samples,
+            solve_samples=solve_samples,
+        )
+
+    def bench_all(self) -> list[KeyBench]:
+        benches = []
+        for key in self._to_solve:
+            if key not in self.registry:
+                continue
+            key_bench = self.bench(key)
+            print_key_bench(key_bench)
+            benches.append(key_bench)
+        return benches
+
+    def to_json(self, benches: list[KeyBench]) -> dict[str, Any]:
+        return {
+            "with_sample": self._with_sample,
+            "warmup": self._warmup,
+            "repeat": self._repeat,
+            "results": [key_bench.to_json() for key_bench in benches],
+        }
+
+    def export_json(self, benches: list[KeyBench], path: Path) -> None:
+        path.write_text(json.dumps(self.to_json(benches), indent=2) + "\n")
+
+
+def _fmt_ms(ns: float) -> str:
+    return f"{ns / 1_000_000:10.3f}"
+
+
+def print_key_bench(key_bench: KeyBench) -> None:
+    print(f"{short_key(key_bench.key)} {key_bench.solution_name} -> {key_bench.result}")
+    print(f"    {'phase':<6} {'min ms':>10} {'median ms':>10} {'p95 ms':>10} {'stddev ms':>10}")
+    for phase, stats in (("parse", key_bench.parse), ("solve", key_bench.solve)):
+        print(
+            f"    {phase:<6} {_fmt_ms(stats.min_ns)} {_fmt_ms(stats.median_ns)} "
+            f"{_fmt_ms(stats.p95_ns)} {_fmt_ms(stats.stddev_ns)}"
+        )
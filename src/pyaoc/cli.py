@@ -1,52 +1,493 @@
+import sys
 from itertools import product
+from pathlib import Path
 
 import click
 
-from pyaoc.solution import SOLUTION_REGISTRY
-from pyaoc.solver import Solver
+# Subcommands import what they run in their bodies, so `run --daemon` stays a thin client
+from pyaoc.client import DaemonError, solve_on_daemon
+from pyaoc.config import LATEST_BASELINE
+from pyaoc.keys import SolKey
+from pyaoc.reporters import REPORTERS
 
 
-@click.command()
+class _DefaultRunGroup(click.Group):
+    # Keeps `pyaoc -y 2025 -d 3` working: arguments without a subcommand go to `run`
+    def parse_args(self, ctx: click.Context, args: list[str]) -> list[str]:
+        if not args or (args[0] not in self.commands and args[0] != "--help"):
+            args = ["run", *args]
+        return super().parse_args(ctx, args)
+
+
+def _keys_options(func):
+    func = click.option(
+        "--with-sample",
+        "-s",
+        is_flag=True,
+        default=False,
+        help="Whether to run solutions with sample input or actual input.",
+    )(func)
+    func = click.option(
+        "--days",
+        "-d",
+        multiple=True,
+        type=int,
+        help="Days to run solutions for.",
+        default=None,
+    )(func)
+    func = click.option(
+        "--years",
+        "-y",
+        multiple=True,
+        type=int,
+        help="Years to run solutions for.",
+    )(func)
+    return func
+
+
+def _resolve_keys(years: list[int], days: list[int] | None) -> list[SolKey]:
+    if years is None or len(years) == 0:
+        from pyaoc.solution import SOLUTION_REGISTRY
+
+        print("No years specified, running all available years.", file=sys.stderr)
+        return SOLUTION_REGISTRY.all_keys()
+    if days is None or len(days) == 0:
+        return [(year, day, part) for year in years for day in range(1, 26) for part in (1, 2)]
+    return [(year, day, part) for year, day, part in product(years, days, (1, 2))]
+
+
+@click.group(cls=_DefaultRunGroup)
+def cli():
+    pass
+
+
+@cli.command()
+@_keys_options
 @click.option(
-    "--years",
-    "-y",
-    multiple=True,
-    type=int,
-    help="Years to run solutions for.",
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Number of worker processes to solve keys in parallel.",
 )
 @click.option(
-    "--days",
-    "-d",
-    multiple=True,
-    type=int,
-    help="Days to run solutions for.",
+    "--profile",
+    is_flag=True,
+    default=False,
+    help="Profile parse and solve of every key with cProfile, saving .pstats files.",
+)
+@click.option(
+    "--profile-top",
+    type=click.IntRange(min=1),
+    default=20,
+    show_default=True,
+    help="Number of hot spots by cumulative time to print per profiled key.",
+)
+@click.option(
+    "--sample-profile",
+    is_flag=True,
+    default=False,
+    help="Sample stacks from a background thread, saving collapsed stacks for flamegraphs.",
+)
+@click.option(
+    "--sample-rate",
+    type=click.FloatRange(min=0, min_open=True),
+    default=200,
+    show_default=True,
+    help="Stack samples per second taken with --sample-profile.",
+)
+@click.option(
+    "--count-calls",
+    is_flag=True,
+    default=False,
+    help="Count calls and time of librarium primitives (Grid, UnionFind, ...) per key.",
+)
+@click.option(
+    "--memory",
+    is_flag=True,
+    default=False,
+    help="Trace allocations with tracemalloc, reporting peak and top sites per phase.",
+)
+@click.option(
+    "--memory-top",
+    type=click.IntRange(min=1),
+    default=5,
+    show_default=True,
+    help="Number of allocation sites to print per traced phase.",
+)
+@click.option(
+    "--parse-cache",
+    is_flag=True,
+    default=False,
+    help="Reuse parsed inputs stored on disk by solutions opting in to it.",
+)
+@click.option(
+    "--skip-unchanged",
+    is_flag=True,
+    default=False,
+    help="Answer keys whose input and sources are unchanged from stored results.",
+)
+@click.option(
+    "--daemon",
+    is_flag=True,
+    default=False,
+    help="Send the keys to a running `pyaoc serve` daemon instead of solving in process.",
+)
+@click.option(
+    "--timeout",
+    type=click.FloatRange(min=0, min_open=True),
+    default=None,
+    help="Seconds a key may run before it is killed and reported as TIMEOUT.",
+)
+@click.option(
+    "--max-rss",
+    "max_rss_mb",
+    type=click.IntRange(min=1),
     default=None,
+    help="Memory limit per key in MiB (address space), exceeding it reports OOM.",
 )
 @click.option(
-    "--with-sample",
-    "-s",
+    "--phases",
     is_flag=True,
     default=False,
-    help="Whether to run solutions with sample input or actual input.",
+    help="Time the self.phase() sections of solutions and report them per key.",
+)
+@click.option(
+    "--report",
+    type=click.Choice(list(REPORTERS)),
+    default="human",
+    show_default=True,
+    help="Output format: banners, one line per key, or one JSON record per key.",
 )
 def run(
     years: list[int],
     days: list[int] | None = None,
     with_sample: bool = True,
+    jobs: int = 1,
+    profile: bool = False,
+    profile_top: int = 20,
+    sample_profile: bool = False,
+    sample_rate: float = 200,
+    count_calls: bool = False,
+    memory: bool = False,
+    memory_top: int = 5,
+    parse_cache: bool = False,
+    skip_unchanged: bool = False,
+    daemon: bool = False,
+    timeout: float | None = None,
+    max_rss_mb: int | None = None,
+    phases: bool = False,
+    report: str = "human",
 ):
-    print("Running the PyAOC CLI...")
-    print(f"Requested years: {years}")
-    print(f"Requested days: {days}")
-    print(f"With sample input: {with_sample}")
+    reporter = REPORTERS[report](with_sample)
+    if daemon:
+        # The daemon solves keys one by one in its own process, without any of these
+        in_process_only = {
+            "--jobs": jobs != 1,
+            "--profile": profile,
+            "--sample-profile": sample_profile,
+            "--count-calls": count_calls,
+            "--memory": memory,
+            "--parse-cache": parse_cache,
+            "--skip-unchanged": skip_unchanged,
+            "--timeout": timeout is not None,
+            "--max-rss": max_rss_mb is not None,
+            "--phases": phases,
+        }
+        rejected = [option for option, given in in_process_only.items() if given]
+        if rejected:
+            raise click.UsageError(f"--daemon cannot be combined with {', '.join(rejected)}.")
+        # Without years the daemon resolves all keys, so nothing is imported here
+        keys = _resolve_keys(years, days) if years else None
+        try:
+            solve_on_daemon(keys, with_sample, reporter=reporter)
+        except DaemonError as e:
+            raise click.ClickException(str(e)) from e
+        return
 
-    print(f"Available years in registry: {SOLUTION_REGISTRY.all_years()}")
-    if years is None or len(years) == 0:
-        print("No years specified, running all available years.")
-        to_solve = SOLUTION_REGISTRY.all_keys()
-    elif days is None or len(days) == 0:
-        to_solve = [(year, day, part) for year in years for day in range(1, 26) for part in (1, 2)]
-    else:
-        to_solve = [(year, day, part) for year, day, part in product(years, days, (1, 2))]
-
-    solver = Solver(to_solve=to_solve, with_sample=with_sample)
+    from pyaoc.parse_cache import DiskParseCache
+    from pyaoc.probes import CallCountProbe, MemoryProbe, Probe, ProfileProbe, SamplingProbe
+    from pyaoc.results import ResultStore
+    from pyaoc.solution import SOLUTION_REGISTRY
+    from pyaoc.solver import KeyLimits, Solver
+
+    if report == "human":
+        print("Running the PyAOC CLI...")
+        print(f"Requested years: {years}")
+        print(f"Requested days: {days}")
+        print(f"With sample input: {with_sample}")
+        print(f"Worker processes: {jobs}")
+        print(f"Available years in registry: {SOLUTION_REGISTRY.all_years()}")
+
+    to_solve = _resolve_keys(years, days)
+
+    probes: list[Probe] = []
+    if profile:
+        probes.append(ProfileProbe(with_sample, top=profile_top))
+    if sample_profile:
+        probes.append(SamplingProbe(with_sample, rate=sample_rate))
+    if count_calls:
+        probes.append(CallCountProbe())
+    if memory:
+        probes.append(MemoryProbe(top=memory_top))
+
+    limits = None
+    if timeout is not None or max_rss_mb is not None:
+        max_rss = max_rss_mb * 1024 * 1024 if max_rss_mb is not None else None
+        limits = KeyLimits(timeout=timeout, max_rss=max_rss)
+
+    solver = Solver(
+        to_solve=to_solve,
+        with_sample=with_sample,
+        jobs=jobs,
+        probes=probes,
+        disk_cache=DiskParseCache() if parse_cache else None,
+        result_store=ResultStore() if skip_unchanged else None,
+        limits=limits,
+        reporter=reporter,
+        trace_phases=phases,
+    )
     solver.solve_all()
+
+
+@cli.command()
+@_keys_options
+@click.option(
+    "--warmup",
+    "-w",
+    type=click.IntRange(min=0),
+    default=1,
+    show_default=True,
+    help="Untimed runs per key before measuring.",
+)
+@click.option(
+    "--repeat",
+    "-r",
+    type=click.IntRange(min=1),
+    default=5,
+    show_default=True,
+    help="Timed runs per key.",
+)
+@click.option(
+    "--json",
+    "json_path",
+    type=click.Path(dir_okay=False, writable=True, path_type=Path),
+    default=None,
+    help="Export timings and raw samples as JSON to this file.",
+)
+@click.option(
+    "--save-baseline",
+    is_flag=True,
+    default=False,
+    help="Store samples as the baseline for the current git revision.",
+)
+@click.option(
+    "--compare-baseline",
+    "compare_revision",
+    is_flag=False,
+    flag_value=LATEST_BASELINE,
+    default=None,
+    help="Fail on keys slower than the baseline of this revision (latest saved if omitted).",
+)
+@click.option(
+    "--threshold",
+    type=click.FloatRange(min=0),
+    default=0.1,
+    show_default=True,
+    help="Relative median slowdown that counts as a regression.",
+)
+@click.option(
+    "--alpha",
+    type=click.FloatRange(min=0, max=1),
+    default=0.05,
+    show_default=True,
+    help="Significance level of the Mann-Whitney U test on repeat samples.",
+)
+def bench(
+    years: list[int],
+    days: list[int] | None = None,
+    with_sample: bool = True,
+    warmup: int = 1,
+    repeat: int = 5,
+    json_path: Path | None = None,
+    save_baseline: bool = False,
+    compare_revision: str | None = None,
+    threshold: float = 0.1,
+    alpha: float = 0.05,
+):
+    from pyaoc.baseline import BaselineStore, git_revision, print_regressions
+    from pyaoc.bench import Bencher
+
+    print(f"Benchmarking with {warmup} warmup and {repeat} timed runs per key...")
+    print(f"With sample input: {with_sample}")
+    to_solve = _resolve_keys(years, days)
+
+    bencher = Bencher(to_solve=to_solve, with_sample=with_sample, warmup=warmup, repeat=repeat)
+    benches = bencher.bench_all()
+    if json_path is not None:
+        bencher.export_json(benches, json_path)
+        print(f"Results exported to {json_path}")
+
+    if not save_baseline and compare_revision is None:
+        return
+
+    store = BaselineStore()
+    revision = git_revision()
+    regressions = []
+    if compare_revision is not None:
+        baseline_revision = store.resolve_revision(compare_revision, current=revision)
+        if baseline_revision is None:
+            raise click.ClickException(f"No baseline found for revision {compare_revision!r}.")
+        regressions = store.compare(
+            baseline_revision, benches, with_sample, threshold=threshold, alpha=alpha
+        )
+        print_regressions(baseline_revision, regressions)
+
+    if save_baseline:
+        store.save(revision, benches, with_sample)
+        print(f"Baseline saved for revision {revision}")
+
+    if regressions:
+        raise SystemExit(1)
+
+
+@cli.command()
+def serve():
+    from pyaoc.daemon import SolveServer
+
+    try:
+        server = SolveServer()
+    except DaemonError as e:
+        raise click.ClickException(str(e)) from e
+
+    print(f"Serving solve and bench requests on {server.socket_path}...")
+    server.serve_until_shutdown()
+    print("Daemon stopped.")
+
+
+@cli.command()
+@_keys_options
+@click.option(
+    "--interval",
+    type=click.FloatRange(min=0, min_open=True),
+    default=0.5,
+    show_default=True,
+    help="Seconds between polls of sources and inputs.",
+)
+def watch(
+    years: list[int],
+    days: list[int] | None = None,
+    with_sample: bool = True,
+    interval: float = 0.5,
+):
+    from pyaoc.watch import Watcher
+
+    to_solve = _resolve_keys(years, days)
+    try:
+        Watcher(to_solve=to_solve, with_sample=with_sample).watch(interval=interval)
+    except KeyboardInterrupt:
+        print("Stopped watching.")
+
+
+@cli.command()
+@click.option("--year", "-y", type=int, required=True, help="Year of the day to generate.")
+@click.option("--day", "-d", type=int, required=True, help="Day to generate input for.")
+@click.option(
+    "--size",
+    "-n",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Input size in the generator units, overrides --scale.",
+)
+@click.option(
+    "--scale",
+    type=click.FloatRange(min=0, min_open=True),
+    default=1.0,
+    show_default=True,
+    help="Input size as a multiple of a real puzzle input.",
+)
+@click.option("--seed", type=int, default=0, show_default=True, help="Random generator seed.")
+@click.option(
+    "--output",
+    "-o",
+    type=click.Path(dir_okay=False, writable=True, path_type=Path),
+    default=None,
+    help="File to write, defaults to .generated/y_YYYY/d_DD_n<size>_s<seed>.txt.",
+)
+def gen(
+    year: int,
+    day: int,
+    size: int | None = None,
+    scale: float = 1.0,
+    seed: int = 0,
+    output: Path | None = None,
+):
+    from pyaoc.gen import GENERATORS, get_generator, write_input
+
+    if (year, day) not in GENERATORS:
+        available = ", ".join(f"{y}/{d:02}" for y, d in sorted(GENERATORS))
+        raise click.ClickException(f"No generator for {year}/{day:02}, available: {available}.")
+
+    generator = get_generator(year, day)
+    if size is None:
+        size = max(round(generator.puzzle_size * scale), generator.min_size)
+    try:
+        path = write_input(year, day, size, seed=seed, path=output)
+    except ValueError as e:
+        raise click.ClickException(str(e)) from e
+    print(f"Generated {size} {generator.unit} for {year} day {day:02} into {path}")
+
+
+@cli.command()
+@click.option("--years", "-y", multiple=True, type=int, help="Years to scale solutions for.")
+@click.option("--days", "-d", multiple=True, type=int, default=None, help="Days to scale.")
+@click.option(
+    "--size",
+    "-n",
+    "sizes",
+    multiple=True,
+    type=click.IntRange(min=1),
+    help="Input sizes in generator units, defaults to a 16th of a real input doubling up to it.",
+)
+@click.option("--seed", type=int, default=0, show_default=True, help="Random generator seed.")
+@click.option(
+    "--repeat",
+    "-r",
+    type=click.IntRange(min=1),
+    default=3,
+    show_default=True,
+    help="Timed runs per size, the fastest one is kept.",
+)
+@click.option(
+    "--tolerance",
+    type=click.FloatRange(min=0),
+    default=0.3,
+    show_default=True,
+    help="How much the fitted time exponent may exceed the expected one.",
+)
+def scale(
+    years: list[int],
+    days: list[int] | None = None,
+    sizes: list[int] | None = None,
+    seed: int = 0,
+    repeat: int = 3,
+    tolerance: float = 0.3,
+):
+    from pyaoc.scale import ScaleProfiler
+
+    if sizes is not None and len(set(sizes)) == 1:
+        raise click.ClickException("At least two distinct sizes are needed to fit an exponent.")
+    to_solve = _resolve_keys(years, days)
+    profiler = ScaleProfiler(
+        to_solve=to_solve,
+        sizes=sorted(set(sizes)) if sizes else None,
+        seed=seed,
+        repeat=repeat,
+        tolerance=tolerance,
+    )
+    scalings = profiler.scale_all()
+    if profiler.failed or any(
+        key_scaling.worse_than_expected(tolerance) for key_scaling in scalings
+    ):
+        raise SystemExit(1)
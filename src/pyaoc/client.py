@@ -0,0 +1,67 @@
+import json
+import socket
+import sys
+from pathlib import Path
+from time import perf_counter
+from typing import Any
+
+from pyaoc.config import DAEMON_SOCKET
+from pyaoc.keys import SolKey
+from pyaoc.reporters import HumanReporter, Reporter
+from pyaoc.runs import KeyRun
+
+# Client side of the `pyaoc serve` daemon, kept apart from the server so `run --daemon`
+# imports no solving code
+SOLVE = "solve"
+BENCH = "bench"
+RELOAD = "reload"
+SHUTDOWN = "shutdown"
+
+
+class DaemonError(Exception):
+    pass
+
+
+def key_run_to_json(run: KeyRun) -> dict[str, Any]:
+    return run._asdict()
+
+
+def key_run_from_json(data: dict[str, Any]) -> KeyRun:
+    return KeyRun(**{**data, "key": tuple(data["key"])})
+
+
+def request(payload: dict[str, Any], socket_path: Path = DAEMON_SOCKET) -> dict[str, Any]:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(str(socket_path))
+        except (ConnectionRefusedError, FileNotFoundError) as e:
+            raise DaemonError(f"No daemon listening on {socket_path}, start `pyaoc serve`.") from e
+        sock.sendall(json.dumps(payload).encode() + b"\n")
+        with sock.makefile("rb") as f:
+            response = json.loads(f.readline())
+
+    if not response["ok"]:
+        raise DaemonError(response["error"])
+    return response
+
+
+def solve_on_daemon(
+    keys: list[SolKey] | None,
+    with_sample: bool,
+    reporter: Reporter | None = None,
+    socket_path: Path = DAEMON_SOCKET,
+) -> None:
+    """Client side of `pyaoc run --daemon`, reports runs like Solver.solve_all would."""
+    start = perf_counter()
+    response = request(
+        {"command": SOLVE, "keys": keys, "sample": with_sample}, socket_path=socket_path
+    )
+    for module_name in response["reloaded"]:
+        print(f"Daemon reloaded {module_name}", file=sys.stderr)
+
+    reporter = reporter if reporter is not None else HumanReporter(with_sample)
+    runs = [key_run_from_json(run_data) for run_data in response["runs"]]
+    for run in runs:
+        reporter.key_started(run.key, run.solution_name)
+        reporter.key_finished(run)
+    reporter.finish(runs, perf_counter() - start)
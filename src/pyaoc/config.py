@@ -2,5 +2,17 @@ from pathlib import Path
 
 CODE_ROOT_DIR = Path(__file__).parent.resolve()
 PROJECT_ROOT_DIR = CODE_ROOT_DIR.parent.parent.resolve()
+LIBRARY_ROOT_DIR = CODE_ROOT_DIR.parent / "librarium"
 
 INPUTS_DIR = PROJECT_ROOT_DIR / "inputs"
+
+BENCH_DIR = PROJECT_ROOT_DIR / ".bench"
+BASELINES_FILE = BENCH_DIR / "baselines.json"
+PROFILES_DIR = BENCH_DIR / "profiles"
+RESULTS_FILE = BENCH_DIR / "results.json"
+DAEMON_SOCKET = BENCH_DIR / "pyaoc.sock"
+# Revision alias of the most recently saved baseline
+LATEST_BASELINE = "latest"
+
+PARSE_CACHE_DIR = PROJECT_ROOT_DIR / ".parse_cache"
+GENERATED_INPUTS_DIR = PROJECT_ROOT_DIR / ".generated"
@@ -0,0 +1,111 @@
+import json
+import socket
+import socketserver
+from contextlib import redirect_stdout
+from io import StringIO
+from pathlib import Path
+from typing import Any, cast
+
+from pyaoc.bench import Bencher
+from pyaoc.client import BENCH, RELOAD, SHUTDOWN, SOLVE, DaemonError, key_run_to_json
+from pyaoc.config import DAEMON_SOCKET
+from pyaoc.keys import SolKey
+from pyaoc.reloader import ModuleReloader
+from pyaoc.solution import SOLUTION_REGISTRY
+from pyaoc.solver import solve_captured
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    def handle(self) -> None:
+        server = cast(SolveServer, self.server)
+        # One JSON request per line, answered with one JSON line
+        for line in self.rfile:
+            try:
+                response = server.handle_payload(json.loads(line))
+            except Exception as e:
+                response = {"ok": False, "error": f"{type(e).__name__}: {e}"}
+            self.wfile.write(json.dumps(response).encode() + b"\n")
+            self.wfile.flush()
+
+
+class SolveServer(socketserver.UnixStreamServer):
+    """
+    Keeps SOLUTION_REGISTRY, its imported modules and parse cache warm between requests.
+    Requests are served one at a time, solutions share the process stdout and caches.
+    """
+
+    def __init__(self, socket_path: Path = DAEMON_SOCKET) -> None:
+        self.socket_path = socket_path
+        self.registry = SOLUTION_REGISTRY
+        self.reloader = ModuleReloader(self.registry)
+        self._stopping = False
+        if socket_path.exists():
+            if _is_listening(socket_path):
+                raise DaemonError(f"Daemon is already listening on {socket_path}.")
+            socket_path.unlink()
+        socket_path.parent.mkdir(parents=True, exist_ok=True)
+        super().__init__(str(socket_path), _RequestHandler)
+
+    def serve_until_shutdown(self) -> None:
+        try:
+            while not self._stopping:
+                self.handle_request()
+        finally:
+            self.server_close()
+            self.socket_path.unlink(missing_ok=True)
+
+    def _resolve_keys(self, payload: dict[str, Any]) -> list[SolKey]:
+        keys = payload.get("keys")
+        if keys is None:
+            return self.registry.all_keys()
+        return [key for key in (tuple(k) for k in keys) if key in self.registry]
+
+    def handle_payload(self, payload: dict[str, Any]) -> dict[str, Any]:
+        reloaded = self.reloader.reload_changed()
+        try:
+            return self._handle_command(payload, reloaded)
+        finally:
+            self.reloader.snapshot()
+
+    def _handle_command(self, payload: dict[str, Any], reloaded: list[str]) -> dict[str, Any]:
+        command = payload.get("command")
+
+        if command == SOLVE:
+            sample = payload.get("sample", True)
+            runs = [solve_captured(key, sample) for key in self._resolve_keys(payload)]
+            return {"ok": True, "reloaded": reloaded, "runs": [key_run_to_json(r) for r in runs]}
+
+        if command == BENCH:
+            bencher = Bencher(
+                to_solve=self._resolve_keys(payload),
+                with_sample=payload.get("sample", True),
+                warmup=payload.get("warmup", 1),
+                repeat=payload.get("repeat", 5),
+            )
+            buf = StringIO()
+            with redirect_stdout(buf):
+                benches = bencher.bench_all()
+            return {
+                "ok": True,
+                "reloaded": reloaded,
+                "output": buf.getvalue(),
+                **bencher.to_json(benches),
+            }
+
+        if command == RELOAD:
+            return {"ok": True, "reloaded": reloaded}
+
+        if command == SHUTDOWN:
+            self._stopping = True
+            return {"ok": True, "reloaded": reloaded}
+
+        raise DaemonError(f"Unknown command {command!r}.")
+
+
+def _is_listening(socket_path: Path) -> bool:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(str(socket_path))
+        except (ConnectionRefusedError, FileNotFoundError):
+            return False
+    return True
@@ -0,0 +1,67 @@
+import ast
+import hashlib
+import importlib.util
+from pathlib import Path
+
+LIBRARY_PACKAGES = ("librarium",)
+# Parsed inputs, and so answers, also depend on the shared parsing helpers of pyaoc.input
+PARSER_PACKAGES = (*LIBRARY_PACKAGES, "pyaoc.input")
+
+
+def file_digest(path: Path) -> str:
+    return hashlib.blake2b(path.read_bytes(), digest_size=16).hexdigest()
+
+
+def module_file(module_name: str) -> Path:
+    spec = importlib.util.find_spec(module_name)
+    if spec is None or spec.origin is None or not spec.has_location:
+        raise ValueError(f"Module {module_name} has no source file.")
+    return Path(spec.origin)
+
+
+def imported_modules(path: Path) -> set[str]:
+    """Absolute imports of a source file, relative ones are not used in this repo."""
+    imported = set()
+    for node in ast.walk(ast.parse(path.read_bytes(), filename=str(path))):
+        if isinstance(node, ast.Import):
+            imported.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module and node.level == 0:
+            imported.add(node.module)
+            # from librarium import grid imports a module, not a name
+            imported.update(f"{node.module}.{alias.name}" for alias in node.names)
+    return imported
+
+
+def _is_library_module(module_name: str, packages: tuple[str, ...]) -> bool:
+    if not any(module_name == p or module_name.startswith(f"{p}.") for p in packages):
+        return False
+    try:
+        module_file(module_name)
+    except (ValueError, ImportError):
+        return False
+    return True
+
+
+def library_dependencies(
+    module_name: str, packages: tuple[str, ...] = LIBRARY_PACKAGES
+) -> list[str]:
+    """
+    Library modules the module imports, directly or through other library modules.
+    Packages may also name single modules, e.g. pyaoc.input.
+    """
+    found: set[str] = set()
+    to_scan = [module_name]
+    while to_scan:
+        for imported in imported_modules(module_file(to_scan.pop())):
+            if imported in found or not _is_library_module(imported, packages):
+                continue
+            found.add(imported)
+            to_scan.append(imported)
+    return sorted(found)
+
+
+def combine_digests(digests: dict[str, str]) -> str:
+    combined = hashlib.blake2b(digest_size=16)
+    for name, digest in sorted(digests.items()):
+        combined.update(f"{name}={digest}\n".encode())
+    return combined.hexdigest()
@@ -0,0 +1,19 @@
+# Importing the year modules registers their generators
+from pyaoc.gen import y_2020, y_2025
+from pyaoc.gen.registry import (
+    GENERATORS,
+    InputGenerator,
+    generated_input_path,
+    get_generator,
+    write_input,
+)
+
+__all__ = [
+    "GENERATORS",
+    "InputGenerator",
+    "generated_input_path",
+    "get_generator",
+    "write_input",
+    "y_2020",
+    "y_2025",
+]
@@ -0,0 +1,65 @@
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from random import Random
+from typing import NamedTuple
+
+from pyaoc.config import GENERATED_INPUTS_DIR
+from pyaoc.input import DAY_TEMPLATE, YEAR_TEMPLATE
+from pyaoc.keys import DayKey
+
+type GenFunc = Callable[[Random, int], Iterator[str]]
+
+
+class InputGenerator(NamedTuple):
+    year: int
+    day: int
+    func: GenFunc
+    puzzle_size: int  # Size of a real puzzle input, the unit of scale factors
+    unit: str  # What size counts, e.g. "points"
+    min_size: int = 1  # Smallest size the solutions can solve
+
+    def lines(self, size: int, seed: int = 0) -> Iterator[str]:
+        if size < self.min_size:
+            raise ValueError(f"Size must be at least {self.min_size} {self.unit}.")
+        return self.func(Random(seed), size)
+
+
+GENERATORS: dict[DayKey, InputGenerator] = {}
+
+
+def generator(
+    year: int, day: int, puzzle_size: int, unit: str, min_size: int = 1
+) -> Callable[[GenFunc], GenFunc]:
+    """Registers a generator yielding `size` units of day input lines from a seeded Random."""
+
+    def _register(func: GenFunc) -> GenFunc:
+        if (year, day) in GENERATORS:
+            raise ValueError(f"Generator for year {year} day {day} is already registered.")
+        GENERATORS[(year, day)] = InputGenerator(year, day, func, puzzle_size, unit, min_size)
+        return func
+
+    return _register
+
+
+def get_generator(year: int, day: int) -> InputGenerator:
+    if (year, day) not in GENERATORS:
+        raise KeyError(f"No input generator for year {year} day {day}.")
+    return GENERATORS[(year, day)]
+
+
+def generated_input_path(
+    year: int, day: int, size: int, seed: int, root: Path = GENERATED_INPUTS_DIR
+) -> Path:
+    year_name = YEAR_TEMPLATE.format(year=year)
+    day_name = DAY_TEMPLATE.format(day=day)
+    return root / year_name / f"{day_name}_n{size}_s{seed}.txt"
+
+
+def write_input(year: int, day: int, size: int, seed: int = 0, path: Path | None = None) -> Path:
+    path = path if path is not None else generated_input_path(year, day, size, seed)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w") as f:
+        for line in get_generator(year, day).lines(size, seed):
+            f.write(line)
+            f.write("\n")
+    return path
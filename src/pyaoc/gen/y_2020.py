@@ -0,0 +1,20 @@
+from collections.abc import Iterator
+from random import Random
+
+from pyaoc.gen.registry import generator
+
+LOOKUP = 2020
+
+
+@generator(2020, 1, puzzle_size=200, unit="expenses")
+def expenses(rng: Random, size: int) -> Iterator[str]:
+    # Planted pair and triple summing to 2020, so both parts find an answer
+    pair = rng.randint(1, LOOKUP - 1)
+    first = rng.randint(1, LOOKUP - 2)
+    second = rng.randint(1, LOOKUP - first - 1)
+    planted = [pair, LOOKUP - pair, first, second, LOOKUP - first - second]
+
+    values = [rng.randint(1, LOOKUP - 1) for _ in range(max(size - len(planted), 0))]
+    values.extend(planted[:size])
+    rng.shuffle(values)
+    yield from map(str, values)
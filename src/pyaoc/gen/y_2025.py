@@ -0,0 +1,199 @@
+from bisect import bisect_left
+from collections.abc import Iterator
+from itertools import product
+from math import isqrt
+from random import Random
+
+from pyaoc.gen.registry import generator
+
+DIGITS = "123456789"
+
+
+@generator(2025, 1, puzzle_size=4_000, unit="rotations")
+def dial_rotations(rng: Random, size: int) -> Iterator[str]:
+    for _ in range(size):
+        yield f"{rng.choice('LR')}{rng.randint(1, 999)}"
+
+
+def _range_overlaps(starts: list[int], ends: dict[int, int], start: int, end: int) -> bool:
+    idx = bisect_left(starts, start)
+    if idx < len(starts) and starts[idx] <= end:
+        return True
+    return idx > 0 and ends[starts[idx - 1]] >= start
+
+
+@generator(2025, 2, puzzle_size=35, unit="ranges")
+def id_ranges(rng: Random, size: int) -> Iterator[str]:
+    # Ranges never overlap and end at most one digit longer than they start,
+    # as the solution expects from real inputs
+    starts: list[int] = []
+    ends: dict[int, int] = {}
+    while len(starts) < size:
+        digits = rng.randint(2, 10)
+        start = rng.randrange(10 ** (digits - 1), 10**digits)
+        end = start + rng.randrange(0, 10 ** min(digits, 6))
+        if start in ends or _range_overlaps(starts, ends, start, end):
+            continue
+        starts.insert(bisect_left(starts, start), start)
+        ends[start] = end
+
+    rng.shuffle(starts)
+    yield ",".join(f"{start}-{ends[start]}" for start in starts)
+
+
+@generator(2025, 3, puzzle_size=200, unit="banks")
+def battery_banks(rng: Random, size: int) -> Iterator[str]:
+    for _ in range(size):
+        yield "".join(rng.choices(DIGITS, k=100))
+
+
+@generator(2025, 4, puzzle_size=140 * 140, unit="cells")
+def paper_grid(rng: Random, size: int) -> Iterator[str]:
+    side = max(isqrt(size), 1)
+    for _ in range(side):
+        yield "".join("@" if rng.random() < 0.6 else "." for _ in range(side))
+
+
+@generator(2025, 5, puzzle_size=1_000, unit="ingredients")
+def fresh_ranges(rng: Random, size: int) -> Iterator[str]:
+    span = 10**15
+    for _ in range(max(size // 5, 1)):
+        start = rng.randrange(1, span)
+        yield f"{start}-{start + rng.randrange(0, 10**13)}"
+    yield ""
+    for _ in range(size):
+        yield str(rng.randrange(1, span))
+
+
+@generator(2025, 6, puzzle_size=1_000, unit="problems")
+def worksheet(rng: Random, size: int, rows: int = 4) -> Iterator[str]:
+    # Digits are never 0 and every problem has a full width number, so the only
+    # blank columns are the ones separating problems
+    lines: list[list[str]] = [[] for _ in range(rows + 1)]
+    for problem in range(size):
+        width = rng.randint(1, 4)
+        numbers = ["".join(rng.choices(DIGITS, k=rng.randint(1, width))) for _ in range(rows)]
+        full = rng.randrange(rows)
+        numbers[full] = "".join(rng.choices(DIGITS, k=width))
+        align = str.ljust if rng.random() < 0.5 else str.rjust
+
+        sep = " " if problem else ""
+        for row, number in enumerate(numbers):
+            lines[row].append(sep + align(number, width))
+        lines[rows].append(sep + rng.choice("+*").ljust(width))
+
+    for line in lines:
+        yield "".join(line)
+
+
+@generator(2025, 7, puzzle_size=70, unit="splitter rows")
+def tachyon_manifold(rng: Random, size: int) -> Iterator[str]:
+    # Splitters form a triangle under S with a full left edge, so the leftmost beam
+    # always hits the next splitter row first, as the solution relies on
+    width, start = 2 * size + 1, size
+    yield "." * start + "S" + "." * (width - start - 1)
+    yield "." * width
+    for level in range(size):
+        row = ["."] * width
+        for col in range(start - level, start + level + 1, 2):
+            if col == start - level or rng.random() < 0.7:
+                row[col] = "^"
+        yield "".join(row)
+        yield "." * width
+
+
+# Part 1 makes 1000 connections and multiplies the three largest circuits. Every
+# connection merges at most two circuits, only 1003+ points always leave three
+@generator(2025, 8, puzzle_size=1_000, unit="points", min_size=1_003)
+def junction_boxes(rng: Random, size: int) -> Iterator[str]:
+    for _ in range(size):
+        yield f"{rng.randrange(100_000)},{rng.randrange(100_000)},{rng.randrange(100_000)}"
+
+
+def _distinct_steps(rng: Random, count: int, low: int, high: int) -> list[int]:
+    # Neighbouring values differ, so no two consecutive polygon edges are collinear
+    values = [rng.randint(low, high)]
+    while len(values) < count:
+        value = rng.randint(low, high)
+        if value != values[-1]:
+            values.append(value)
+    return values
+
+
+@generator(2025, 9, puzzle_size=500, unit="red tiles")
+def red_tiles(rng: Random, size: int) -> Iterator[str]:
+    # Histogram-like rectilinear polygon: tops are above every bottom, so it is simple.
+    # Vertices go along the top chain left to right, then the bottom one back
+    segments = max(size // 4, 1)
+    span = max(100_000, 4 * segments)
+    xs = sorted(rng.sample(range(span), segments + 1))
+    tops = _distinct_steps(rng, segments, span // 2 + 1, span)
+    bottoms = _distinct_steps(rng, segments, 0, span // 2 - 1)
+
+    yield f"{xs[0]},{tops[0]}"
+    for i in range(1, segments):
+        yield f"{xs[i]},{tops[i - 1]}"
+        yield f"{xs[i]},{tops[i]}"
+    yield f"{xs[-1]},{tops[-1]}"
+    yield f"{xs[-1]},{bottoms[-1]}"
+    for i in range(segments - 1, 0, -1):
+        yield f"{xs[i]},{bottoms[i]}"
+        yield f"{xs[i]},{bottoms[i - 1]}"
+    yield f"{xs[0]},{bottoms[0]}"
+
+
+@generator(2025, 10, puzzle_size=180, unit="machines")
+def machines(rng: Random, size: int) -> Iterator[str]:
+    for _ in range(size):
+        lights = rng.randint(4, 10)
+        buttons = [
+            tuple(sorted(rng.sample(range(lights), rng.randint(1, lights - 1))))
+            for _ in range(rng.randint(3, 13))
+        ]
+
+        # Target is a non-empty combination of buttons, so the lights are reachable
+        target = [False] * lights
+        while not any(target):
+            target = [False] * lights
+            for button in rng.sample(buttons, rng.randint(1, len(buttons))):
+                for light in button:
+                    target[light] = not target[light]
+
+        jolts = [0] * lights
+        for button in buttons:
+            presses = rng.randint(0, 20)
+            for light in button:
+                jolts[light] += presses
+
+        indicator = "".join("#" if on else "." for on in target)
+        buttons_str = " ".join(f"({','.join(map(str, button))})" for button in buttons)
+        yield f"[{indicator}] {buttons_str} {{{','.join(map(str, jolts))}}}"
+
+
+RESERVED_DEVICES = ("you", "out", "svr", "fft", "dac")
+MAX_DEVICES = 26**3 - len(RESERVED_DEVICES)
+
+
+@generator(2025, 11, puzzle_size=600, unit="devices")
+def device_dag(rng: Random, size: int, window: int = 20) -> Iterator[str]:
+    if size > MAX_DEVICES:
+        raise ValueError(f"At most {MAX_DEVICES} devices have distinct three-letter names.")
+
+    names = [
+        "".join(letters)
+        for letters in product("abcdefghijklmnopqrstuvwxyz", repeat=3)
+        if "".join(letters) not in RESERVED_DEVICES
+    ]
+    # Devices in topological order: svr first, fft before dac, out as the only sink
+    order = rng.sample(names, max(size, 5) - 4)
+    order.insert(0, "svr")
+    order.insert(rng.randint(1, len(order) // 3 + 1), "you")
+    order.insert(rng.randint(2, len(order) // 2 + 1), "fft")
+    order.insert(rng.randint(len(order) // 2 + 2, len(order)), "dac")
+    order.append("out")
+
+    for i, name in enumerate(order[:-1]):
+        # The next device is always a child, so every later device is reachable
+        later = order[i + 2 : i + 1 + window]
+        children = [order[i + 1], *rng.sample(later, min(len(later), rng.randint(0, 2)))]
+        yield f"{name}: {' '.join(children)}"
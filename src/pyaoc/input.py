@@ -1,10 +1,18 @@
+import hashlib
+import mmap
+import re
 from array import array
+from collections.abc import Iterator, MutableSequence, Sequence
 from pathlib import Path
+from typing import overload
 
 from pyaoc.config import INPUTS_DIR
 
 YEAR_TEMPLATE = "y_{year:04d}"
 DAY_TEMPLATE = "d_{day:02d}"
+# Minus sign only counts when it does not follow a digit, so 11-22 ranges are two positives
+SIGNED_INT_RE = re.compile(rb"(?<!\d)-?\d+")
+LINE_RE = re.compile(rb"[^\n]+")
 
 
 def prepare_input_path(year: int, day: int, sample: bool = False) -> Path:
@@ -20,7 +28,175 @@ def read_input_file(year: int, day: int, sample: bool = False) -> list[str]:
     return input_path.read_text().splitlines()
 
 
-def parse_input_lines_as_ints(input_lines: list[str]) -> list[int]:
+class InputBuffer:
+    """
+    Read-only memory mapping of an input file. Lines are located lazily: the offsets
+    index is built on first line access, so parsers that scan `data` directly never pay for it.
+    Lines are split on \\n with an optional trailing \\r, like str.splitlines() does for them.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        with path.open("rb") as f:
+            # Empty files cannot be mapped
+            size = path.stat().st_size
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if size else None
+        self.data = memoryview(self._mmap) if self._mmap is not None else memoryview(b"")
+        self._starts: array | None = None
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def digest(self) -> str:
+        return hashlib.blake2b(self.data, digest_size=16).hexdigest()
+
+    def _line_starts(self) -> array:
+        if self._starts is not None:
+            return self._starts
+
+        size = len(self.data)
+        starts = array("q", [0])
+        if self._mmap is not None:
+            pos = self._mmap.find(b"\n")
+            while pos != -1:
+                starts.append(pos + 1)
+                pos = self._mmap.find(b"\n", pos + 1)
+        # Sentinel for the last line without a trailing newline, so that
+        # every line i spans [starts[i], starts[i + 1] - 1)
+        if starts[-1] != size:
+            starts.append(size + 1)
+
+        self._starts = starts
+        return starts
+
+    def line_count(self) -> int:
+        return len(self._line_starts()) - 1
+
+    def line_bytes(self, idx: int) -> memoryview:
+        starts = self._line_starts()
+        start, end = starts[idx], starts[idx + 1] - 1
+        if end > start and self.data[end - 1] == ord("\r"):
+            end -= 1
+        return self.data[start:end]
+
+    def line(self, idx: int) -> str:
+        return str(self.line_bytes(idx), "utf-8")
+
+
+class InputLines(MutableSequence[str]):
+    """
+    List-like view of InputBuffer lines for `_parse_input` implementations.
+    Lines are decoded on access, assigned lines are kept as overrides, and structural
+    changes (insert/delete) fall back to a materialized list of lines.
+    """
+
+    def __init__(self, buffer: InputBuffer) -> None:
+        self.buffer = buffer
+        self._overrides: dict[int, str] = {}
+        self._lines: list[str] | None = None
+
+    def _normalize_idx(self, idx: int) -> int:
+        length = len(self)
+        if idx < 0:
+            idx += length
+        if not (0 <= idx < length):
+            raise IndexError("Line index out of range")
+        return idx
+
+    def _materialize(self) -> list[str]:
+        if self._lines is None:
+            self._lines = list(self)
+            self._overrides.clear()
+        return self._lines
+
+    @property
+    def is_pristine(self) -> bool:
+        return self._lines is None and not self._overrides
+
+    def __len__(self) -> int:
+        if self._lines is not None:
+            return len(self._lines)
+        return self.buffer.line_count()
+
+    @overload
+    def __getitem__(self, idx: int) -> str: ...
+    @overload
+    def __getitem__(self, idx: slice) -> list[str]: ...
+    def __getitem__(self, idx: int | slice) -> str | list[str]:
+        if self._lines is not None:
+            return self._lines[idx]
+        if isinstance(idx, slice):
+            return [self[i] for i in range(*idx.indices(len(self)))]
+
+        idx = self._normalize_idx(idx)
+        if idx in self._overrides:
+            return self._overrides[idx]
+        return self.buffer.line(idx)
+
+    def __setitem__(self, idx, value) -> None:  # type: ignore[override]
+        if self._lines is not None or isinstance(idx, slice):
+            self._materialize()[idx] = value
+            return
+        self._overrides[self._normalize_idx(idx)] = value
+
+    def __delitem__(self, idx: int | slice) -> None:
+        del self._materialize()[idx]
+
+    def insert(self, index: int, value: str) -> None:
+        self._materialize().insert(index, value)
+
+    def __iter__(self) -> Iterator[str]:
+        if self._lines is not None:
+            return iter(self._lines)
+        return (self[i] for i in range(len(self)))
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, (InputLines, list)):
+            return NotImplemented
+        return list(self) == list(other)
+
+    def copy(self) -> "InputLines":
+        lines_copy = InputLines(self.buffer)
+        lines_copy._overrides = self._overrides.copy()
+        lines_copy._lines = self._lines.copy() if self._lines is not None else None
+        return lines_copy
+
+
+def map_input_file(year: int, day: int, sample: bool = False) -> InputLines:
+    return InputLines(InputBuffer(prepare_input_path(year, day, sample)))
+
+
+def input_data(input_lines: Sequence[str]) -> bytes | memoryview:
+    # Unchanged mapped input is scanned in place, anything else gets encoded back
+    if isinstance(input_lines, InputLines) and input_lines.is_pristine:
+        return input_lines.buffer.data
+    return "\n".join(input_lines).encode()
+
+
+def parse_input_as_int_arr(input_lines: Sequence[str], t_code: str = "q") -> array:
+    """Every signed integer of the input in one regex pass, regardless of separators."""
+    return array(t_code, map(int, SIGNED_INT_RE.findall(input_data(input_lines))))
+
+
+def parse_input_as_int_rows(input_lines: Sequence[str], width: int, t_code: str = "q") -> array:
+    """
+    Integers of fixed-width records (e.g. x,y,z per line) as one flat array,
+    row i spans [i * width, (i + 1) * width). Every line that is not blank must hold
+    exactly width integers, rows never continue on the next line.
+    """
+    ints = array(t_code)
+    find_ints = SIGNED_INT_RE.findall
+    for line in LINE_RE.findall(input_data(input_lines)):
+        row = find_ints(line)
+        if len(row) != width:
+            if not row and not line.strip():
+                continue
+            raise ValueError(f"Found {len(row)} integers in line {line!r}, not row width {width}")
+        ints.extend(map(int, row))
+    return ints
+
+
+def parse_input_lines_as_ints(input_lines: Sequence[str]) -> list[int]:
     return [int(line.strip()) for line in input_lines]
 
 
@@ -38,16 +214,16 @@ def parse_line_as_int_arr(line: str, t_code: str, sep: str | None = None) -> arr
 
 
 def parse_input_lines_as_lists_of_ints(
-    input_lines: list[str], sep: str | None = None
+    input_lines: Sequence[str], sep: str | None = None
 ) -> list[list[int]]:
     return [parse_line_as_ints(line, sep) for line in input_lines]
 
 
-def parse_input_lines_as_chars(input_lines: list[str]) -> list[list[str]]:
+def parse_input_lines_as_chars(input_lines: Sequence[str]) -> list[list[str]]:
     return [list(line.strip()) for line in input_lines]
 
 
-def parse_input_lines_as_columns(input_lines: list[str]) -> list[list[str]]:
+def parse_input_lines_as_columns(input_lines: Sequence[str]) -> list[list[str]]:
     if not input_lines:
         return []
 
@@ -0,0 +1,109 @@
+import importlib
+import inspect
+from collections import Counter
+from collections.abc import Callable
+from functools import wraps
+from time import perf_counter_ns
+from typing import Any
+
+# (module, class, methods) of the librarium primitives hot loops are made of
+PRIMITIVES: tuple[tuple[str, str, tuple[str, ...]], ...] = (
+    (
+        "librarium.grid",
+        "Grid",
+        (
+            "get",
+            "set",
+            "to_idx",
+            "valid_pos",
+            "neighbors",
+            "neighbors_with_values",
+            "neigh_filter",
+            "neigh_values",
+            "neigh_values_filter",
+            "neighbors_with_values_filter",
+        ),
+    ),
+    ("librarium.unionfind", "UnionFind", ("find_root", "union")),
+    ("librarium.sparse_arr", "SparseArray", ("next_from",)),
+    ("librarium.drange", "MultiRange", ("__contains__",)),
+)
+
+
+class CallCounter:
+    """
+    Counts calls and cumulative time of PRIMITIVES by replacing the methods on their
+    classes while enabled, and putting the originals back on disable. Nothing is
+    wrapped otherwise, so primitives cost nothing extra unless counting was asked for.
+    Times include nested counted calls, generators are timed only while producing items.
+    """
+
+    def __init__(
+        self, primitives: tuple[tuple[str, str, tuple[str, ...]], ...] = PRIMITIVES
+    ) -> None:
+        self.primitives = primitives
+        self.counts: Counter[str] = Counter()
+        self.times_ns: Counter[str] = Counter()
+        self._originals: list[tuple[type, str, Any]] = []
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self._originals)
+
+    def reset(self) -> None:
+        self.counts.clear()
+        self.times_ns.clear()
+
+    def enable(self) -> None:
+        if self.enabled:
+            raise RuntimeError("Call counting is already enabled.")
+        for module_name, class_name, methods in self.primitives:
+            cls = getattr(importlib.import_module(module_name), class_name)
+            for method_name in methods:
+                # Taken from the class dict, so subclasses keep their own overrides
+                original = cls.__dict__[method_name]
+                name = f"{class_name}.{method_name}"
+                setattr(cls, method_name, self._wrap(name, original))
+                self._originals.append((cls, method_name, original))
+
+    def disable(self) -> None:
+        for cls, method_name, original in reversed(self._originals):
+            setattr(cls, method_name, original)
+        self._originals = []
+
+    def _wrap(self, name: str, method: Callable[..., Any]) -> Callable[..., Any]:
+        counts, times_ns = self.counts, self.times_ns
+
+        if inspect.isgeneratorfunction(method):
+
+            @wraps(method)
+            def generator_wrapper(*args: Any, **kwargs: Any) -> Any:
+                counts[name] += 1
+                elapsed = 0
+                gen = method(*args, **kwargs)
+                try:
+                    while True:
+                        start = perf_counter_ns()
+                        try:
+                            item = next(gen)
+                        except StopIteration:
+                            break
+                        finally:
+                            elapsed += perf_counter_ns() - start
+                        yield item
+                finally:
+                    times_ns[name] += elapsed
+                    gen.close()
+
+            return generator_wrapper
+
+        @wraps(method)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            counts[name] += 1
+            start = perf_counter_ns()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                times_ns[name] += perf_counter_ns() - start
+
+        return wrapper
@@ -0,0 +1,7 @@
+type SolKey = tuple[int, int, int]  # (year, day, part)
+type DayKey = tuple[int, int]  # (year, day)
+
+
+def short_key(key: SolKey) -> str:
+    year, day, part = key
+    return f"{str(year)[-2:]:02}{day:02}{part:02}"
@@ -0,0 +1,97 @@
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import Any
+
+from pyaoc.config import PARSE_CACHE_DIR
+from pyaoc.fingerprint import (
+    PARSER_PACKAGES,
+    combine_digests,
+    file_digest,
+    library_dependencies,
+    module_file,
+)
+
+MISS = object()
+
+
+class DiskParseCache:
+    """
+    Pickled parsed inputs stored under {year}/{day}/, one file per parser and sample flag:
+    {parse qualname}-{sample|actual}-{input digest}-{source digest}.pickle
+    Entries are content addressed, so editing the input, the solution module or the
+    library modules it imports makes them miss, and outdated files of the same parser
+    are removed on store.
+    """
+
+    def __init__(
+        self, cache_dir: Path = PARSE_CACHE_DIR, packages: tuple[str, ...] = PARSER_PACKAGES
+    ) -> None:
+        self.cache_dir = cache_dir
+        self.packages = packages
+        self._source_digests: dict[str, str] = {}
+
+    def _source_digest(self, module_name: str) -> str:
+        if module_name not in self._source_digests:
+            modules = [module_name, *library_dependencies(module_name, self.packages)]
+            self._source_digests[module_name] = combine_digests(
+                {name: file_digest(module_file(name)) for name in modules}
+            )
+        return self._source_digests[module_name]
+
+    def _entry_prefix(self, year: int, day: int, sample: bool, parser: str) -> str:
+        return f"{year}/{day:02}/{parser}-{'sample' if sample else 'actual'}"
+
+    def entry_path(
+        self, year: int, day: int, sample: bool, parser: str, module: str, input_digest: str
+    ) -> Path:
+        prefix = self._entry_prefix(year, day, sample, parser)
+        return self.cache_dir / f"{prefix}-{input_digest}-{self._source_digest(module)}.pickle"
+
+    def load(
+        self, year: int, day: int, sample: bool, parser: str, module: str, input_digest: str
+    ) -> Any:
+        path = self.entry_path(year, day, sample, parser, module, input_digest)
+        try:
+            with path.open("rb") as f:
+                return pickle.load(f)
+        except FileNotFoundError:
+            return MISS
+        except (pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            # Leftovers of an interrupted store or of renamed classes, parse again
+            path.unlink(missing_ok=True)
+            return MISS
+
+    def store(
+        self,
+        year: int,
+        day: int,
+        sample: bool,
+        parser: str,
+        module: str,
+        input_digest: str,
+        parsed_input: Any,
+    ) -> None:
+        path = self.entry_path(year, day, sample, parser, module, input_digest)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        prefix = self.cache_dir / self._entry_prefix(year, day, sample, parser)
+        for outdated in path.parent.glob(f"{prefix.name}-*.pickle"):
+            outdated.unlink(missing_ok=True)
+
+        # Parallel workers may store the same entry, each writes its own temporary file
+        with tempfile.NamedTemporaryFile(dir=path.parent, suffix=".tmp", delete=False) as f:
+            try:
+                pickle.dump(parsed_input, f, protocol=pickle.HIGHEST_PROTOCOL)
+            except BaseException:
+                # Unpicklable parses and interrupts leave nothing half written behind
+                f.close()
+                os.unlink(f.name)
+                raise
+        os.replace(f.name, path)
+
+    def clear(self) -> None:
+        # Temporary files are only left by stores killed mid-write
+        for pattern in ("*/*/*.pickle", "*/*/*.tmp"):
+            for path in self.cache_dir.glob(pattern):
+                path.unlink(missing_ok=True)
@@ -0,0 +1,102 @@
+from collections.abc import Callable
+from contextlib import AbstractContextManager, ContextDecorator
+from functools import wraps
+from time import perf_counter
+from typing import Any, NamedTuple, Protocol
+
+PARSE_PHASE = "parse"
+SOLVE_PHASE = "solve"
+
+
+class PhaseTiming(NamedTuple):
+    path: str  # Names of the enclosing phases and this one, joined with "/"
+    elapsed: float
+
+
+class PhaseTrace:
+    """Timings of the phases one solution instance went through, in start order."""
+
+    def __init__(self) -> None:
+        self.timings: list[PhaseTiming] = []
+        self._stack: list[str] = []
+
+    def phase(self, name: str, under_root: bool = False) -> "_Phase":
+        """
+        With under_root, the phase is recorded right under the outermost open phase,
+        wherever it is entered from, e.g. a lazy parse first needed inside "solve/mst".
+        """
+        return _Phase(self, name, under_root)
+
+    def totals(self) -> dict[str, float]:
+        """Summed time per phase path, a phase entered many times is reported once."""
+        totals: dict[str, float] = {}
+        for timing in self.timings:
+            totals[timing.path] = totals.get(timing.path, 0.0) + timing.elapsed
+        return totals
+
+
+class _Phase(ContextDecorator):
+    __slots__ = ("_index", "_name", "_outer_stack", "_start", "_trace", "_under_root")
+
+    def __init__(self, trace: PhaseTrace, name: str, under_root: bool = False) -> None:
+        self._trace = trace
+        self._name = name
+        self._under_root = under_root
+        self._outer_stack: list[str] = []
+        self._index = 0
+        self._start = 0.0
+
+    def _recreate_cm(self) -> "_Phase":
+        # Decorated functions may recurse, every call needs its own start time
+        return _Phase(self._trace, self._name, self._under_root)
+
+    def __enter__(self) -> None:
+        trace = self._trace
+        if self._under_root:
+            # Phases nested in this one are recorded under it, the open ones come back on exit
+            self._outer_stack = trace._stack
+            trace._stack = trace._stack[:1]
+        trace._stack.append(self._name)
+        # Reserved on entry, so outer phases are listed before the nested ones
+        self._index = len(trace.timings)
+        trace.timings.append(PhaseTiming("/".join(trace._stack), 0.0))
+        self._start = perf_counter()
+
+    def __exit__(self, *exc_info: object) -> None:
+        elapsed = perf_counter() - self._start
+        trace = self._trace
+        trace.timings[self._index] = trace.timings[self._index]._replace(elapsed=elapsed)
+        trace._stack.pop()
+        if self._under_root:
+            trace._stack = self._outer_stack
+
+
+class _NoPhase(ContextDecorator):
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        pass
+
+    def __exit__(self, *exc_info: object) -> None:
+        pass
+
+
+NO_PHASE = _NoPhase()
+
+
+class _Phased(Protocol):
+    def phase(self, name: str) -> AbstractContextManager[None]: ...
+
+
+def phase[R](name: str) -> Callable[[Callable[..., R]], Callable[..., R]]:
+    """Method decorator, runs every call of a Solution method as a phase of its instance."""
+
+    def decorator(method: Callable[..., R]) -> Callable[..., R]:
+        @wraps(method)
+        def wrapper(self: _Phased, *args: Any, **kwargs: Any) -> R:
+            with self.phase(name):
+                return method(self, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
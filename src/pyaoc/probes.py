@@ -0,0 +1,200 @@
+import cProfile
+import pstats
+import tracemalloc
+from abc import ABC, abstractmethod
+from collections import Counter
+from contextlib import AbstractContextManager, contextmanager
+from io import StringIO
+from pathlib import Path
+from typing import Iterator
+
+from pyaoc.config import PROFILES_DIR
+from pyaoc.instrument import CallCounter
+from pyaoc.keys import SolKey, short_key
+from pyaoc.sampler import Stack, StackSampler, self_counts, trim_common_prefix, write_collapsed
+
+
+class Probe(ABC):
+    """
+    Instrumentation Solver wraps around every phase (parse and solve) of a key run.
+    Probes are pickled into pool workers, so per-key state is created in start_key.
+    """
+
+    def start_key(self, key: SolKey) -> None:  # noqa: B027
+        pass
+
+    @abstractmethod
+    def measure(self, key: SolKey, phase: str) -> AbstractContextManager[None]:
+        pass
+
+    def finish_key(self, key: SolKey) -> None:  # noqa: B027
+        pass
+
+
+def _profile_path(out_dir: Path, key: SolKey, with_sample: bool, suffix: str) -> Path:
+    # Sample and actual runs of a key profile different inputs, neither overwrites the other
+    return out_dir / f"{short_key(key)}-{'sample' if with_sample else 'actual'}{suffix}"
+
+
+class ProfileProbe(Probe):
+    def __init__(self, with_sample: bool, top: int = 20, out_dir: Path = PROFILES_DIR) -> None:
+        self.with_sample = with_sample
+        self.top = top
+        self.out_dir = out_dir
+        self._profile: cProfile.Profile | None = None
+
+    def start_key(self, key: SolKey) -> None:
+        self._profile = cProfile.Profile()
+
+    @contextmanager
+    def measure(self, key: SolKey, phase: str) -> Iterator[None]:
+        assert self._profile is not None
+        self._profile.enable()
+        try:
+            yield
+        finally:
+            self._profile.disable()
+
+    def finish_key(self, key: SolKey) -> None:
+        assert self._profile is not None
+        self.out_dir.mkdir(parents=True, exist_ok=True)
+        stats_path = _profile_path(self.out_dir, key, self.with_sample, ".pstats")
+        self._profile.dump_stats(stats_path)
+
+        buf = StringIO()
+        stats = pstats.Stats(self._profile, stream=buf)
+        stats.strip_dirs().sort_stats(pstats.SortKey.CUMULATIVE).print_stats(self.top)
+        print(f"Profile saved to {stats_path}, top {self.top} by cumulative time:")
+        print(buf.getvalue().strip("\n"))
+        self._profile = None
+
+
+class SamplingProbe(Probe):
+    """
+    Statistical profile from a background thread sampling the solving thread stack,
+    cheap enough for tight loops cProfile distorts. Stacks are saved in the collapsed
+    format flamegraph tools render, with the phase as the root frame.
+    """
+
+    def __init__(
+        self, with_sample: bool, rate: float = 200, top: int = 10, out_dir: Path = PROFILES_DIR
+    ) -> None:
+        if rate <= 0:
+            raise ValueError("Sampling rate must be positive.")
+        self.with_sample = with_sample
+        self.rate = rate
+        self.top = top
+        self.out_dir = out_dir
+        self._samples: Counter[Stack] = Counter()
+
+    def start_key(self, key: SolKey) -> None:
+        self._samples = Counter()
+
+    @contextmanager
+    def measure(self, key: SolKey, phase: str) -> Iterator[None]:
+        sampler = StackSampler(interval=1 / self.rate)
+        sampler.start()
+        try:
+            yield
+        finally:
+            samples = trim_common_prefix(sampler.stop())
+            for stack, count in samples.items():
+                self._samples[(phase, *stack)] += count
+
+    def finish_key(self, key: SolKey) -> None:
+        stacks_path = _profile_path(self.out_dir, key, self.with_sample, ".collapsed")
+        write_collapsed(self._samples, stacks_path)
+
+        total = self._samples.total()
+        print(f"{total} stack samples saved to {stacks_path}, top {self.top} by self samples:")
+        for name, count in self_counts(self._samples).most_common(self.top):
+            print(f"    {count / total:6.1%} {count:>7}  {name}")
+
+
+class CallCountProbe(Probe):
+    """
+    Calls and cumulative time of librarium primitives over both phases of a key.
+    Methods are swapped for counting wrappers only between start_key and finish_key.
+    """
+
+    def __init__(self) -> None:
+        self.counter = CallCounter()
+
+    def start_key(self, key: SolKey) -> None:
+        self.counter.reset()
+        self.counter.enable()
+
+    @contextmanager
+    def measure(self, key: SolKey, phase: str) -> Iterator[None]:
+        yield
+
+    def finish_key(self, key: SolKey) -> None:
+        self.counter.disable()
+        print(f"Primitive calls of {short_key(key)}:")
+        if not self.counter.counts:
+            print("    none")
+        for name, count in self.counter.counts.most_common():
+            time_ms = self.counter.times_ns[name] / 1_000_000
+            print(f"    {name:<38} {count:>12,} calls {time_ms:12.3f} ms")
+
+
+def fmt_bytes(size: float) -> str:
+    for unit in ("B", "KiB", "MiB"):
+        if abs(size) < 1024:
+            return f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GiB"
+
+
+class MemoryProbe(Probe):
+    """
+    Peak is the highest traced memory during the phase over what was allocated before it,
+    top sites are the lines that allocated most of the memory still alive at the phase end.
+    """
+
+    _FILTERS = (
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    )
+
+    def __init__(self, top: int = 5) -> None:
+        self.top = top
+        self.peaks: dict[str, int] = {}
+        self._sites: dict[str, list[tracemalloc.StatisticDiff]] = {}
+
+    def start_key(self, key: SolKey) -> None:
+        self.peaks = {}
+        self._sites = {}
+        tracemalloc.start()
+
+    @contextmanager
+    def measure(self, key: SolKey, phase: str) -> Iterator[None]:
+        before = tracemalloc.take_snapshot().filter_traces(self._FILTERS)
+        tracemalloc.reset_peak()
+        start_size, _ = tracemalloc.get_traced_memory()
+        try:
+            yield
+        finally:
+            _, peak = tracemalloc.get_traced_memory()
+            after = tracemalloc.take_snapshot().filter_traces(self._FILTERS)
+            self.peaks[phase] = peak - start_size
+            self._sites[phase] = [
+                stat for stat in after.compare_to(before, "lineno") if stat.size_diff > 0
+            ][: self.top]
+
+    @property
+    def peak_bytes(self) -> int:
+        return max(self.peaks.values(), default=0)
+
+    def finish_key(self, key: SolKey) -> None:
+        tracemalloc.stop()
+        print(f"Memory of {short_key(key)}:")
+        for phase, peak in self.peaks.items():
+            print(f"    {phase}: peak {fmt_bytes(peak)}")
+            for stat in self._sites[phase]:
+                frame = stat.traceback[0]
+                print(
+                    f"        {Path(frame.filename).name}:{frame.lineno}: "
+                    f"{fmt_bytes(stat.size_diff)} in {stat.count_diff} blocks"
+                )
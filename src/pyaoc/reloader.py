@@ -0,0 +1,72 @@
+import importlib
+import sys
+from collections.abc import Iterable
+from graphlib import TopologicalSorter
+
+from pyaoc.fingerprint import LIBRARY_PACKAGES, library_dependencies, module_file
+from pyaoc.solution import SolutionRegistry
+
+
+def reload_order(
+    changed: Iterable[str], modules: Iterable[str], packages: tuple[str, ...] = LIBRARY_PACKAGES
+) -> list[str]:
+    """
+    Changed modules and the modules importing them, directly or not, sorted so that every
+    module comes after the library modules it imports. Reloading an importer after its
+    dependencies rebinds its `from ... import` names to the new objects.
+    """
+    changed = set(changed)
+    deps = {module: set(library_dependencies(module, packages)) for module in modules}
+    stale = {module for module, imported in deps.items() if module in changed or imported & changed}
+    # Sorted, so modules independent of each other keep a stable order
+    graph = {module: deps[module] & stale for module in sorted(stale)}
+    return list(TopologicalSorter(graph).static_order())
+
+
+class ModuleReloader:
+    """
+    Tracks modification times of loaded day modules and the librarium modules they import.
+    Changed library modules and the library modules importing them are reloaded in
+    dependency order before every loaded day, so days pick up the new classes through
+    their own `from librarium... import` statements.
+    """
+
+    def __init__(self, registry: SolutionRegistry) -> None:
+        self.registry = registry
+        self._mtimes: dict[str, int] = {}
+
+    def _tracked_modules(self) -> dict[str, list[str]]:
+        # Day module name -> library modules it depends on
+        return {
+            module_name: library_dependencies(module_name)
+            for module_name in self.registry.loaded_modules().values()
+        }
+
+    def _changed(self, module_name: str) -> bool:
+        mtime = module_file(module_name).stat().st_mtime_ns
+        previous = self._mtimes.get(module_name)
+        self._mtimes[module_name] = mtime
+        return previous is not None and previous != mtime
+
+    def reload_changed(self) -> list[str]:
+        self.registry.rescan()
+        tracked = self._tracked_modules()
+        libraries = sorted({lib for deps in tracked.values() for lib in deps})
+        changed_libs = [lib for lib in libraries if self._changed(lib)]
+        reloaded_libs = reload_order(changed_libs, libraries) if changed_libs else []
+        for lib in reloaded_libs:
+            importlib.reload(sys.modules[lib])
+
+        reloaded = list(reloaded_libs)
+        for (year, day), module_name in self.registry.loaded_modules().items():
+            day_changed = self._changed(module_name)
+            if day_changed or any(lib in reloaded_libs for lib in tracked[module_name]):
+                self.registry.reload_day(year, day)
+                reloaded.append(module_name)
+        return reloaded
+
+    def snapshot(self) -> None:
+        # Modules imported by the last request become reference points for the next one
+        for module_name, deps in self._tracked_modules().items():
+            for tracked in (module_name, *deps):
+                self._mtimes.setdefault(tracked, module_file(tracked).stat().st_mtime_ns)
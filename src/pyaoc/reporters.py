@@ -0,0 +1,160 @@
+import json
+import sys
+from abc import ABC, abstractmethod
+from typing import TextIO
+
+from pyaoc.keys import SolKey, short_key
+from pyaoc.runs import OK, KeyRun
+
+
+class Reporter(ABC):
+    """
+    Output of Solver.solve_all. key_started is called before a key is solved in process
+    (or before its finished run is replayed), key_finished once its run is known.
+    Reporters not showing solution prints make the solver capture them during solving.
+    """
+
+    shows_solution_output: bool = False
+
+    def __init__(self, with_sample: bool, stream: TextIO | None = None) -> None:
+        self.with_sample = with_sample
+        self._stream = stream
+
+    @property
+    def stream(self) -> TextIO:
+        # Resolved on every write, so redirected stdout is respected
+        return self._stream if self._stream is not None else sys.stdout
+
+    def key_started(self, key: SolKey, solution_name: str) -> None:  # noqa: B027
+        pass
+
+    @abstractmethod
+    def key_finished(self, run: KeyRun) -> None:
+        pass
+
+    def finish(self, runs: list[KeyRun], total_time: float) -> None:  # noqa: B027
+        pass
+
+
+class HumanReporter(Reporter):
+    shows_solution_output = True
+
+    def __init__(self, with_sample: bool, stream: TextIO | None = None) -> None:
+        super().__init__(with_sample, stream)
+        self._prev_key: SolKey = (-1, -1, -1)
+
+    def _print(self, *args: object, end: str = "\n") -> None:
+        print(*args, end=end, file=self.stream)
+
+    def key_started(self, key: SolKey, solution_name: str) -> None:
+        year, day, part = key
+        prev_year, prev_day, _ = self._prev_key
+        if year != prev_year:
+            self._print("=====================")
+            self._print(f"===== YEAR {year} =====")
+            self._print("=====================")
+
+        if day != prev_day or year != prev_year:
+            self._print("------------------")
+            self._print(f"----- DAY {day:02} -----")
+            self._print("------------------")
+        self._print(f"---- PART {part} ----")
+        self._prev_key = key
+
+        if self.with_sample:
+            self._print(">> Sample Input <<")
+        else:
+            self._print(">> Actual Input <<")
+
+        self._print(f"Solving {short_key(key)} using {solution_name}...")
+
+    def key_finished(self, run: KeyRun) -> None:
+        if run.output:
+            self._print(run.output, end="")
+        if run.probe_report:
+            self._print(run.probe_report, end="")
+
+        res = f"    Result: {run.result if run.status == OK else run.status}    "
+        cap = "_" * (len(res) + 4)
+        bot = "-" * (len(res) + 4)
+        self._print(cap)
+        self._print(f"| {res} |")
+        self._print(bot)
+        if run.cached:
+            self._print("Skipped, input and sources are unchanged since the stored result.")
+        elif run.status != OK:
+            self._print(f"Failed after {run.total_time:.6f} seconds: {run.error}")
+        else:
+            self._print(
+                f"Solved in {run.total_time:.6f} seconds "
+                f"(parse {run.parse_time:.6f}, solve {run.solve_time:.6f})."
+            )
+        if run.phases:
+            self._print("Phases:")
+            for path, elapsed in run.phases.items():
+                indent = "  " * path.count("/")
+                self._print(f"    {indent}{path.rsplit('/', 1)[-1]}: {elapsed:.6f}s")
+
+        if self.with_sample:
+            self._print("<< Sample Input End >>")
+        else:
+            self._print("<< Actual Input End >>")
+
+    def finish(self, runs: list[KeyRun], total_time: float) -> None:
+        self._print("=====================")
+        self._print(f"All done in {total_time:.6f} seconds (with parsing and setup).")
+        cached = sum(run.cached for run in runs)
+        if cached:
+            self._print(f"{cached} of {len(runs)} keys answered from unchanged results.")
+        failed = [f"{short_key(run.key)} ({run.status})" for run in runs if run.status != OK]
+        if failed:
+            self._print(f"Failed keys: {', '.join(failed)}")
+
+
+class QuietReporter(Reporter):
+    """One `<short key> <result or status>` line per key, probe reports go to stderr."""
+
+    def key_finished(self, run: KeyRun) -> None:
+        answer = run.result if run.status == OK else run.status
+        print(f"{short_key(run.key)} {answer}", file=self.stream)
+        if run.probe_report:
+            print(run.probe_report, end="", file=sys.stderr)
+
+
+class JsonLinesReporter(Reporter):
+    """
+    One JSON record per key, timings in nanoseconds, peak memory only with MemoryProbe.
+    What the probes printed for the key is kept as text in probe_report.
+    """
+
+    def key_finished(self, run: KeyRun) -> None:
+        year, day, part = run.key
+        record = {
+            "year": year,
+            "day": day,
+            "part": part,
+            "solution": run.solution_name,
+            "sample": self.with_sample,
+            "status": run.status,
+            "result": run.result,
+            "parse_ns": round(run.parse_time * 1_000_000_000),
+            "solve_ns": round(run.solve_time * 1_000_000_000),
+            "peak_bytes": run.peak_bytes,
+            "phases_ns": (
+                {path: round(t * 1_000_000_000) for path, t in run.phases.items()}
+                if run.phases is not None
+                else None
+            ),
+            "probe_report": run.probe_report,
+            "cached": run.cached,
+            "error": run.error,
+        }
+        self.stream.write(json.dumps(record) + "\n")
+        self.stream.flush()
+
+
+REPORTERS: dict[str, type[Reporter]] = {
+    "human": HumanReporter,
+    "quiet": QuietReporter,
+    "jsonl": JsonLinesReporter,
+}
@@ -0,0 +1,77 @@
+import json
+from pathlib import Path
+from typing import Any
+
+from pyaoc.baseline import baseline_key
+from pyaoc.config import RESULTS_FILE
+from pyaoc.fingerprint import (
+    PARSER_PACKAGES,
+    combine_digests,
+    file_digest,
+    library_dependencies,
+    module_file,
+)
+from pyaoc.input import InputBuffer, prepare_input_path
+from pyaoc.keys import SolKey
+from pyaoc.solution import Solution
+
+
+def solution_modules(solution_cls: type[Solution]) -> list[str]:
+    # Part 2 classes may subclass a part 1 defined in another module
+    return sorted(
+        {
+            cls.__module__
+            for cls in solution_cls.__mro__
+            if issubclass(cls, Solution) and cls is not Solution
+        }
+    )
+
+
+class ResultStore:
+    """
+    Last answer of every key with the fingerprint it was computed for:
+    {"2025/04/2/actual": {"solution": "Solution250402", "result": 42, "fingerprint": "..."}}
+    The fingerprint covers the input file, the solution modules and the librarium and
+    pyaoc.input modules they import, so any edit to one of those makes the stored answer stale.
+    """
+
+    def __init__(self, path: Path = RESULTS_FILE) -> None:
+        self.path = path
+        self._data: dict[str, dict[str, Any]] = (
+            json.loads(path.read_text()) if path.exists() else {}
+        )
+        self._module_digests: dict[str, str] = {}
+
+    def _module_digest(self, module_name: str) -> str:
+        if module_name not in self._module_digests:
+            self._module_digests[module_name] = file_digest(module_file(module_name))
+        return self._module_digests[module_name]
+
+    def fingerprint(self, solution_cls: type[Solution], sample: bool) -> str:
+        input_path = prepare_input_path(solution_cls.YEAR, solution_cls.DAY, sample)
+        digests = {"input": InputBuffer(input_path).digest()}
+
+        modules = set(solution_modules(solution_cls))
+        for module_name in solution_modules(solution_cls):
+            modules.update(library_dependencies(module_name, PARSER_PACKAGES))
+        digests.update((module_name, self._module_digest(module_name)) for module_name in modules)
+        return combine_digests(digests)
+
+    def cached_result(self, key: SolKey, sample: bool, fingerprint: str) -> int | None:
+        entry = self._data.get(baseline_key(key, sample))
+        if entry is None or entry["fingerprint"] != fingerprint:
+            return None
+        return entry["result"]
+
+    def record(
+        self, key: SolKey, sample: bool, solution_name: str, result: int, fingerprint: str
+    ) -> None:
+        self._data[baseline_key(key, sample)] = {
+            "solution": solution_name,
+            "result": result,
+            "fingerprint": fingerprint,
+        }
+
+    def save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(json.dumps(self._data, indent=2, sort_keys=True) + "\n")
@@ -0,0 +1,27 @@
+from typing import NamedTuple
+
+from pyaoc.keys import SolKey
+
+OK = "OK"
+TIMEOUT = "TIMEOUT"
+OOM = "OOM"
+ERROR = "ERROR"
+
+
+class KeyRun(NamedTuple):
+    key: SolKey
+    solution_name: str
+    result: int | None  # None unless status is OK
+    parse_time: float
+    solve_time: float
+    output: str | None = None  # Captured solution stdout, None if it was printed directly
+    cached: bool = False  # Answer taken from the result store, nothing was run
+    status: str = OK
+    error: str | None = None  # Why a supervised run failed
+    peak_bytes: int | None = None  # Highest phase memory peak, only traced with MemoryProbe
+    phases: dict[str, float] | None = None  # Seconds per self.phase() path, only when traced
+    probe_report: str | None = None  # What the probes printed for the key, None without probes
+
+    @property
+    def total_time(self) -> float:
+        return self.parse_time + self.solve_time
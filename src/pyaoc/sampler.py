@@ -0,0 +1,103 @@
+import sys
+import threading
+from collections import Counter
+from pathlib import Path
+from types import FrameType
+
+type Stack = tuple[str, ...]  # Frame names, outermost first
+
+
+def frame_name(frame: FrameType) -> str:
+    code = frame.f_code
+    # Semicolons separate frames in collapsed stacks
+    name = f"{code.co_qualname} ({Path(code.co_filename).name}:{code.co_firstlineno})"
+    return name.replace(";", ":")
+
+
+def _walk(frame: FrameType | None) -> Stack:
+    names = []
+    while frame is not None:
+        names.append(frame_name(frame))
+        frame = frame.f_back
+    names.reverse()
+    return tuple(names)
+
+
+class StackSampler:
+    """
+    Background thread taking the stack of one thread every interval seconds with
+    sys._current_frames(). The sampled thread is never traced, so its speed is only
+    affected by the sampler holding the GIL while it walks the stack. The sampler waits
+    for the GIL too, so rates above 1 / sys.getswitchinterval() (200 Hz) are not reached.
+    """
+
+    def __init__(self, interval: float = 0.005) -> None:
+        if interval <= 0:
+            raise ValueError("Sampling interval must be positive.")
+        self.interval = interval
+        self.samples: Counter[Stack] = Counter()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._target = 0
+
+    def start(self, target: int | None = None) -> None:
+        if self._thread is not None:
+            raise RuntimeError("Sampler is already running.")
+        self._target = target if target is not None else threading.get_ident()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="pyaoc-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> Counter[Stack]:
+        if self._thread is None:
+            raise RuntimeError("Sampler is not running.")
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+        return self.samples
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self._target)
+            if frame is not None:
+                self.samples[_walk(frame)] += 1
+
+
+def trim_common_prefix(samples: Counter[Stack]) -> Counter[Stack]:
+    """
+    Drops the frames every sample shares (interpreter, CLI and solver frames), except
+    for the innermost of them, which becomes the root of all stacks.
+    """
+    if not samples:
+        return Counter()
+    stacks = list(samples)
+    shared = 0
+    shortest = min(len(stack) for stack in stacks)
+    while shared < shortest and all(stack[shared] == stacks[0][shared] for stack in stacks):
+        shared += 1
+    # `shared` frames are common, the last of them is kept
+    drop = max(shared - 1, 0)
+    trimmed: Counter[Stack] = Counter()
+    for stack, count in samples.items():
+        trimmed[stack[drop:]] += count
+    return trimmed
+
+
+def write_collapsed(samples: Counter[Stack], path: Path) -> None:
+    """
+    Brendan Gregg's collapsed stack format, one `frame;frame;frame count` line per stack,
+    as read by flamegraph.pl, inferno, speedscope and similar tools.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w") as f:
+        for stack, count in sorted(samples.items()):
+            f.write(f"{';'.join(stack)} {count}\n")
+
+
+def self_counts(samples: Counter[Stack]) -> Counter[str]:
+    """Samples per innermost frame, where the time was actually spent."""
+    counts: Counter[str] = Counter()
+    for stack, count in samples.items():
+        if stack:
+            counts[stack[-1]] += count
+    return counts
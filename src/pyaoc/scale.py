@@ -0,0 +1,183 @@
+import gc
+import math
+import os
+import tracemalloc
+from contextlib import redirect_stdout
+from pathlib import Path
+from time import perf_counter_ns
+from typing import NamedTuple
+
+from pyaoc.config import GENERATED_INPUTS_DIR
+from pyaoc.gen import InputGenerator, generated_input_path, get_generator, write_input
+from pyaoc.input import InputBuffer, InputLines
+from pyaoc.keys import SolKey, short_key
+from pyaoc.probes import fmt_bytes
+from pyaoc.solution import SOLUTION_REGISTRY, Solution
+
+
+class SizeRun(NamedTuple):
+    size: int  # In generator units
+    input_bytes: int
+    min_ns: int
+    peak_bytes: int
+
+
+class KeyScaling(NamedTuple):
+    key: SolKey
+    solution_name: str
+    unit: str
+    runs: list[SizeRun]
+    time_exponent: float
+    memory_exponent: float
+    expected_exponent: float
+
+    def worse_than_expected(self, tolerance: float) -> bool:
+        return self.time_exponent > self.expected_exponent + tolerance
+
+
+def size_ladder(start: int, factor: float, steps: int) -> list[int]:
+    if start < 1 or factor <= 1 or steps < 2:
+        raise ValueError("Ladder needs a positive start, a factor above 1 and 2+ steps.")
+    sizes: list[int] = []
+    for step in range(steps):
+        size = round(start * factor**step)
+        if not sizes or size > sizes[-1]:
+            sizes.append(size)
+    return sizes
+
+
+def fit_exponent(sizes: list[float], values: list[float]) -> float:
+    """Least squares slope of log(value) over log(size), values ~ c * size ** slope."""
+    if len(sizes) != len(values) or len(sizes) < 2:
+        raise ValueError("Fitting an exponent needs at least two measurements.")
+    # Timer and tracemalloc resolution may round tiny runs down to zero
+    xs = [math.log(size) for size in sizes]
+    ys = [math.log(max(value, 1)) for value in values]
+    mean_x, mean_y = sum(xs) / len(xs), sum(ys) / len(ys)
+    var_x = sum((x - mean_x) ** 2 for x in xs)
+    if var_x == 0:
+        raise ValueError("Sizes must not all be equal.")
+    return sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys, strict=True)) / var_x
+
+
+def _measure(solution_cls: type[Solution], path: Path, repeat: int) -> tuple[int, int]:
+    input_lines = InputLines(InputBuffer(path))
+    samples = []
+    for _ in range(repeat):
+        gc.collect()
+        start = perf_counter_ns()
+        solution_cls(input_lines, sample=False).solve()
+        samples.append(perf_counter_ns() - start)
+
+    # Separate run, tracing allocations slows the solution down several times
+    gc.collect()
+    tracemalloc.start()
+    try:
+        solution_cls(input_lines, sample=False).solve()
+        _, peak_bytes = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return min(samples), peak_bytes
+
+
+class ScaleProfiler:
+    """
+    Runs every key over generated inputs of geometrically growing sizes and fits how its
+    time and peak memory grow with the input length in bytes. Parsing is included, the
+    input is generated once per size and solution prints are discarded.
+    """
+
+    def __init__(
+        self,
+        to_solve: list[SolKey],
+        sizes: list[int] | None = None,
+        seed: int = 0,
+        repeat: int = 3,
+        tolerance: float = 0.3,
+        inputs_dir: Path = GENERATED_INPUTS_DIR,
+    ) -> None:
+        if repeat < 1:
+            raise ValueError("Repeat count must be a positive integer.")
+
+        self._to_solve = to_solve
+        self._sizes = sizes
+        self._seed = seed
+        self._repeat = repeat
+        self.tolerance = tolerance
+        self._inputs_dir = inputs_dir
+        self.registry = SOLUTION_REGISTRY
+        self.failed: list[SolKey] = []
+
+    def _ladder(self, generator: InputGenerator) -> list[int]:
+        if self._sizes is not None:
+            return self._sizes
+        # From a 16th of a real input up to a real input. Days whose solutions need bigger
+        # inputs start at their minimum and still span a factor of 4
+        start = max(generator.puzzle_size // 16, generator.min_size, 2)
+        stop = max(generator.puzzle_size, 4 * start)
+        return size_ladder(start, (stop / start) ** (1 / 4), 5)
+
+    def scale(self, key: SolKey) -> KeyScaling:
+        year, day, _ = key
+        solution_cls = self.registry.get_solution(key)
+        generator = get_generator(year, day)
+
+        runs = []
+        with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+            for size in self._ladder(generator):
+                path = generated_input_path(year, day, size, self._seed, root=self._inputs_dir)
+                write_input(year, day, size, seed=self._seed, path=path)
+                min_ns, peak_bytes = _measure(solution_cls, path, self._repeat)
+                runs.append(SizeRun(size, path.stat().st_size, min_ns, peak_bytes))
+
+        input_bytes = [run.input_bytes for run in runs]
+        return KeyScaling(
+            key=key,
+            solution_name=solution_cls.__name__,
+            unit=generator.unit,
+            runs=runs,
+            time_exponent=fit_exponent(input_bytes, [run.min_ns for run in runs]),
+            memory_exponent=fit_exponent(input_bytes, [run.peak_bytes for run in runs]),
+            expected_exponent=solution_cls.EXPECTED_EXPONENT,
+        )
+
+    def scale_all(self) -> list[KeyScaling]:
+        scalings = []
+        for key in self._to_solve:
+            year, day, _ = key
+            if key not in self.registry:
+                continue
+            try:
+                get_generator(year, day)
+            except KeyError:
+                print(f"{short_key(key)} skipped, day {day} of {year} has no input generator")
+                continue
+            try:
+                key_scaling = self.scale(key)
+            except Exception as e:
+                # One broken solution must not hide the scaling of the others
+                print(f"{short_key(key)} failed, {type(e).__name__}: {e}")
+                self.failed.append(key)
+                continue
+            print_key_scaling(key_scaling, self.tolerance)
+            scalings.append(key_scaling)
+        return scalings
+
+
+def print_key_scaling(key_scaling: KeyScaling, tolerance: float) -> None:
+    print(f"{short_key(key_scaling.key)} {key_scaling.solution_name}")
+    print(f"    {key_scaling.unit:>14} {'input':>10} {'min ms':>10} {'peak':>10}")
+    for run in key_scaling.runs:
+        print(
+            f"    {run.size:>14} {fmt_bytes(run.input_bytes):>10} "
+            f"{run.min_ns / 1_000_000:10.3f} {fmt_bytes(run.peak_bytes):>10}"
+        )
+    verdict = (
+        f"WORSE than expected n^{key_scaling.expected_exponent:g}"
+        if key_scaling.worse_than_expected(tolerance)
+        else f"within expected n^{key_scaling.expected_exponent:g}"
+    )
+    print(
+        f"    time ~ n^{key_scaling.time_exponent:.2f}, "
+        f"memory ~ n^{key_scaling.memory_exponent:.2f} of input bytes, {verdict}"
+    )
@@ -1,27 +1,94 @@
+import importlib
+import re
+import sys
 from abc import ABC, abstractmethod
-from typing import TypeVar
+from collections.abc import Sequence
+from contextlib import AbstractContextManager
+from copy import deepcopy
+from pathlib import Path
+from typing import Any, TypeVar
 
-from pyaoc.input import read_input_file
+from pyaoc.config import CODE_ROOT_DIR
+from pyaoc.input import InputBuffer, InputLines, map_input_file
+from pyaoc.keys import DayKey, SolKey
+from pyaoc.parse_cache import MISS, DiskParseCache
+from pyaoc.phases import NO_PHASE, PARSE_PHASE, PhaseTrace
 
 ParsedInputT = TypeVar("ParsedInputT")
 
+_UNPARSED: Any = object()
+
 
 class Solution[ParsedInputT](ABC):
     YEAR: int
     DAY: int
     PART: int
+    # Opt-in for expensive parsers, their parsed input must be picklable
+    CACHE_PARSED_ON_DISK: bool = False
+    # Growth exponent of run time in the input length, `pyaoc scale` flags faster growth
+    EXPECTED_EXPONENT: float = 1.0
 
-    def __init__(self, input_lines: list[str], sample: bool) -> None:
+    def __init__(
+        self,
+        input_lines: list[str] | InputLines,
+        sample: bool,
+        parsed_input: ParsedInputT | None = None,
+        trace: PhaseTrace | None = None,
+    ) -> None:
         self._check_attributes()
 
         self.with_sample = sample
+        # Mapped input is copied lazily, parsers may also scan its raw bytes directly
         self._input_lines = input_lines.copy()
-        self.parsed_input = self._parse_input(self._input_lines)
+        self.input_buffer: InputBuffer | None = (
+            input_lines.buffer if isinstance(input_lines, InputLines) else None
+        )
+        # Phases are only timed with a trace, without one self.phase() is a shared no-op
+        self.trace = trace
+        # Parsed on first access, so creating an instance does not include parsing
+        self._parsed_input: ParsedInputT = _UNPARSED if parsed_input is None else parsed_input
+
+    @property
+    def parsed_input(self) -> ParsedInputT:
+        if self._parsed_input is _UNPARSED:
+            # Parsing is timed next to solve, not inside the phase that first needed it
+            parse_phase = (
+                NO_PHASE if self.trace is None else self.trace.phase(PARSE_PHASE, under_root=True)
+            )
+            with parse_phase:
+                self._parsed_input = self._parse_input(self._input_lines)
+        return self._parsed_input
+
+    @parsed_input.setter
+    def parsed_input(self, parsed_input: ParsedInputT) -> None:
+        self._parsed_input = parsed_input
+
+    def parse(self) -> ParsedInputT:
+        """Parses the input now unless it already was."""
+        return self.parsed_input
+
+    def phase(self, name: str) -> AbstractContextManager[None]:
+        """
+        Times a named part of parsing or solving, usable as `with self.phase("mst"):`
+        or as a decorator of inner functions. Nested phases are recorded as "outer/inner".
+        """
+        if self.trace is None:
+            return NO_PHASE
+        return self.trace.phase(name)
 
     @abstractmethod
-    def _parse_input(self, input_lines: list[str]) -> ParsedInputT:
+    def _parse_input(self, input_lines: Sequence[str]) -> ParsedInputT:
         pass
 
+    @classmethod
+    def _copy_parsed_input(cls, parsed_input: ParsedInputT) -> ParsedInputT:
+        """
+        Parsed input is shared between parts of the same day through the registry cache,
+        so every instance gets its own copy. Subclasses can return a cheaper copy, or the
+        same object if their solve() never mutates it.
+        """
+        return deepcopy(parsed_input)
+
     @abstractmethod
     def solve(self) -> int:
         pass
@@ -40,12 +107,29 @@ class Solution[ParsedInputT](ABC):
         SOLUTION_REGISTRY.register(cls)
 
 
-type SolKey = tuple[int, int, int]  # (year, day, part)
+# (year, day, sample, parse function qualname, input content hash)
+type ParseCacheKey = tuple[int, int, bool, str, str]
+
+
+YEAR_DIR_RE = re.compile(r"y_(\d{4})")
+DAY_FILE_RE = re.compile(r"d_(\d{2})")
 
 
 class SolutionRegistry:
-    def __init__(self):
+    """
+    Day modules are discovered by scanning y_YYYY/d_DD.py files and imported only when
+    one of their keys is requested, their .register() calls then fill the registry.
+    """
+
+    def __init__(self, code_root: Path = CODE_ROOT_DIR, package: str = "pyaoc"):
+        self._code_root = code_root
+        self._package = package
         self._registry: dict[SolKey, type[Solution]] = {}
+        self._parse_cache: dict[ParseCacheKey, Any] = {}
+        # Off in processes solving a single key, where no other part reuses the parse
+        self.share_parsed = True
+        self._modules: dict[DayKey, str] | None = None
+        self._loaded: set[DayKey] = set()
 
     def register(self, solution_cls: type[Solution]) -> None:
         if not all(hasattr(solution_cls, attr) for attr in ("YEAR", "DAY", "PART")):
@@ -53,30 +137,161 @@ class SolutionRegistry:
         key = (solution_cls.YEAR, solution_cls.DAY, solution_cls.PART)
         self._registry[key] = solution_cls
 
-    def prepare_solution_instance(self, key: SolKey, sample: bool = False) -> Solution:
-        solution_cls = self._registry[key]
-        input_lines = read_input_file(solution_cls.YEAR, solution_cls.DAY, sample)
-        return solution_cls(input_lines, sample)
+    def _scan_modules(self) -> dict[DayKey, str]:
+        modules: dict[DayKey, str] = {}
+        for path in self._code_root.glob("y_*/d_*.py"):
+            year_match = YEAR_DIR_RE.fullmatch(path.parent.name)
+            day_match = DAY_FILE_RE.fullmatch(path.stem)
+            if year_match is None or day_match is None:
+                continue
+            day_key = (int(year_match.group(1)), int(day_match.group(1)))
+            modules[day_key] = f"{self._package}.{path.parent.name}.{path.stem}"
+        return dict(sorted(modules.items()))
+
+    @property
+    def modules(self) -> dict[DayKey, str]:
+        if self._modules is None:
+            self._modules = self._scan_modules()
+        return self._modules
+
+    def _load_day(self, year: int, day: int) -> None:
+        day_key = (year, day)
+        if day_key in self._loaded or day_key not in self.modules:
+            return
+
+        module_name = self.modules[day_key]
+        importlib.import_module(module_name)
+        self._loaded.add(day_key)
+        self._check_day_module(day_key, module_name)
+
+    def _check_day_module(self, day_key: DayKey, module_name: str) -> None:
+        for (s_year, s_day, _), solution_cls in self._registry.items():
+            if solution_cls.__module__ != module_name:
+                continue
+            if (s_year, s_day) != day_key:
+                raise ValueError(
+                    f"Solution class {solution_cls.__name__} from {module_name} "
+                    f"is registered for year {s_year} day {s_day}."
+                )
+
+    def loaded_modules(self) -> dict[DayKey, str]:
+        return {day_key: self.modules[day_key] for day_key in sorted(self._loaded)}
+
+    def rescan(self) -> None:
+        # Picks up day files added since the first scan, loaded days are kept
+        self._modules = None
+
+    def reload_day(self, year: int, day: int) -> None:
+        """
+        Re-executes an already loaded day module, its .register() calls replace the
+        previous classes. Parsed inputs of the day are dropped, as the parser may have changed.
+        """
+        day_key = (year, day)
+        if day_key not in self._loaded:
+            self._load_day(year, day)
+            return
+
+        module_name = self.modules[day_key]
+        previous = {k: v for k, v in self._registry.items() if v.__module__ == module_name}
+        for key in previous:
+            del self._registry[key]
+        try:
+            importlib.reload(sys.modules[module_name])
+        except Exception:
+            self._registry.update(previous)
+            raise
+
+        self._parse_cache = {k: v for k, v in self._parse_cache.items() if k[:2] != day_key}
+        self._check_day_module(day_key, module_name)
+
+    def _load_all(self) -> None:
+        for year, day in self.modules:
+            self._load_day(year, day)
+
+    def prepare_solution_instance(
+        self,
+        key: SolKey,
+        sample: bool = False,
+        disk_cache: DiskParseCache | None = None,
+        trace: PhaseTrace | None = None,
+    ) -> Solution:
+        solution_cls = self.get_solution(key)
+        input_lines = map_input_file(solution_cls.YEAR, solution_cls.DAY, sample)
+        input_digest = input_lines.buffer.digest()
+
+        # Parts usually share the parser (part 2 subclasses part 1), so the parsed input
+        # is cached per parser and input content, instances get a copy unless it is read-only
+        cache_key = (
+            solution_cls.YEAR,
+            solution_cls.DAY,
+            sample,
+            solution_cls._parse_input.__qualname__,
+            input_digest,
+        )
+        if cache_key in self._parse_cache:
+            parsed_input = solution_cls._copy_parsed_input(self._parse_cache[cache_key])
+            return solution_cls(input_lines, sample, parsed_input=parsed_input, trace=trace)
+
+        disk_key = None
+        if disk_cache is not None and solution_cls.CACHE_PARSED_ON_DISK:
+            # Entries are fingerprinted with the module defining the parser, not the part class
+            disk_key = (*cache_key[:4], solution_cls._parse_input.__module__, input_digest)
+            parsed_input = disk_cache.load(*disk_key)
+            if parsed_input is not MISS:
+                if self.share_parsed:
+                    self._store_parsed(cache_key, parsed_input)
+                    parsed_input = solution_cls._copy_parsed_input(parsed_input)
+                return solution_cls(input_lines, sample, parsed_input=parsed_input, trace=trace)
+
+        solution_instance = solution_cls(input_lines, sample, trace=trace)
+        parsed_input = solution_instance.parsed_input
+        if disk_cache is not None and disk_key is not None:
+            # Pickled right away, before solve() gets to mutate it
+            disk_cache.store(*disk_key, parsed_input)
+        if self.share_parsed:
+            self._store_parsed(cache_key, solution_cls._copy_parsed_input(parsed_input))
+        return solution_instance
+
+    def _store_parsed(self, cache_key: ParseCacheKey, parsed_input: Any) -> None:
+        # Long-lived processes see every edit of an input, parses of older contents are dropped
+        input_key, input_digest = cache_key[:3], cache_key[4]
+        self._parse_cache = {
+            k: v for k, v in self._parse_cache.items() if k[:3] != input_key or k[4] == input_digest
+        }
+        self._parse_cache[cache_key] = parsed_input
+
+    def clear_parse_cache(self) -> None:
+        self._parse_cache.clear()
 
     def get_solution(self, key: tuple[int, int, int]) -> type[Solution]:
+        year, day, _ = key
+        self._load_day(year, day)
         return self._registry[key]
 
     def get_year_solutions(self, year: int) -> dict[SolKey, type[Solution]]:
+        for m_year, day in self.modules:
+            if m_year == year:
+                self._load_day(year, day)
         return {k: v for k, v in self._registry.items() if k[0] == year}
 
     def all_years(self) -> list[int]:
-        return sorted({year for year, _, _ in self._registry})
+        return sorted({year for year, _ in self.modules} | {year for year, _, _ in self._registry})
 
     def all_keys(self) -> list[SolKey]:
+        self._load_all()
         return sorted(self._registry)
 
     def __contains__(self, key: SolKey) -> bool:
+        year, day, _ = key
+        self._load_day(year, day)
         return key in self._registry
 
     def __iter__(self):
+        self._load_all()
         return iter(self._registry.items())
 
     def __len__(self) -> int:
+        self._load_all()
         return len(self._registry)
 
 
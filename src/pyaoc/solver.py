@@ -1,67 +1,329 @@
+import multiprocessing
+import resource
+import signal
+import traceback
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import ExitStack, contextmanager, redirect_stdout, suppress
+from io import StringIO
+from multiprocessing.connection import Connection
 from time import perf_counter
+from typing import Iterator, NamedTuple
 
-from pyaoc.solution import SOLUTION_REGISTRY, SolKey
+from pyaoc.keys import SolKey
+from pyaoc.parse_cache import DiskParseCache
+from pyaoc.phases import PARSE_PHASE, SOLVE_PHASE, PhaseTrace
+from pyaoc.probes import MemoryProbe, Probe
+from pyaoc.reporters import HumanReporter, Reporter
+from pyaoc.results import ResultStore
+from pyaoc.runs import ERROR, OOM, TIMEOUT, KeyRun
+from pyaoc.solution import SOLUTION_REGISTRY
+
+
+def solve_captured(
+    key: SolKey,
+    with_sample: bool,
+    probes: list[Probe] | None = None,
+    disk_cache: DiskParseCache | None = None,
+    trace_phases: bool = False,
+) -> KeyRun:
+    # Runs in a pool process or the daemon: solution prints are captured, so they can be
+    # replayed in registry order instead of interleaving workers output
+    buf = StringIO()
+    with redirect_stdout(buf):
+        run = Solver(
+            to_solve=[key],
+            with_sample=with_sample,
+            probes=probes,
+            disk_cache=disk_cache,
+            trace_phases=trace_phases,
+        ).solve(key)
+    return run._replace(output=buf.getvalue())
+
+
+def _finish_probe(probe: Probe, key: SolKey, report: StringIO) -> None:
+    with redirect_stdout(report):
+        probe.finish_key(key)
+
+
+class KeyLimits(NamedTuple):
+    timeout: float | None = None  # Wall-clock seconds
+    max_rss: int | None = None  # Bytes, enforced as the address space limit (RLIMIT_AS)
+
+
+def _solve_in_child(
+    conn: Connection,
+    key: SolKey,
+    with_sample: bool,
+    probes: list[Probe],
+    disk_cache: DiskParseCache | None,
+    max_rss: int | None,
+    trace_phases: bool,
+) -> None:
+    # Linux does not enforce RLIMIT_RSS, so the whole address space is capped instead;
+    # exceeding it turns allocations into MemoryError rather than involving the OOM killer
+    if max_rss is not None:
+        resource.setrlimit(resource.RLIMIT_AS, (max_rss, max_rss))
+    # This process solves a single key, a copy of its parse would never be used
+    SOLUTION_REGISTRY.share_parsed = False
+    try:
+        conn.send(solve_captured(key, with_sample, probes, disk_cache, trace_phases))
+    except MemoryError:
+        conn.send((OOM, f"Address space limit of {max_rss} bytes exceeded."))
+    except Exception:
+        conn.send((ERROR, traceback.format_exc()))
+    finally:
+        conn.close()
+
+
+def solve_supervised(
+    key: SolKey,
+    solution_name: str,
+    with_sample: bool,
+    limits: KeyLimits,
+    probes: list[Probe] | None = None,
+    disk_cache: DiskParseCache | None = None,
+    trace_phases: bool = False,
+) -> KeyRun:
+    """
+    Solves the key in a child process, killed once it runs out of its time budget.
+    Failures are returned as runs with a non-OK status instead of being raised.
+    """
+    # Forkserver children are forked from a clean single-threaded process,
+    # supervisors may run in threads
+    ctx = multiprocessing.get_context("forkserver")
+    parent_conn, child_conn = ctx.Pipe(duplex=False)
+    process = ctx.Process(
+        target=_solve_in_child,
+        args=(
+            child_conn,
+            key,
+            with_sample,
+            probes or [],
+            disk_cache,
+            limits.max_rss,
+            trace_phases,
+        ),
+    )
+    start = perf_counter()
+    process.start()
+    child_conn.close()
+
+    payload = None
+    if parent_conn.poll(limits.timeout):
+        with suppress(EOFError):
+            payload = parent_conn.recv()
+    else:
+        process.kill()
+        payload = (TIMEOUT, f"Killed after {limits.timeout} seconds.")
+    process.join()
+    parent_conn.close()
+    elapsed = perf_counter() - start
+
+    if isinstance(payload, KeyRun):
+        return payload
+    if payload is None:
+        # Died without reporting, SIGKILL usually comes from the kernel OOM killer
+        oom_killed = process.exitcode == -signal.SIGKILL
+        payload = (
+            OOM if oom_killed else ERROR,
+            f"Child process exited with code {process.exitcode}.",
+        )
+    status, error = payload
+    return KeyRun(
+        key=key,
+        solution_name=solution_name,
+        result=None,
+        parse_time=0.0,
+        solve_time=elapsed,
+        status=status,
+        error=error,
+    )
 
 
 class Solver:
-    def __init__(self, to_solve: list[SolKey], with_sample: bool = True) -> None:
+    def __init__(
+        self,
+        to_solve: list[SolKey],
+        with_sample: bool = True,
+        jobs: int = 1,
+        probes: list[Probe] | None = None,
+        disk_cache: DiskParseCache | None = None,
+        result_store: ResultStore | None = None,
+        limits: KeyLimits | None = None,
+        reporter: Reporter | None = None,
+        trace_phases: bool = False,
+    ) -> None:
+        if jobs < 1:
+            raise ValueError("Jobs count must be a positive integer.")
+
         self._to_solve = to_solve
         self._with_sample = with_sample
+        self._jobs = jobs
+        self._probes = probes if probes is not None else []
+        self._disk_cache = disk_cache
+        # Keys with an unchanged fingerprint are answered from the store, others are recorded
+        self._result_store = result_store
+        # With limits every key runs in its own supervised child process
+        self._limits = limits
+        # Solutions record their self.phase() timings only when traced
+        self._trace_phases = trace_phases
+        self.reporter = reporter if reporter is not None else HumanReporter(with_sample)
         self.registry = SOLUTION_REGISTRY
 
-    def solve(self, key: SolKey) -> int:
-        solution_instance = self.registry.prepare_solution_instance(key, sample=self._with_sample)
-        year, day, part = key
-        s_key = f"{str(year)[-2:]:02}{day:02}{part:02}"
-        print(f"Solving {s_key} using {type(solution_instance).__name__}...")
-        return solution_instance.solve()
+    @contextmanager
+    def _measure(self, key: SolKey, phase: str) -> Iterator[list[float]]:
+        # Yields a one-item list, filled with the phase duration on exit;
+        # probes are entered outside of the timed region
+        elapsed = [0.0]
+        with ExitStack() as stack:
+            for probe in self._probes:
+                stack.enter_context(probe.measure(key, phase))
+            start = perf_counter()
+            try:
+                yield elapsed
+            finally:
+                elapsed[0] = perf_counter() - start
+
+    def solve(self, key: SolKey) -> KeyRun:
+        # Imports the day module, and whatever it imports, before anything is measured
+        self.registry.get_solution(key)
+
+        trace = PhaseTrace() if self._trace_phases else None
+        # Probe reports go to the reporter with the run, not into the solution output
+        probe_report = StringIO()
+        with ExitStack() as probes_stack:
+            for probe in self._probes:
+                probe.start_key(key)
+                # Finished even if the key raises, so no instrumentation outlives it
+                probes_stack.callback(_finish_probe, probe, key, probe_report)
+
+            with self._measure(key, PARSE_PHASE) as parse_time:
+                solution_instance = self.registry.prepare_solution_instance(
+                    key, sample=self._with_sample, disk_cache=self._disk_cache, trace=trace
+                )
+                solution_instance.parse()
+            with (
+                self._measure(key, SOLVE_PHASE) as solve_time,
+                solution_instance.phase(SOLVE_PHASE),
+            ):
+                result = solution_instance.solve()
+
+        memory_probes = [probe for probe in self._probes if isinstance(probe, MemoryProbe)]
+        return KeyRun(
+            key=key,
+            solution_name=type(solution_instance).__name__,
+            result=result,
+            parse_time=parse_time[0],
+            solve_time=solve_time[0],
+            peak_bytes=memory_probes[0].peak_bytes if memory_probes else None,
+            phases=trace.totals() if trace is not None else None,
+            probe_report=probe_report.getvalue() if self._probes else None,
+        )
+
+    def _solve_in_process(self, key: SolKey) -> KeyRun:
+        if self.reporter.shows_solution_output:
+            return self.solve(key)
+        # Solution prints would interleave with the report, and are cheaper to buffer
+        buf = StringIO()
+        with redirect_stdout(buf):
+            run = self.solve(key)
+        return run._replace(output=buf.getvalue())
+
+    def _keys_to_solve(self) -> list[SolKey]:
+        return [key for key in self._to_solve if key in self.registry]
+
+    def _cached_runs(
+        self, keys: list[SolKey], fingerprints: dict[SolKey, str]
+    ) -> dict[SolKey, KeyRun]:
+        if self._result_store is None:
+            return {}
+
+        cached_runs = {}
+        for key in keys:
+            result = self._result_store.cached_result(key, self._with_sample, fingerprints[key])
+            if result is None:
+                continue
+            cached_runs[key] = KeyRun(
+                key=key,
+                solution_name=self.registry.get_solution(key).__name__,
+                result=result,
+                parse_time=0.0,
+                solve_time=0.0,
+                cached=True,
+            )
+        return cached_runs
+
+    def _executor(self) -> Executor:
+        if self._limits is None:
+            return ProcessPoolExecutor(max_workers=self._jobs)
+        # Supervised keys already get a process each, threads only wait for them
+        return ThreadPoolExecutor(max_workers=self._jobs)
+
+    def _submit(self, pool: Executor, key: SolKey) -> Future[KeyRun]:
+        if self._limits is None:
+            return pool.submit(
+                solve_captured,
+                key,
+                self._with_sample,
+                self._probes,
+                self._disk_cache,
+                self._trace_phases,
+            )
+        return pool.submit(
+            solve_supervised,
+            key,
+            self.registry.get_solution(key).__name__,
+            self._with_sample,
+            self._limits,
+            self._probes,
+            self._disk_cache,
+            self._trace_phases,
+        )
+
+    def _record(self, run: KeyRun, fingerprints: dict[SolKey, str]) -> None:
+        if self._result_store is not None and not run.cached and run.result is not None:
+            self._result_store.record(
+                run.key, self._with_sample, run.solution_name, run.result, fingerprints[run.key]
+            )
 
     def solve_all(self) -> None:
-        results: dict[SolKey, int] = {}
-        prev_year, prev_day, prev_part = -1, -1, -1
         total_start = perf_counter()
+        keys = self._keys_to_solve()
 
-        for key in self._to_solve:
-            if key not in self.registry:
-                continue
-            year, day, part = key
-            if year != prev_year:
-                print("=====================")
-                print(f"===== YEAR {year} =====")
-                print("=====================")
-                prev_year = year
-
-            if day != prev_day:
-                print("------------------")
-                print(f"----- DAY {day:02} -----")
-                print("------------------")
-                prev_day = day
-                prev_part = -1
-            if part != prev_part:
-                print(f"---- PART {part} ----")
-                prev_part = part
-            if self._with_sample:
-                print(">> Sample Input <<")
-            else:
-                print(">> Actual Input <<")
-            start = perf_counter()
-            result = self.solve(key)
-            results[key] = result
-            res = f"    Result: {result}    "
-            cap = "_" * (len(res) + 4)
-            bot = "-" * (len(res) + 4)
-            print(cap)
-            print(f"| {res} |")
-            print(bot)
-
-            total_time = perf_counter() - start
-            print(f"Solved in {total_time:.6f} seconds.")
-
-            if self._with_sample:
-                print("<< Sample Input End >>")
-            else:
-                print("<< Actual Input End >>")
-
-        total_duration = perf_counter() - total_start
-        print("=====================")
-        print(f"All done in {total_duration:.6f} seconds (with parsing and setup).")
+        fingerprints: dict[SolKey, str] = {}
+        if self._result_store is not None:
+            fingerprints = {
+                key: self._result_store.fingerprint(
+                    self.registry.get_solution(key), self._with_sample
+                )
+                for key in keys
+            }
+        cached_runs = self._cached_runs(keys, fingerprints)
+        runs: list[KeyRun] = []
+
+        if self._jobs == 1 and self._limits is None:
+            for key in keys:
+                # Started before solving, so direct solution prints land under the header
+                self.reporter.key_started(key, self.registry.get_solution(key).__name__)
+                run = cached_runs[key] if key in cached_runs else self._solve_in_process(key)
+                self.reporter.key_finished(run)
+                self._record(run, fingerprints)
+                runs.append(run)
+        else:
+            with self._executor() as pool:
+                futures: dict[SolKey, Future[KeyRun]] = {
+                    key: self._submit(pool, key) for key in keys if key not in cached_runs
+                }
+                # Results are consumed in submission order, so the report matches
+                # the sequential one no matter which worker finishes first
+                for key in keys:
+                    run = cached_runs[key] if key in cached_runs else futures[key].result()
+                    self.reporter.key_started(key, run.solution_name)
+                    self.reporter.key_finished(run)
+                    self._record(run, fingerprints)
+                    runs.append(run)
+
+        if self._result_store is not None:
+            self._result_store.save()
+
+        self.reporter.finish(runs, perf_counter() - total_start)
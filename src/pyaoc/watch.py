@@ -0,0 +1,120 @@
+import os
+import time
+import traceback
+from collections import defaultdict
+from pathlib import Path
+
+from pyaoc.config import CODE_ROOT_DIR, INPUTS_DIR, LIBRARY_ROOT_DIR
+from pyaoc.fingerprint import library_dependencies, module_file
+from pyaoc.input import prepare_input_path
+from pyaoc.keys import DayKey, SolKey
+from pyaoc.reloader import ModuleReloader
+from pyaoc.solution import SOLUTION_REGISTRY, SolutionRegistry
+from pyaoc.solver import Solver
+
+# (root directory, glob pattern) pairs polled for changes
+WATCH_ROOTS = [(CODE_ROOT_DIR, "y_*/d_*.py"), (LIBRARY_ROOT_DIR, "*.py"), (INPUTS_DIR, "*.txt")]
+
+
+class DependencyGraph:
+    """
+    Which days every watched file affects: a day depends on its own module, on the
+    librarium modules it imports (directly or not) and on its input file.
+    Built from import statements, so day modules do not have to be imported.
+    """
+
+    def __init__(self, registry: SolutionRegistry, with_sample: bool) -> None:
+        self.dependents: dict[Path, set[DayKey]] = defaultdict(set)
+        for day_key, module_name in registry.modules.items():
+            year, day = day_key
+            self.dependents[module_file(module_name).resolve()].add(day_key)
+            try:
+                libs = library_dependencies(module_name)
+            except SyntaxError:
+                # Broken edit, reloading the day reports it and the next save rebuilds
+                libs = []
+            for lib in libs:
+                self.dependents[module_file(lib).resolve()].add(day_key)
+            self.dependents[prepare_input_path(year, day, with_sample).resolve()].add(day_key)
+
+    def affected(self, paths: set[Path]) -> set[DayKey]:
+        return {day_key for path in paths for day_key in self.dependents.get(path.resolve(), ())}
+
+
+def scan_mtimes(roots: list[tuple[Path, str]]) -> dict[Path, int]:
+    mtimes = {}
+    for root, pattern in roots:
+        for path in root.rglob(pattern):
+            try:
+                mtimes[path.resolve()] = os.stat(path).st_mtime_ns
+            except FileNotFoundError:
+                # Removed between listing and stat, next poll reports it
+                continue
+    return mtimes
+
+
+class Watcher:
+    """
+    Polls day modules, librarium and inputs with os.stat and re-solves only the keys
+    depending on changed files. Changed modules are reloaded in process.
+    """
+
+    def __init__(
+        self,
+        to_solve: list[SolKey],
+        with_sample: bool = True,
+        roots: list[tuple[Path, str]] | None = None,
+    ) -> None:
+        self._to_solve = to_solve
+        self._with_sample = with_sample
+        self._roots = roots if roots is not None else WATCH_ROOTS
+        self.registry = SOLUTION_REGISTRY
+        self.reloader = ModuleReloader(self.registry)
+        self.graph = DependencyGraph(self.registry, with_sample)
+        self._mtimes = scan_mtimes(self._roots)
+
+    def poll(self) -> set[Path]:
+        current = scan_mtimes(self._roots)
+        changed = {
+            path
+            for path in current.keys() | self._mtimes.keys()
+            if current.get(path) != self._mtimes.get(path)
+        }
+        self._mtimes = current
+        return changed
+
+    def affected_keys(self, changed: set[Path]) -> list[SolKey]:
+        if any(path.suffix == ".py" for path in changed):
+            # Imports may have changed too, as well as the set of day files
+            self.registry.rescan()
+            self.graph = DependencyGraph(self.registry, self._with_sample)
+        affected_days = self.graph.affected(changed)
+        return [key for key in self._to_solve if (key[0], key[1]) in affected_days]
+
+    def _solve(self, keys: list[SolKey]) -> None:
+        try:
+            for module_name in self.reloader.reload_changed():
+                print(f"Reloaded {module_name}")
+            Solver(to_solve=keys, with_sample=self._with_sample).solve_all()
+        except Exception:
+            # A broken edit must not stop watching, the next save gets another try
+            traceback.print_exc()
+        finally:
+            self.reloader.snapshot()
+
+    def watch(self, interval: float = 0.5) -> None:
+        self._solve(self._to_solve)
+        print(f"Watching for changes every {interval}s, press Ctrl+C to stop...")
+        while True:
+            time.sleep(interval)
+            changed = self.poll()
+            if not changed:
+                continue
+
+            keys = self.affected_keys(changed)
+            for path in sorted(changed):
+                print(f"Changed: {path}")
+            if not keys:
+                print("No watched keys depend on the changes.")
+                continue
+            self._solve(keys)
@@ -1,3 +1,5 @@
+from collections.abc import Sequence
+
 from pyaoc.input import parse_input_lines_as_ints
 from pyaoc.solution import Solution
 
@@ -19,8 +21,10 @@ class Solution200101(Solution[ParsedInput]):
     YEAR: int = 2020
     DAY: int = 1
     PART: int = 1
+    # Every pair of expenses
+    EXPECTED_EXPONENT: float = 2.0
 
-    def _parse_input(self, input_lines: list[str]) -> ParsedInput:
+    def _parse_input(self, input_lines: Sequence[str]) -> ParsedInput:
         return parse_input_lines_as_ints(input_lines)
 
     def solve(self) -> int:
@@ -32,6 +36,8 @@ class Solution200101(Solution[ParsedInput]):
 
 class Solution200102(Solution200101):
     PART: int = 2
+    # Every pair after every first expense
+    EXPECTED_EXPONENT: float = 3.0
 
     def solve(self) -> int:
         for i, x in enumerate(self.parsed_input):
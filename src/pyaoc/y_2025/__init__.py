@@ -1,36 +1,3 @@
-from pyaoc.y_2025.d_01 import Solution250101, Solution250102
-from pyaoc.y_2025.d_02 import Solution250201, Solution250202
-from pyaoc.y_2025.d_03 import Solution250301, Solution250302
-from pyaoc.y_2025.d_04 import Solution250401, Solution250402
-from pyaoc.y_2025.d_05 import Solution250501, Solution250502
-from pyaoc.y_2025.d_06 import Solution250601, Solution250602
-from pyaoc.y_2025.d_07 import Solution250701, Solution250702
-from pyaoc.y_2025.d_08 import Solution250801, Solution250802
-from pyaoc.y_2025.d_09 import Solution250901, Solution250902
-from pyaoc.y_2025.d_10 import Solution251001, Solution251002
-from pyaoc.y_2025.d_11 import Solution251101, Solution251102
-
-__all__ = [
-    "Solution250101",
-    "Solution250102",
-    "Solution250201",
-    "Solution250202",
-    "Solution250301",
-    "Solution250302",
-    "Solution250401",
-    "Solution250402",
-    "Solution250501",
-    "Solution250502",
-    "Solution250601",
-    "Solution250602",
-    "Solution250701",
-    "Solution250702",
-    "Solution250801",
-    "Solution250802",
-    "Solution250901",
-    "Solution250902",
-    "Solution251001",
-    "Solution251002",
-    "Solution251101",
-    "Solution251102",
-]
+# Day modules are imported lazily by SOLUTION_REGISTRY, which also checks that
+# every solution class registered from y_2025/d_XX.py has matching YEAR and DAY
+YEAR = 2025
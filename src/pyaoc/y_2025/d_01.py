@@ -1,3 +1,5 @@
+from collections.abc import Sequence
+
 from librarium.modclock import CountMode, ModClock
 from pyaoc.solution import Solution
 
@@ -13,7 +15,7 @@ class Solution250101(Solution[ParsedInput]):
     DAY: int = 1
     PART: int = 1
 
-    def _parse_input(self, input_lines: list[str]) -> ParsedInput:
+    def _parse_input(self, input_lines: Sequence[str]) -> ParsedInput:
         parsed: ParsedInput = []
 
         parsed = [
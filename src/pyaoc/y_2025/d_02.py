@@ -1,3 +1,4 @@
+from collections.abc import Sequence
 from dataclasses import dataclass
 from functools import cached_property
 
@@ -148,10 +149,15 @@ class Solution250201(Solution[ParsedInput]):
     DAY: int = 2
     PART: int = 1
 
-    def _parse_input(self, input_lines: list[str]) -> ParsedInput:
+    def _parse_input(self, input_lines: Sequence[str]) -> ParsedInput:
         assert len(input_lines) == 1, "Non 1 input lines?"
         return [IDRange.from_string(s) for s in input_lines[0].split(",")]
 
+    @classmethod
+    def _copy_parsed_input(cls, parsed_input: ParsedInput) -> ParsedInput:
+        # Ranges are only read, their cached properties are derived from the bounds
+        return parsed_input
+
     def solve(self) -> int:
         all_nums = []
         for idr in self.parsed_input:
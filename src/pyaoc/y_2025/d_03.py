@@ -1,4 +1,5 @@
 from array import array
+from collections.abc import Sequence
 
 from pyaoc.input import parse_input_lines_as_lists_of_ints
 from pyaoc.solution import Solution
@@ -71,9 +72,14 @@ class Solution250301(Solution[ParsedInput]):
     DAY: int = 3
     PART: int = 1
 
-    def _parse_input(self, input_lines: list[str]) -> ParsedInput:
+    def _parse_input(self, input_lines: Sequence[str]) -> ParsedInput:
         return parse_input_lines_as_lists_of_ints(input_lines)
 
+    @classmethod
+    def _copy_parsed_input(cls, parsed_input: ParsedInput) -> ParsedInput:
+        # Rows are only read, digits are collected in a separate jolts array
+        return parsed_input
+
     def solve(self) -> int:
         total = 0
         jolts = array("b", [0, 0])
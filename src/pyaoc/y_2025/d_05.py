@@ -1,3 +1,5 @@
+from collections.abc import Sequence
+
 from librarium.drange import DynamicRange, MultiRange
 from pyaoc.input import parse_input_lines_as_ints
 from pyaoc.solution import Solution
@@ -5,7 +7,7 @@ from pyaoc.solution import Solution
 type ParsedInput = tuple[MultiRange, list[int]]
 
 
-def _parse_ranges(input_lines: list[str]) -> list[DynamicRange]:
+def _parse_ranges(input_lines: Sequence[str]) -> list[DynamicRange]:
     ranges = []
     for line in input_lines:
         start_str, end_str = line.split("-")
@@ -13,7 +15,7 @@ def _parse_ranges(input_lines: list[str]) -> list[DynamicRange]:
     return ranges
 
 
-def _parse_inp(input_lines: list[str]) -> ParsedInput:
+def _parse_inp(input_lines: Sequence[str]) -> ParsedInput:
     br_point = None
     for i, line in enumerate(input_lines):
         if line.strip() == "":
@@ -33,8 +35,10 @@ class Solution250501(Solution[ParsedInput]):
     YEAR: int = 2025
     DAY: int = 5
     PART: int = 1
+    # Every ingredient is looked up in every range
+    EXPECTED_EXPONENT: float = 2.0
 
-    def _parse_input(self, input_lines: list[str]) -> ParsedInput:
+    def _parse_input(self, input_lines: Sequence[str]) -> ParsedInput:
         return _parse_inp(input_lines)
 
     def solve(self) -> int:
@@ -48,6 +52,8 @@ class Solution250501(Solution[ParsedInput]):
 
 class Solution250502(Solution250501):
     PART: int = 2
+    # Ranges are merged once, in n log n
+    EXPECTED_EXPONENT: float = 1.0
 
     def solve(self) -> int:
         m_range, _ = self.parsed_input
@@ -1,3 +1,5 @@
+from collections.abc import Sequence
+
 from pyaoc.solution import Solution
 
 type ParsedInput = list[str]  # We don't want to parse it here
@@ -38,8 +40,9 @@ class Solution250601(Solution[ParsedInput]):
     DAY: int = 6
     PART: int = 1
 
-    def _parse_input(self, input_lines: list[str]) -> ParsedInput:
-        return input_lines
+    def _parse_input(self, input_lines: Sequence[str]) -> ParsedInput:
+        # Solutions index lines char by char, so decode them once
+        return list(input_lines)
 
     def solve(self) -> int:
         operations = _parse_operations(self.parsed_input[-1])
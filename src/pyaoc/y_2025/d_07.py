@@ -1,21 +1,25 @@
+from collections.abc import Sequence
+
 from librarium.sparse_arr import SparseArray
 from pyaoc.input import parse_input_lines_as_columns
 from pyaoc.solution import Solution
 
-type ParsedInput = list[SparseArray[str]]
+type SparseColumns = list[SparseArray[str]]
+type ParsedInput = tuple[SparseColumns, int]  # (sparse columns, start column)
 
 
-def _parse_sparse(input_lines: list[str]) -> tuple[ParsedInput, int]:
+def _parse_sparse(input_lines: Sequence[str]) -> ParsedInput:
     start_col = None
-    for i, c in enumerate(input_lines[0]):
+    first_line = input_lines[0]
+    for i, c in enumerate(first_line):
         if c != "S":
             continue
         start_col = i
-        input_lines[0] = input_lines[0][:i] + "." + input_lines[0][i + 1 :]
+        first_line = first_line[:i] + "." + first_line[i + 1 :]
         break
 
-    rows, cols = len(input_lines), len(input_lines[0])
-    col_lines = parse_input_lines_as_columns(input_lines)
+    rows, cols = len(input_lines), len(first_line)
+    col_lines = parse_input_lines_as_columns([first_line, *input_lines[1:]])
     sparse_columns = []
     for line in col_lines:
         assert len(line) == rows
@@ -26,7 +30,7 @@ def _parse_sparse(input_lines: list[str]) -> tuple[ParsedInput, int]:
     return sparse_columns, start_col
 
 
-def _run_tachyon_mainfold(sparse_columns: ParsedInput, start_col: int) -> int:
+def _run_tachyon_mainfold(sparse_columns: SparseColumns, start_col: int) -> int:
     total_splits, cur_row = 0, 0
 
     # Dict to preserve order of beams (left to right), but also column presence lookup
@@ -72,7 +76,7 @@ def _run_tachyon_mainfold(sparse_columns: ParsedInput, start_col: int) -> int:
     return total_splits
 
 
-def _run_quantum_tachyon_mainfold(sparse_columns: ParsedInput, start_col: int) -> int:
+def _run_quantum_tachyon_mainfold(sparse_columns: SparseColumns, start_col: int) -> int:
     total_rows = sparse_columns[0].length
 
     final_timelines = 0
@@ -126,22 +130,25 @@ class Solution250701(Solution[ParsedInput]):
     DAY: int = 7
     PART: int = 1
 
-    def _parse_input(self, input_lines: list[str]) -> ParsedInput:
-        sparse_columns, start_col = _parse_sparse(input_lines)
-        self.start_col = start_col
-        return sparse_columns
+    def _parse_input(self, input_lines: Sequence[str]) -> ParsedInput:
+        return _parse_sparse(input_lines)
+
+    @classmethod
+    def _copy_parsed_input(cls, parsed_input: ParsedInput) -> ParsedInput:
+        # Sparse columns are only read while following the beams
+        return parsed_input
 
     def solve(self) -> int:
-        assert hasattr(self, "start_col")
-        return _run_tachyon_mainfold(self.parsed_input, self.start_col)
+        sparse_columns, start_col = self.parsed_input
+        return _run_tachyon_mainfold(sparse_columns, start_col)
 
 
 class Solution250702(Solution250701):
     PART: int = 2
 
     def solve(self) -> int:
-        assert hasattr(self, "start_col")
-        return _run_quantum_tachyon_mainfold(self.parsed_input, self.start_col)
+        sparse_columns, start_col = self.parsed_input
+        return _run_quantum_tachyon_mainfold(sparse_columns, start_col)
 
 
 Solution250701.register()
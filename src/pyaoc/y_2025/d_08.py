@@ -1,9 +1,12 @@
 import heapq
+from collections.abc import Sequence
 from functools import partial
+from itertools import batched
 from math import ceil, log, sqrt
 from typing import NamedTuple
 
 from librarium.unionfind import UnionFind
+from pyaoc.input import parse_input_as_int_rows
 from pyaoc.solution import Solution
 
 
@@ -104,7 +107,7 @@ class Schema:
         return self._circuits[point]
 
 
-def _parse_input(input_lines: list[str]) -> tuple[DistHeap, list[Point]]:
+def _parse_input(input_lines: Sequence[str]) -> tuple[DistHeap, list[Point]]:
     prev_points: list[Point] = []
     distances: DistHeap = []
     # We only keep O(N log N) local edges by connecting each point
@@ -119,8 +122,9 @@ def _parse_input(input_lines: list[str]) -> tuple[DistHeap, list[Point]]:
         dx_sq, dy_sq, dz_sq = (dp1.x - dp2.x) ** 2, (dp1.y - dp2.y) ** 2, (dp1.z - dp2.z) ** 2
         return sqrt(dx_sq + dy_sq + dz_sq)
 
-    for line in input_lines:
-        point = Point(*[int(v) for v in line.split(",")])
+    coords = parse_input_as_int_rows(input_lines, 3)
+    for x, y, z in batched(coords, 3, strict=True):
+        point = Point(x, y, z)
         p_cd = partial(_calc_dist, point)
 
         for dist, exst_p in heapq.nsmallest(
@@ -136,24 +140,36 @@ class Solution250801(Solution[ParsedInput]):
     YEAR: int = 2025
     DAY: int = 8
     PART: int = 1
+    CACHE_PARSED_ON_DISK: bool = True
+    # Parsing measures the distance from every point to all previous ones
+    EXPECTED_EXPONENT: float = 2.0
 
-    def _parse_input(self, input_lines: list[str]) -> ParsedInput:
+    def _parse_input(self, input_lines: Sequence[str]) -> ParsedInput:
         return _parse_input(input_lines)
 
+    @classmethod
+    def _copy_parsed_input(cls, parsed_input: ParsedInput) -> ParsedInput:
+        # Part 2 pops from the heap, but its entries and points are immutable tuples,
+        # so shallow copies of the containers are enough
+        dist_heap, points = parsed_input
+        return dist_heap.copy(), points.copy()
+
     def solve(self) -> int:
         dist_heap, points = self.parsed_input
         schema = Schema(init_points=points)
 
         iters = 10 if self.with_sample else 1_000
 
-        for _, (p1, p2) in heapq.nsmallest(iters, dist_heap):
-            schema.connect(p1, p2)
+        with self.phase("connect"):
+            for _, (p1, p2) in heapq.nsmallest(iters, dist_heap):
+                schema.connect(p1, p2)
 
-        a, b, c = heapq.nlargest(
-            TOP_K_1,
-            schema.unique_circuits.items(),
-            key=lambda item: item[1],
-        )
+        with self.phase("largest"):
+            a, b, c = heapq.nlargest(
+                TOP_K_1,
+                schema.unique_circuits.items(),
+                key=lambda item: item[1],
+            )
         return a[1] * b[1] * c[1]
 
 
@@ -173,17 +189,19 @@ class Solution250802(Solution250801):
 
     def solve(self) -> int:
         dist_heap, points = self.parsed_input
-        unfn = UnionFind(init_elements=points)
+        with self.phase("union_find"):
+            unfn = UnionFind(init_elements=points)
 
         p1, p2 = points[0], points[0]
         # In minimum spanning tree, we need exactly (N-1) edges to connect N points
         mst_edges = len(points) - 1
         total = 0
-        while mst_edges:
-            total += 1
-            _, (p1, p2) = heapq.heappop(dist_heap)
-            if unfn.union(p1, p2):
-                mst_edges -= 1
+        with self.phase("mst"):
+            while mst_edges:
+                total += 1
+                _, (p1, p2) = heapq.heappop(dist_heap)
+                if unfn.union(p1, p2):
+                    mst_edges -= 1
 
         return p1.x * p2.x
 
@@ -1,6 +1,9 @@
 from collections import defaultdict
+from collections.abc import Sequence
+from itertools import batched
 from typing import NamedTuple
 
+from pyaoc.input import parse_input_as_int_rows
 from pyaoc.solution import Solution
 
 type ParsedInput = list[Point]
@@ -10,11 +13,6 @@ class Point(NamedTuple):
     x: int
     y: int
 
-    @classmethod
-    def from_str(cls, s: str) -> "Point":
-        x_str, y_str = s.split(",")
-        return cls(int(x_str), int(y_str))
-
     def deltas(self, other: "Point") -> tuple[int, int]:
         return other.x - self.x, other.y - self.y
 
@@ -163,9 +161,18 @@ class Solution250901(Solution[ParsedInput]):
     YEAR: int = 2025
     DAY: int = 9
     PART: int = 1
+    # Rectangles between every pair of hull points
+    EXPECTED_EXPONENT: float = 2.0
+
+    def _parse_input(self, input_lines: Sequence[str]) -> ParsedInput:
+        return [
+            Point(x, y) for x, y in batched(parse_input_as_int_rows(input_lines, 2), 2, strict=True)
+        ]
 
-    def _parse_input(self, input_lines: list[str]) -> ParsedInput:
-        return [Point.from_str(line) for line in input_lines]
+    @classmethod
+    def _copy_parsed_input(cls, parsed_input: ParsedInput) -> ParsedInput:
+        # GridConvexHull sorts points in place, points themselves are immutable
+        return parsed_input.copy()
 
     def solve(self) -> int:
         hull = GridConvexHull(self.parsed_input)
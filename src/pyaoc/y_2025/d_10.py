@@ -1,5 +1,6 @@
 import re
 from collections import deque
+from collections.abc import Sequence
 from functools import lru_cache
 from typing import NamedTuple
 
@@ -50,7 +51,7 @@ def _parse_bit_masks(num_str: str, buttons: list[tuple[int, ...]]) -> list[int]:
     return bit_buttons
 
 
-def _parse_input(input_lines: list[str]) -> ParsedInput:
+def _parse_input(input_lines: Sequence[str]) -> ParsedInput:
     parsed: ParsedInput = []
     for line in input_lines:
         matches = pattern.match(line)
@@ -162,9 +163,14 @@ class Solution251001(Solution[ParsedInput]):
     DAY: int = 10
     PART: int = 1
 
-    def _parse_input(self, input_lines: list[str]) -> ParsedInput:
+    def _parse_input(self, input_lines: Sequence[str]) -> ParsedInput:
         return _parse_input(input_lines)
 
+    @classmethod
+    def _copy_parsed_input(cls, parsed_input: ParsedInput) -> ParsedInput:
+        # Machines are only read, the searches keep their state in their own lists
+        return parsed_input
+
     def solve(self) -> int:
         total_steps = 0
         for buttons in self.parsed_input:
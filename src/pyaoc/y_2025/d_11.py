@@ -1,4 +1,5 @@
 from collections import defaultdict
+from collections.abc import Sequence
 from functools import cached_property
 from typing import Iterator
 
@@ -76,7 +77,7 @@ class DAG:
 type ParsedInput = DAG
 
 
-def _parse_input(input_lines: list[str]) -> ParsedInput:
+def _parse_input(input_lines: Sequence[str]) -> ParsedInput:
     dag = DAG()
     for line in input_lines:
         parent, children_raw = line.split(": ")
@@ -119,10 +120,17 @@ class Solution251101(Solution[ParsedInput]):
     YEAR: int = 2025
     DAY: int = 11
     PART: int = 1
+    # Paths are counted per depth layer, a device is visited at every depth reaching it
+    EXPECTED_EXPONENT: float = 2.0
 
-    def _parse_input(self, input_lines: list[str]) -> ParsedInput:
+    def _parse_input(self, input_lines: Sequence[str]) -> ParsedInput:
         return _parse_input(input_lines)
 
+    @classmethod
+    def _copy_parsed_input(cls, parsed_input: ParsedInput) -> ParsedInput:
+        # The DAG is only walked, and deep copying a long chain of nodes would recurse
+        return parsed_input
+
     def solve(self) -> int:
         dag = self.parsed_input
         _, all_paths = _layers(dag, start="you", end="out")
@@ -150,7 +158,7 @@ hhh: out
 class Solution251102(Solution251101):
     PART: int = 2
 
-    def _parse_input(self, input_lines: list[str]) -> ParsedInput:
+    def _parse_input(self, input_lines: Sequence[str]) -> ParsedInput:
         actual_input_lines = SPECIAL_P2_SAMPLE.copy() if self.with_sample else input_lines
         return super()._parse_input(actual_input_lines)
 
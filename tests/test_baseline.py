@@ -0,0 +1,49 @@
+import pytest
+
+from pyaoc.baseline import BaselineStore, mann_whitney_greater
+from pyaoc.bench import KeyBench
+
+
+class TestMannWhitney:
+    def test_clearly_slower_is_significant(self):
+        assert mann_whitney_greater([10, 11, 12, 13, 14], [1, 2, 3, 4, 5]) < 0.01
+
+    def test_clearly_faster_is_not_significant(self):
+        assert mann_whitney_greater([1, 2, 3, 4, 5], [10, 11, 12, 13, 14]) > 0.99
+
+    def test_identical_samples(self):
+        assert mann_whitney_greater([5, 5, 5], [5, 5, 5]) == 1.0
+
+    def test_empty_sample(self):
+        with pytest.raises(ValueError):
+            mann_whitney_greater([], [1])
+
+
+def _key_bench(parse: list[int], solve: list[int]) -> KeyBench:
+    return KeyBench(
+        key=(2025, 4, 2),
+        solution_name="Solution250402",
+        result=0,
+        parse_samples=parse,
+        solve_samples=solve,
+    )
+
+
+class TestBaselineStore:
+    def test_roundtrip_and_compare(self, tmp_path):
+        path = tmp_path / "baselines.json"
+        store = BaselineStore(path)
+        store.save("abc1234", [_key_bench([10] * 5, [100, 101, 99, 100, 102])], sample=False)
+
+        store = BaselineStore(path)
+        assert store.revisions() == ["abc1234"]
+        assert store.resolve_revision("latest", current="def5678") == "abc1234"
+        assert store.resolve_revision("latest", current="abc1234") is None
+
+        slower = _key_bench([10] * 5, [150, 151, 149, 152, 150])
+        regressions = store.compare("abc1234", [slower], sample=False)
+        assert [r.key for r in regressions] == [(2025, 4, 2)]
+
+        same = _key_bench([10] * 5, [100, 100, 101, 99, 100])
+        assert store.compare("abc1234", [same], sample=False) == []
+        assert store.compare("abc1234", [slower], sample=True) == []
@@ -0,0 +1,55 @@
+import pytest
+
+from pyaoc.bench import Bencher, BenchStats
+from pyaoc.solution import SOLUTION_REGISTRY
+
+
+class TestBenchStats:
+    def test_aggregates(self):
+        stats = BenchStats.from_samples([4, 1, 10, 3, 2])
+        assert stats.min_ns == 1
+        assert stats.median_ns == 3
+        assert stats.p95_ns == pytest.approx(8.8)
+        assert stats.stddev_ns == pytest.approx(3.5355339)
+
+    def test_single_sample_has_no_spread(self):
+        assert BenchStats.from_samples([7]) == BenchStats(7, 7, 7.0, 0.0)
+
+    def test_empty_samples(self):
+        with pytest.raises(ValueError):
+            BenchStats.from_samples([])
+
+
+class TestBencher:
+    def test_warmup_runs_are_not_sampled(self, monkeypatch):
+        solution_cls = SOLUTION_REGISTRY.get_solution((2025, 1, 1))
+        solves = []
+
+        class _Counted(solution_cls):
+            def solve(self) -> int:
+                solves.append(self)
+                return super().solve()
+
+        monkeypatch.setattr(SOLUTION_REGISTRY, "get_solution", lambda key: _Counted)
+        key_bench = Bencher(to_solve=[(2025, 1, 1)], warmup=2, repeat=3).bench((2025, 1, 1))
+
+        assert len(solves) == 5
+        # A fresh instance per run, so parsing is measured every time
+        assert len({id(solution) for solution in solves}) == 5
+        assert len(key_bench.parse_samples) == len(key_bench.solve_samples) == 3
+        assert key_bench.result == 3
+        assert key_bench.parse.min_ns == min(key_bench.parse_samples)
+
+    def test_json_keeps_samples(self):
+        bencher = Bencher(to_solve=[(2025, 1, 1)], warmup=0, repeat=2)
+        data = bencher.to_json(bencher.bench_all())
+        assert (data["warmup"], data["repeat"]) == (0, 2)
+        (result,) = data["results"]
+        assert len(result["solve"]["samples_ns"]) == 2
+        assert result["solve"]["min_ns"] == min(result["solve"]["samples_ns"])
+
+    def test_invalid_counts(self):
+        with pytest.raises(ValueError):
+            Bencher(to_solve=[], warmup=-1)
+        with pytest.raises(ValueError):
+            Bencher(to_solve=[], repeat=0)
@@ -0,0 +1,68 @@
+import random
+
+import pytest
+
+from librarium.bitboard import BitBoard
+from librarium.grid import DOWN, FULL_GRID, RIGHT, Position
+from pyaoc.solution import SOLUTION_REGISTRY
+
+
+def _brute_neighbor_counts(rows: list[str]) -> list[list[int]]:
+    n_rows, n_cols = len(rows), len(rows[0])
+    return [
+        [
+            sum(
+                1
+                for d_row, d_col in FULL_GRID
+                if 0 <= r + d_row < n_rows
+                and 0 <= c + d_col < n_cols
+                and rows[r + d_row][c + d_col] == "#"
+            )
+            for c in range(n_cols)
+        ]
+        for r in range(n_rows)
+    ]
+
+
+class TestBitBoard:
+    def test_roundtrip_and_cells(self):
+        rows = ["#..#", ".##.", "#..."]
+        board = BitBoard.from_rows(rows, on="#")
+        assert board.to_string() == "\n".join(rows) + "\n"
+        assert board.count() == 5
+        assert board.get(Position(1, 2))
+        assert not board.get(Position(2, 3))
+        assert list(board.positions())[:2] == [Position(0, 0), Position(0, 3)]
+
+        board.set(Position(2, 3), True)
+        assert board.get(Position(2, 3))
+        with pytest.raises(IndexError):
+            board.get(Position(3, 0))
+
+    def test_shifts_do_not_wrap_rows(self):
+        board = BitBoard.from_rows(["..#", "#..", "..."], on="#")
+        assert board.shifted(RIGHT).to_string() == ".#.\n...\n...\n"
+        assert board.shifted(DOWN).to_string() == "#..\n...\n...\n"
+        assert (~board).count() == 7
+
+    def test_neighbor_counts_match_brute_force(self):
+        rng = random.Random(4)
+        for _ in range(50):
+            n_rows, n_cols = rng.randint(1, 8), rng.randint(1, 8)
+            rows = ["".join(rng.choice("#.") for _ in range(n_cols)) for _ in range(n_rows)]
+            counts = BitBoard.from_rows(rows, on="#").neighbor_counts()
+            expected = _brute_neighbor_counts(rows)
+            for limit in range(10):
+                less = counts.less_than(limit)
+                for r in range(n_rows):
+                    for c in range(n_cols):
+                        assert less.get(Position(r, c)) == (expected[r][c] < limit)
+                assert counts.at_least(limit) == ~less
+
+
+def test_day_4_sample():
+    results = [
+        SOLUTION_REGISTRY.prepare_solution_instance((2025, 4, part), sample=True).solve()
+        for part in (1, 2)
+    ]
+    assert results == [13, 43]
@@ -0,0 +1,51 @@
+import threading
+
+import pytest
+
+from pyaoc.client import (
+    SHUTDOWN,
+    SOLVE,
+    DaemonError,
+    key_run_from_json,
+    key_run_to_json,
+    request,
+)
+from pyaoc.daemon import SolveServer
+from pyaoc.runs import KeyRun
+from pyaoc.solver import Solver
+
+
+@pytest.fixture
+def server(tmp_path):
+    server = SolveServer(tmp_path / "d.sock")
+    thread = threading.Thread(target=server.serve_until_shutdown)
+    thread.start()
+    yield server
+    request({"command": SHUTDOWN}, socket_path=server.socket_path)
+    thread.join(timeout=5)
+    assert not server.socket_path.exists()
+
+
+def test_key_run_json_roundtrip():
+    run = KeyRun((2025, 1, 2), "Solution250102", 6, 0.5, 0.25, output="hi\n")
+    assert key_run_from_json(key_run_to_json(run)) == run
+
+
+def test_solve_matches_in_process(server):
+    response = request(
+        {"command": SOLVE, "keys": [[2025, 1, 1], [2025, 25, 1]], "sample": True},
+        socket_path=server.socket_path,
+    )
+    runs = [key_run_from_json(r) for r in response["runs"]]
+
+    assert [run.key for run in runs] == [(2025, 1, 1)]
+    assert runs[0].result == Solver(to_solve=[], with_sample=True).solve((2025, 1, 1)).result
+
+
+def test_errors_are_reported(server, tmp_path):
+    with pytest.raises(DaemonError, match="Unknown command"):
+        request({"command": "nope"}, socket_path=server.socket_path)
+    with pytest.raises(DaemonError, match="already listening"):
+        SolveServer(server.socket_path)
+    with pytest.raises(DaemonError, match="No daemon"):
+        request({"command": SOLVE}, socket_path=tmp_path / "missing.sock")
@@ -0,0 +1,42 @@
+import sys
+
+from pyaoc.fingerprint import combine_digests, imported_modules, library_dependencies
+
+
+def test_imported_modules(tmp_path):
+    path = tmp_path / "mod.py"
+    path.write_text(
+        "import heapq\n"
+        "from librarium.grid import Grid\n"
+        "from librarium import drange\n"
+        "from . import sibling\n"
+    )
+    assert imported_modules(path) == {
+        "heapq",
+        "librarium.grid",
+        "librarium.grid.Grid",
+        "librarium",
+        "librarium.drange",
+    }
+
+
+def test_library_dependencies_are_transitive(tmp_path, monkeypatch):
+    lib = tmp_path / "fakelib"
+    lib.mkdir()
+    (lib / "base.py").write_text("VALUE = 1\n")
+    (lib / "mid.py").write_text("from fakelib.base import VALUE\n")
+    (lib / "unused.py").write_text("")
+    (tmp_path / "fake_day.py").write_text("import heapq\nfrom fakelib import mid\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    for name in ("fakelib", "fakelib.base", "fakelib.mid", "fake_day"):
+        monkeypatch.delitem(sys.modules, name, raising=False)
+
+    assert library_dependencies("fake_day", packages=("fakelib",)) == [
+        "fakelib.base",
+        "fakelib.mid",
+    ]
+
+
+def test_combined_digest_ignores_order():
+    assert combine_digests({"a": "1", "b": "2"}) == combine_digests({"b": "2", "a": "1"})
+    assert combine_digests({"a": "1", "b": "2"}) != combine_digests({"a": "2", "b": "1"})
@@ -0,0 +1,42 @@
+import pytest
+
+from pyaoc.gen import GENERATORS, get_generator, write_input
+from pyaoc.input import InputBuffer, InputLines
+from pyaoc.solution import SOLUTION_REGISTRY
+
+
+def test_same_seed_same_input():
+    for generator in GENERATORS.values():
+        size = max(20, generator.min_size)
+        assert list(generator.lines(size, seed=3)) == list(generator.lines(size, seed=3))
+        assert list(generator.lines(size, seed=3)) != list(generator.lines(size, seed=4))
+
+
+@pytest.mark.parametrize("day_key", sorted(GENERATORS))
+def test_generated_input_is_solvable(tmp_path, day_key):
+    year, day = day_key
+    size = max(30, get_generator(year, day).min_size)
+    path = write_input(year, day, size, seed=1, path=tmp_path / "input.txt")
+    for key in SOLUTION_REGISTRY.all_keys():
+        if key[:2] != day_key:
+            continue
+        solution_cls = SOLUTION_REGISTRY.get_solution(key)
+        solution = solution_cls(InputLines(InputBuffer(path)), sample=False)
+        assert isinstance(solution.solve(), int)
+
+
+def test_red_tiles_polygon_is_rectilinear():
+    lines = list(get_generator(2025, 9).lines(50, seed=2))
+    points = [tuple(map(int, line.split(","))) for line in lines]
+    for a, b in zip(points, points[1:] + points[:1], strict=True):
+        assert a[0] == b[0] or a[1] == b[1]
+
+
+def test_non_positive_size_is_rejected():
+    with pytest.raises(ValueError):
+        get_generator(2025, 1).lines(0)
+
+
+def test_size_below_minimum_is_rejected():
+    with pytest.raises(ValueError, match="at least 1003 points"):
+        get_generator(2025, 8).lines(1_002)
@@ -0,0 +1,250 @@
+import subprocess
+import sys
+
+import pytest
+
+from librarium.grid import (
+    DIAG,
+    FULL_GRID,
+    GRID_DIRS,
+    HAS_NUMPY,
+    UNREACHED,
+    Grid,
+    PosDelta,
+    Position,
+    _index_typecode,
+)
+
+
+class TestGridStorage:
+    def test_get_set_and_bounds(self):
+        grid = Grid(rows=2, cols=3, default_value=0)
+        grid.set(Position(1, 2), 7)
+        assert grid.get(Position(1, 2)) == 7
+        assert grid.get(Position(0, 0)) == 0
+        with pytest.raises(IndexError):
+            grid.get(Position(2, 0))
+        with pytest.raises(IndexError):
+            grid.set(Position(0, -1), 1)
+
+    def test_iteration_is_row_major_with_positions(self):
+        grid = Grid.from_values([[1, 2], [3, 4]], default_value=0)
+        assert list(grid) == [
+            (Position(0, 0), 1),
+            (Position(0, 1), 2),
+            (Position(1, 0), 3),
+            (Position(1, 1), 4),
+        ]
+        assert list(grid.iter_positions()) == [pos for pos, _ in grid]
+        assert list(grid.iter_values()) == [1, 2, 3, 4]
+        assert list(grid.filter(lambda v: v % 2 == 0)) == [(Position(0, 1), 2), (Position(1, 1), 4)]
+
+    def test_factory_default_creates_a_value_per_cell(self):
+        grid = Grid(rows=1, cols=2, default_value=list)
+        grid.get(Position(0, 0)).append(1)
+        assert grid.get(Position(0, 1)) == []
+
+    def test_typed_storage(self):
+        grid = Grid.from_values([list("ab"), list("cd")], default_value=".", typecode="w")
+        assert grid.to_string() == "ab\ncd\n"
+        grid.set(Position(0, 0), "x")
+        assert grid.get(Position(0, 0)) == "x"
+
+        numbers = Grid(rows=2, cols=2, default_value=0, typecode="q")
+        numbers.set(Position(1, 1), 2**40)
+        assert list(numbers.iter_values()) == [0, 0, 0, 2**40]
+        with pytest.raises(TypeError):
+            Grid(rows=1, cols=1, default_value=int, typecode="q")
+
+    def test_ragged_rows_are_rejected(self):
+        with pytest.raises(ValueError):
+            Grid.from_values([[1, 2], [3]], default_value=0)
+
+
+class TestGridNeighbors:
+    def test_neighbors_stay_in_bounds(self):
+        grid = Grid.from_values([[1, 2, 3], [4, 5, 6]], default_value=0)
+        assert list(grid.neighbors(Position(0, 0))) == [Position(0, 1), Position(1, 0)]
+        assert sorted(grid.neigh_values(Position(0, 1), FULL_GRID)) == [1, 3, 4, 5, 6]
+        assert list(grid.neigh_values_filter(Position(1, 1), lambda v: v > 4)) == [6]
+        assert list(
+            grid.neighbors_with_values_filter(Position(1, 1), lambda v: v < 2, FULL_GRID)
+        ) == [(Position(0, 0), 1)]
+        assert list(grid.neigh_filter(Position(0, 2), lambda v: v == 6)) == [Position(1, 2)]
+        assert list(grid.neighbors_with_values(Position(1, 2))) == [
+            (Position(0, 2), 3),
+            (Position(1, 1), 5),
+        ]
+
+
+class TestNeighborTable:
+    @pytest.mark.parametrize("directions", [GRID_DIRS, DIAG, FULL_GRID])
+    def test_matches_position_neighbors(self, directions):
+        grid = Grid(rows=4, cols=5, default_value=0)
+        table = grid.neighbor_table(directions)
+        for idx in range(grid.rows * grid.cols):
+            expected = [grid.to_idx(n) for n in grid.neighbors(grid.pos_from_idx(idx), directions)]
+            assert list(table.targets[table.offsets[idx] : table.offsets[idx + 1]]) == expected
+            assert list(grid.neighbors_idx(idx, directions)) == expected
+
+    def test_tables_are_cached_per_grid(self):
+        first = Grid(rows=3, cols=3, default_value=0)
+        second = Grid(rows=3, cols=3, default_value=".")
+        assert first.neighbor_table(FULL_GRID) is first.neighbor_table(list(FULL_GRID))
+        assert first.neighbor_table(FULL_GRID) is not first.neighbor_table(GRID_DIRS)
+        assert first.neighbor_table(FULL_GRID) is not second.neighbor_table(FULL_GRID)
+        assert first.neighbor_table(FULL_GRID) == second.neighbor_table(FULL_GRID)
+
+    def test_offsets_widen_with_the_neighbor_count(self):
+        # 2**28 cells fit 32-bit targets, but eight neighbors each overflow the offsets
+        size = 2**28
+        assert _index_typecode(size) == "i"
+        assert _index_typecode(len(FULL_GRID) * size) == "q"
+        table = Grid(rows=2, cols=2, default_value=0).neighbor_table(FULL_GRID)
+        assert table.offsets.typecode == table.targets.typecode == "i"
+
+    def test_index_access(self):
+        grid = Grid(rows=2, cols=2, default_value=0)
+        grid.set_idx(3, 9)
+        assert grid.get(Position(1, 1)) == 9
+        assert grid.get_idx(3) == 9
+
+
+MAZE = [
+    "S.#.",
+    ".##.",
+    "....",
+]
+
+
+class TestIndexTraversal:
+    def _maze(self) -> Grid[str]:
+        return Grid.from_values([list(row) for row in MAZE], default_value="#")
+
+    def test_bfs_distances_and_path(self):
+        grid = self._maze()
+        walk = grid.bfs_idx([0], passable=lambda v: v != "#")
+        assert walk.distances[grid.to_idx(Position(0, 3))] == 7
+        assert walk.distances[grid.to_idx(Position(0, 2))] == UNREACHED
+        assert walk.found is None
+        path = walk.path_to(grid.to_idx(Position(0, 3)))
+        assert [grid.pos_from_idx(idx) for idx in path[:3]] == [
+            Position(0, 0),
+            Position(1, 0),
+            Position(2, 0),
+        ]
+        assert len(path) == 8
+        with pytest.raises(ValueError):
+            walk.path_to(grid.to_idx(Position(0, 2)))
+
+    def test_multi_source_and_early_exit(self):
+        grid = self._maze()
+        corners = [grid.to_idx(Position(0, 0)), grid.to_idx(Position(0, 3))]
+        walk = grid.bfs_idx(corners, passable=lambda v: v != "#")
+        assert walk.distances[grid.to_idx(Position(2, 2))] == 3
+
+        bottom_right = grid.to_idx(Position(2, 3))
+        early = grid.bfs_idx([0], passable=lambda v: v != "#", target=lambda i: i == bottom_right)
+        assert early.found == bottom_right
+        assert early.distances[bottom_right] == 5
+        assert early.distances[grid.to_idx(Position(0, 3))] == UNREACHED
+
+    def test_dfs_visits_every_reachable_cell_once(self):
+        grid = self._maze()
+        walk = grid.dfs_idx([0], passable=lambda v: v != "#")
+        assert sorted(walk.order) == sorted(i for i, v in enumerate(grid.iter_values()) if v != "#")
+        for idx in walk.order[1:]:
+            assert walk.distances[idx] == walk.distances[walk.parents[idx]] + 1
+
+    def test_zero_one_bfs(self):
+        # Walls cost 1 to break through, open cells are free
+        grid = self._maze()
+        walk = grid.zero_one_bfs_idx([0], weight=lambda _, to: int(grid.get_idx(to) == "#"))
+        assert walk.distances[grid.to_idx(Position(0, 2))] == 1
+        assert walk.distances[grid.to_idx(Position(0, 3))] == 0
+        path = walk.path_to(grid.to_idx(Position(0, 2)))
+        assert sum(grid.get_idx(idx) == "#" for idx in path) == 1
+        with pytest.raises(ValueError):
+            grid.zero_one_bfs_idx([0], weight=lambda _, __: 2)
+
+
+BACKENDS = [
+    pytest.param(False, id="python"),
+    pytest.param(
+        True,
+        id="numpy",
+        marks=pytest.mark.skipif(not HAS_NUMPY, reason="NumPy is not installed"),
+    ),
+]
+
+
+@pytest.mark.parametrize("use_numpy", BACKENDS)
+class TestGridWholeGridOps:
+    def test_neighbor_sum(self, use_numpy):
+        grid = Grid.from_values([[1, 2, 3], [4, 5, 6]], default_value=0, use_numpy=use_numpy)
+        assert grid.uses_numpy == use_numpy
+        assert [int(v) for v in grid.neighbor_sum().iter_values()] == [6, 9, 8, 6, 12, 8]
+        assert [int(v) for v in grid.neighbor_sum(DIAG).iter_values()] == [5, 10, 5, 2, 4, 2]
+
+    def test_convolve_with_weights_and_booleans(self, use_numpy):
+        grid = Grid.from_values(
+            [[True, False], [False, True]], default_value=False, use_numpy=use_numpy
+        )
+        shifted = grid.convolve([PosDelta(0, 1), PosDelta(0, 0)], weights=[10, 1])
+        assert [int(v) for v in shifted.iter_values()] == [1, 0, 10, 1]
+        with pytest.raises(ValueError):
+            grid.convolve(FULL_GRID, weights=[1])
+
+    def test_mask_and_select(self, use_numpy):
+        grid = Grid.from_values(
+            [list("@.@"), list("..@")], default_value=".", typecode="w", use_numpy=use_numpy
+        )
+        paper = grid.mask(lambda v: v == "@", vectorized=True)
+        assert [bool(v) for v in paper.iter_values()] == [True, False, True, False, False, True]
+        counts = paper.neighbor_sum(FULL_GRID)
+        isolated = counts.mask(lambda v: v < 1, vectorized=True)
+        assert list(grid.select(isolated)) == [(Position(0, 0), "@")]
+        assert [pos for pos, _ in grid.filter(lambda v: v == "@")] == [
+            Position(0, 0),
+            Position(0, 2),
+            Position(1, 2),
+        ]
+
+    def test_predicate_runs_once_per_cell(self, use_numpy):
+        grid = Grid.from_values([[1, 2], [3, 4]], default_value=0, use_numpy=use_numpy)
+        seen = []
+        odd = grid.mask(lambda v: seen.append(v) or v in {1, 3})
+        assert [bool(v) for v in odd.iter_values()] == [True, False, True, False]
+        assert seen == [1, 2, 3, 4]
+        with pytest.raises(ZeroDivisionError):
+            grid.mask(lambda v: 1 / 0, vectorized=True)
+
+    def test_untyped_values_are_not_truncated(self, use_numpy):
+        grid = Grid(rows=1, cols=2, default_value=".", use_numpy=use_numpy)
+        grid.set(Position(0, 1), "long")
+        grid.set(Position(0, 0), 1.5)
+        assert list(grid.iter_values()) == [1.5, "long"]
+
+
+@pytest.mark.skipif(not HAS_NUMPY, reason="NumPy is not installed")
+def test_vectorized_predicate_must_keep_the_shape():
+    grid = Grid.from_values([[1, 2], [3, 4]], default_value=0, use_numpy=True)
+    assert grid.values_array.shape == (2, 2)
+    with pytest.raises(ValueError):
+        grid.mask(lambda v: v.sum(), vectorized=True)
+
+
+@pytest.mark.skipif(not HAS_NUMPY, reason="NumPy is not installed")
+def test_numpy_dtype_follows_the_default_value():
+    def dtype_of(default_value):
+        return Grid(rows=1, cols=2, default_value=default_value, use_numpy=True).values_array.dtype
+
+    assert [dtype_of(v).kind for v in (0, 0.5, False, ".")] == ["i", "f", "b", "O"]
+    typed = Grid(rows=1, cols=2, default_value=0, typecode="b", use_numpy=True)
+    assert typed.values_array.dtype == "int8"
+
+
+def test_importing_grid_does_not_import_numpy():
+    code = "import sys, librarium.grid; print('numpy' in sys.modules)"
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert out.stdout.strip() == "False"
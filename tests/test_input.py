@@ -0,0 +1,97 @@
+import pytest
+
+from pyaoc.input import (
+    InputBuffer,
+    InputLines,
+    parse_input_as_int_arr,
+    parse_input_as_int_rows,
+)
+
+
+@pytest.fixture
+def make_lines(tmp_path):
+    def _make(content: bytes) -> InputLines:
+        path = tmp_path / "input.txt"
+        path.write_bytes(content)
+        return InputLines(InputBuffer(path))
+
+    return _make
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        b"",
+        b"\n",
+        b"abc",
+        b"abc\n",
+        b"abc\ndef",
+        b"abc\n\ndef\n",
+        b"abc\r\ndef\r\n",
+        b"  padded  \n\n\n",
+        "unicode é\n".encode(),
+    ],
+)
+def test_lines_match_splitlines(make_lines, content):
+    lines = make_lines(content)
+    expected = content.decode().splitlines()
+    assert list(lines) == expected
+    assert len(lines) == len(expected)
+    assert lines[:] == expected
+    if expected:
+        assert lines[-1] == expected[-1]
+
+
+def test_assignment_is_local_to_copy(make_lines):
+    lines = make_lines(b"S..\n...\n")
+    lines_copy = lines.copy()
+    lines_copy[0] = "..."
+
+    assert lines_copy == ["...", "..."]
+    assert lines == ["S..", "..."]
+
+
+def test_structural_changes_materialize(make_lines):
+    lines = make_lines(b"a\nb\nc\n")
+    lines[1] = "B"
+    del lines[0]
+    lines.append("d")
+
+    assert lines == ["B", "c", "d"]
+    with pytest.raises(IndexError):
+        lines[3]
+
+
+def test_buffer_bytes_access(make_lines):
+    lines = make_lines(b"1,2\r\n3,4\n")
+    assert bytes(lines.buffer.line_bytes(0)) == b"1,2"
+    assert bytes(lines.buffer.data) == b"1,2\r\n3,4\n"
+    assert lines.buffer.digest() == lines.copy().buffer.digest()
+
+
+def test_int_arr_from_mapped_and_plain_lines(make_lines):
+    lines = make_lines(b"11-22,95-115\n-3 x=4,y=-5\n")
+    expected = [11, 22, 95, 115, -3, 4, -5]
+
+    assert list(parse_input_as_int_arr(lines)) == expected
+    assert list(parse_input_as_int_arr(list(lines))) == expected
+    lines[0] = "7"
+    assert list(parse_input_as_int_arr(lines)) == [7, -3, 4, -5]
+
+
+def test_int_rows(make_lines):
+    lines = make_lines(b"162,817,812\n57,618,-57\n")
+    rows = parse_input_as_int_rows(lines, 3)
+
+    assert rows.typecode == "q"
+    assert list(rows[3:6]) == [57, 618, -57]
+    with pytest.raises(ValueError):
+        parse_input_as_int_rows(lines, 4)
+
+
+def test_int_rows_reject_ragged_lines(make_lines):
+    # Six integers would split into two rows of three, but not along the lines
+    lines = make_lines(b"1,2\n3,4,5,6\n")
+    with pytest.raises(ValueError, match="2 integers"):
+        parse_input_as_int_rows(lines, 3)
+    assert list(parse_input_as_int_rows(make_lines(b"1,2\n\n3,4\n"), 2)) == [1, 2, 3, 4]
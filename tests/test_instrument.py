@@ -0,0 +1,57 @@
+from librarium.drange import DynamicRange, MultiRange
+from librarium.grid import Grid, Position
+from librarium.unionfind import SimpleUNF, UnionFind
+from pyaoc.instrument import CallCounter
+from pyaoc.probes import CallCountProbe
+
+
+def test_counts_calls_only_while_enabled():
+    grid = Grid(rows=3, cols=3, default_value=0)
+    original_get = Grid.get
+    counter = CallCounter()
+
+    counter.enable()
+    try:
+        grid.set(Position(1, 1), 5)
+        assert grid.get(Position(1, 1)) == 5
+        assert len(list(grid.neighbors(Position(0, 0)))) == 2
+    finally:
+        counter.disable()
+    grid.get(Position(0, 0))
+
+    assert Grid.get is original_get
+    assert counter.counts["Grid.get"] == 1
+    assert counter.counts["Grid.set"] == 1
+    assert counter.counts["Grid.neighbors"] == 1
+    assert counter.counts["Grid.valid_pos"] == 0
+
+
+def test_dunder_and_inherited_methods_are_counted():
+    multi_range = MultiRange.from_ranges([DynamicRange(1, 5)])
+    counter = CallCounter()
+    counter.enable()
+    try:
+        assert 3 in multi_range
+        unfn = SimpleUNF(None, size=4)
+        assert unfn.union(0, 1)
+        assert UnionFind([1]).find_root(1) == 1
+    finally:
+        counter.disable()
+
+    assert counter.counts["MultiRange.__contains__"] == 1
+    assert counter.counts["UnionFind.union"] == 1
+    assert counter.counts["UnionFind.find_root"] == 3
+
+
+def test_probe_reports_per_key(capsys):
+    probe = CallCountProbe()
+    key = (2025, 4, 1)
+    probe.start_key(key)
+    with probe.measure(key, "solve"):
+        Grid(rows=1, cols=1, default_value=0).get(Position(0, 0))
+    probe.finish_key(key)
+
+    out = capsys.readouterr().out
+    assert "Primitive calls of 250401:" in out
+    assert "Grid.get" in out
+    assert not probe.counter.enabled
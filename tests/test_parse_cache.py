@@ -0,0 +1,94 @@
+import importlib
+import pickle
+import sys
+
+import pytest
+
+from pyaoc.parse_cache import MISS, DiskParseCache
+
+
+def _import_day_module(tmp_path, monkeypatch, source: str) -> str:
+    (tmp_path / "fake_day.py").write_text(source)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.delitem(sys.modules, "fake_day", raising=False)
+    importlib.import_module("fake_day")
+    return "fake_day"
+
+
+def test_roundtrip_and_input_invalidation(tmp_path, monkeypatch):
+    module = _import_day_module(tmp_path, monkeypatch, "PARSER = 1\n")
+    cache = DiskParseCache(tmp_path / "cache")
+    entry = (2025, 8, True, "Solution250801._parse_input", module)
+
+    assert cache.load(*entry, "aaaa") is MISS
+    cache.store(*entry, "aaaa", ([(1.5, ((0, 0, 0), (1, 1, 1)))], [(0, 0, 0)]))
+    assert cache.load(*entry, "aaaa") == ([(1.5, ((0, 0, 0), (1, 1, 1)))], [(0, 0, 0)])
+    assert cache.load(*entry, "bbbb") is MISS
+
+    cache.store(*entry, "bbbb", [1])
+    assert cache.load(*entry, "aaaa") is MISS
+    assert len(list((tmp_path / "cache").glob("*/*/*.pickle"))) == 1
+
+
+def test_source_change_invalidates(tmp_path, monkeypatch):
+    module = _import_day_module(tmp_path, monkeypatch, "PARSER = 1\n")
+    entry = (2025, 8, False, "Solution250801._parse_input", module, "aaaa")
+    DiskParseCache(tmp_path / "cache").store(*entry, [1, 2, 3])
+
+    (tmp_path / "fake_day.py").write_text("PARSER = 2\n")
+    assert DiskParseCache(tmp_path / "cache").load(*entry) is MISS
+
+
+def test_library_change_invalidates(tmp_path, monkeypatch):
+    (tmp_path / "fakehelpers.py").write_text("def parse(lines):\n    return lines\n")
+    monkeypatch.delitem(sys.modules, "fakehelpers", raising=False)
+    module = _import_day_module(tmp_path, monkeypatch, "from fakehelpers import parse\n")
+    entry = (2025, 8, False, "Solution250801._parse_input", module, "aaaa")
+    DiskParseCache(tmp_path / "cache", packages=("fakehelpers",)).store(*entry, [1, 2, 3])
+
+    (tmp_path / "fakehelpers.py").write_text("def parse(lines):\n    return lines[1:]\n")
+    assert DiskParseCache(tmp_path / "cache", packages=("fakehelpers",)).load(*entry) is MISS
+
+
+def test_stores_leave_no_temporary_files(tmp_path, monkeypatch):
+    module = _import_day_module(tmp_path, monkeypatch, "PARSER = 1\n")
+    cache = DiskParseCache(tmp_path / "cache")
+    entry = (2025, 8, False, "Solution250801._parse_input", module, "aaaa")
+    for _ in range(3):
+        cache.store(*entry, [1, 2, 3])
+    assert [path.suffix for path in (tmp_path / "cache").glob("*/*/*")] == [".pickle"]
+
+
+def test_failed_store_removes_its_temporary_file(tmp_path, monkeypatch):
+    module = _import_day_module(tmp_path, monkeypatch, "PARSER = 1\n")
+    cache = DiskParseCache(tmp_path / "cache")
+    entry = (2025, 8, False, "Solution250801._parse_input", module, "aaaa")
+    with pytest.raises((pickle.PicklingError, AttributeError, TypeError)):
+        cache.store(*entry, [lambda: None])
+
+    assert list((tmp_path / "cache").glob("*/*/*")) == []
+    assert cache.load(*entry) is MISS
+
+
+def test_clear_removes_entries_and_stray_temporary_files(tmp_path, monkeypatch):
+    module = _import_day_module(tmp_path, monkeypatch, "PARSER = 1\n")
+    cache = DiskParseCache(tmp_path / "cache")
+    entry = (2025, 8, False, "Solution250801._parse_input", module, "aaaa")
+    cache.store(*entry, [1, 2, 3])
+    # As left by a worker killed while pickling
+    (cache.entry_path(*entry).parent / "tmpabc123.tmp").write_bytes(b"\x80")
+
+    cache.clear()
+    assert list((tmp_path / "cache").glob("*/*/*")) == []
+
+
+def test_corrupted_entry_is_dropped(tmp_path, monkeypatch):
+    module = _import_day_module(tmp_path, monkeypatch, "PARSER = 1\n")
+    cache = DiskParseCache(tmp_path / "cache")
+    entry = (2020, 1, False, "Solution200101._parse_input", module, "aaaa")
+    path = cache.entry_path(*entry)
+    path.parent.mkdir(parents=True)
+    path.write_bytes(b"not a pickle")
+
+    assert cache.load(*entry) is MISS
+    assert not path.exists()
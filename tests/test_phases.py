@@ -0,0 +1,88 @@
+from collections.abc import Sequence
+
+from pyaoc.phases import NO_PHASE, PhaseTrace, phase
+from pyaoc.solution import Solution
+
+
+class _Traced(Solution[list[int]]):
+    YEAR = 2000
+    DAY = 1
+    PART = 1
+
+    def _parse_input(self, input_lines: Sequence[str]) -> list[int]:
+        return [int(line) for line in input_lines]
+
+    @phase("total")
+    def _total(self) -> int:
+        return sum(self.parsed_input)
+
+    def solve(self) -> int:
+        with self.phase("double"):
+            doubled = [2 * n for n in self.parsed_input]
+        return self._total() + sum(doubled)
+
+
+def test_nested_phases_are_recorded_in_start_order():
+    trace = PhaseTrace()
+    with trace.phase("solve"):
+        for _ in range(3):
+            with trace.phase("inner"):
+                pass
+        with trace.phase("other"):
+            pass
+
+    assert [timing.path for timing in trace.timings][:2] == ["solve", "solve/inner"]
+    assert list(trace.totals()) == ["solve", "solve/inner", "solve/other"]
+    assert trace.totals()["solve"] >= trace.totals()["solve/inner"]
+
+
+def test_decorated_recursion_times_every_call():
+    trace = PhaseTrace()
+
+    @trace.phase("fib")
+    def fib(n: int) -> int:
+        return n if n < 2 else fib(n - 1) + fib(n - 2)
+
+    assert fib(4) == 3
+    assert len(trace.timings) == 9
+    assert all(timing.elapsed >= 0 for timing in trace.timings)
+
+
+def test_parsing_is_lazy_and_traced():
+    trace = PhaseTrace()
+    solution = _Traced(["1", "2", "3"], sample=True, trace=trace)
+    assert trace.timings == []
+
+    with solution.phase("solve"):
+        assert solution.solve() == 18
+    # First needed inside "double", still recorded right under "solve"
+    assert list(trace.totals()) == ["solve", "solve/double", "solve/parse", "solve/total"]
+
+
+def test_under_root_phase_restores_the_open_phases():
+    trace = PhaseTrace()
+    with trace.phase("solve"), trace.phase("outer"):
+        with trace.phase("parse", under_root=True), trace.phase("lines"):
+            pass
+        with trace.phase("inner"):
+            pass
+    assert list(trace.totals()) == [
+        "solve",
+        "solve/outer",
+        "solve/parse",
+        "solve/parse/lines",
+        "solve/outer/inner",
+    ]
+
+
+def test_untraced_phases_are_a_shared_no_op():
+    solution = _Traced(["4"], sample=True)
+    assert solution.phase("double") is NO_PHASE
+    assert solution.solve() == 12
+
+
+def test_given_parsed_input_is_not_parsed_again():
+    trace = PhaseTrace()
+    solution = _Traced(["not a number"], sample=True, parsed_input=[5], trace=trace)
+    assert solution.parse() == [5]
+    assert trace.timings == []
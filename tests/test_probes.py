@@ -0,0 +1,95 @@
+import pstats
+import tracemalloc
+
+import pytest
+
+from pyaoc.probes import MemoryProbe, ProfileProbe
+from pyaoc.solution import SOLUTION_REGISTRY
+from pyaoc.solver import Solver
+
+MIB = 1024 * 1024
+
+
+def test_profile_saves_stats_per_key_and_prints_top(tmp_path, capsys):
+    probe = ProfileProbe(True, top=3, out_dir=tmp_path)
+    Solver(to_solve=[(2025, 1, 1), (2025, 1, 2)], with_sample=True, probes=[probe]).solve_all()
+
+    paths = sorted(path.name for path in tmp_path.iterdir())
+    assert paths == ["250101-sample.pstats", "250102-sample.pstats"]
+    assert pstats.Stats(str(tmp_path / "250101-sample.pstats")).total_calls > 0
+
+    out = capsys.readouterr().out
+    assert out.count("top 3 by cumulative time:") == 2
+    assert out.count("Ordered by: cumulative time") == 2
+    assert "due to restriction <3>" in out
+
+
+def test_profile_keeps_sample_and_actual_apart(tmp_path):
+    key = (2025, 1, 1)
+    for with_sample in (True, False):
+        probe = ProfileProbe(with_sample, out_dir=tmp_path)
+        probe.start_key(key)
+        with probe.measure(key, "solve"):
+            sum(range(100))
+        probe.finish_key(key)
+
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        "250101-actual.pstats",
+        "250101-sample.pstats",
+    ]
+
+
+def _report_sections(report: str) -> dict[str, list[str]]:
+    # Site lines of every "    <phase>: peak ..." line of a MemoryProbe report
+    sections: dict[str, list[str]] = {}
+    phase = ""
+    for line in report.splitlines()[1:]:
+        if line.startswith("        "):
+            sections[phase].append(line.strip())
+        else:
+            phase = line.strip().split(":")[0]
+            sections[phase] = []
+    return sections
+
+
+def test_memory_peaks_are_relative_and_sites_per_phase(capsys):
+    probe = MemoryProbe(top=3)
+    key = (2025, 1, 1)
+    before_key = bytearray(8 * MIB)
+
+    probe.start_key(key)
+    with probe.measure(key, "parse"):
+        parsed = bytearray(1 * MIB)
+    with probe.measure(key, "solve"):
+        scratch = bytearray(4 * MIB)
+        del scratch
+        solved = bytearray(2 * MIB)
+    probe.finish_key(key)
+
+    # Neither memory from before the key nor the parse result count in the solve peak
+    assert 1 * MIB <= probe.peaks["parse"] < 2 * MIB
+    assert 4 * MIB <= probe.peaks["solve"] < 5 * MIB
+    assert probe.peak_bytes == probe.peaks["solve"]
+    assert not tracemalloc.is_tracing()
+
+    out = capsys.readouterr().out
+    assert out.startswith("Memory of 250101:")
+    sections = _report_sections(out)
+    assert list(sections) == ["parse", "solve"]
+    assert sections["parse"][0].startswith("test_probes.py:")
+    assert ": 1.0 MiB in " in sections["parse"][0]
+    assert ": 2.0 MiB in " in sections["solve"][0]
+    assert len(before_key) + len(parsed) + len(solved) == 11 * MIB
+
+
+def test_memory_tracing_stops_when_a_key_raises(monkeypatch):
+    solution_cls = SOLUTION_REGISTRY.get_solution((2025, 1, 1))
+
+    class _Failing(solution_cls):
+        def solve(self) -> int:
+            raise RuntimeError("broken solution")
+
+    monkeypatch.setattr(SOLUTION_REGISTRY, "get_solution", lambda key: _Failing)
+    with pytest.raises(RuntimeError, match="broken solution"):
+        Solver(to_solve=[], with_sample=True, probes=[MemoryProbe()]).solve((2025, 1, 1))
+    assert not tracemalloc.is_tracing()
@@ -0,0 +1,27 @@
+import sys
+
+from pyaoc.reloader import reload_order
+
+
+def test_reload_order_follows_imports(tmp_path, monkeypatch):
+    lib = tmp_path / "fakelib"
+    lib.mkdir()
+    (lib / "base.py").write_text("VALUE = 1\n")
+    (lib / "mid.py").write_text("from fakelib.base import VALUE\n")
+    (lib / "top.py").write_text("from fakelib.mid import VALUE\n")
+    (lib / "other.py").write_text("")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    for name in ("fakelib", "fakelib.base", "fakelib.mid", "fakelib.top", "fakelib.other"):
+        monkeypatch.delitem(sys.modules, name, raising=False)
+
+    modules = ["fakelib.top", "fakelib.other", "fakelib.mid", "fakelib.base"]
+    # Importers of a changed module hold references into it, so they are reloaded after it
+    assert reload_order(["fakelib.base"], modules, packages=("fakelib",)) == [
+        "fakelib.base",
+        "fakelib.mid",
+        "fakelib.top",
+    ]
+    assert reload_order(["fakelib.top", "fakelib.other"], modules, packages=("fakelib",)) == [
+        "fakelib.other",
+        "fakelib.top",
+    ]
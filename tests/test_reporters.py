@@ -0,0 +1,77 @@
+import json
+from io import StringIO
+
+from pyaoc.probes import CallCountProbe
+from pyaoc.reporters import HumanReporter, JsonLinesReporter, QuietReporter
+from pyaoc.runs import TIMEOUT, KeyRun
+from pyaoc.solver import Solver
+
+RUNS = [
+    KeyRun((2025, 1, 1), "Solution250101", 3, 0.001, 0.5, output="debug\n", peak_bytes=2048),
+    KeyRun((2025, 1, 2), "Solution250102", None, 0.0, 2.0, status=TIMEOUT, error="Killed"),
+]
+
+
+def _report(reporter_cls) -> str:
+    stream = StringIO()
+    reporter = reporter_cls(with_sample=True, stream=stream)
+    for run in RUNS:
+        reporter.key_started(run.key, run.solution_name)
+        reporter.key_finished(run)
+    reporter.finish(RUNS, 2.5)
+    return stream.getvalue()
+
+
+def test_json_lines_record_per_key():
+    records = [json.loads(line) for line in _report(JsonLinesReporter).splitlines()]
+
+    assert [r["part"] for r in records] == [1, 2]
+    assert records[0]["result"] == 3
+    assert records[0]["parse_ns"] == 1_000_000
+    assert records[0]["solve_ns"] == 500_000_000
+    assert records[0]["peak_bytes"] == 2048
+    assert records[1]["status"] == TIMEOUT
+    assert records[1]["result"] is None
+
+
+def test_quiet_only_answers():
+    assert _report(QuietReporter) == "250101 3\n250102 TIMEOUT\n"
+
+
+def test_human_keeps_banners():
+    out = _report(HumanReporter)
+
+    assert out.count("===== YEAR 2025 =====") == 1
+    assert "debug\n" in out
+    assert "Result: TIMEOUT" in out
+    assert "Failed keys: 250102 (TIMEOUT)" in out
+
+
+def test_solver_captures_prints_for_machine_output(capsys):
+    reporter = JsonLinesReporter(with_sample=True)
+    Solver(to_solve=[(2025, 8, 1)], with_sample=True, reporter=reporter).solve_all()
+
+    lines = capsys.readouterr().out.splitlines()
+    assert len(lines) == 1
+    assert json.loads(lines[0])["solution"] == "Solution250801"
+
+
+def test_probe_reports_reach_machine_output(capsys):
+    reporter = JsonLinesReporter(with_sample=True)
+    Solver(
+        to_solve=[(2025, 4, 1)], with_sample=True, probes=[CallCountProbe()], reporter=reporter
+    ).solve_all()
+
+    (line,) = capsys.readouterr().out.splitlines()
+    assert "Primitive calls of 250401:" in json.loads(line)["probe_report"]
+
+
+def test_quiet_prints_probe_reports_to_stderr(capsys):
+    reporter = QuietReporter(with_sample=True)
+    Solver(
+        to_solve=[(2025, 4, 1)], with_sample=True, probes=[CallCountProbe()], reporter=reporter
+    ).solve_all()
+
+    captured = capsys.readouterr()
+    assert captured.out == "250401 13\n"
+    assert "Primitive calls of 250401:" in captured.err
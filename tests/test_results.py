@@ -0,0 +1,40 @@
+from pyaoc.results import ResultStore, solution_modules
+from pyaoc.solution import SOLUTION_REGISTRY
+
+
+def test_solution_modules_follow_part_1_base():
+    solution_cls = SOLUTION_REGISTRY.get_solution((2025, 8, 2))
+    assert solution_modules(solution_cls) == ["pyaoc.y_2025.d_08"]
+
+
+def test_cached_result_requires_same_fingerprint(tmp_path):
+    path = tmp_path / "results.json"
+    store = ResultStore(path)
+    solution_cls = SOLUTION_REGISTRY.get_solution((2025, 4, 1))
+    fingerprint = store.fingerprint(solution_cls, sample=True)
+    assert fingerprint == ResultStore(path).fingerprint(solution_cls, sample=True)
+    other_day_cls = SOLUTION_REGISTRY.get_solution((2025, 5, 1))
+    assert fingerprint != store.fingerprint(other_day_cls, sample=True)
+
+    store.record((2025, 4, 1), True, solution_cls.__name__, 13, fingerprint)
+    store.save()
+
+    store = ResultStore(path)
+    assert store.cached_result((2025, 4, 1), True, fingerprint) == 13
+    assert store.cached_result((2025, 4, 1), True, "stale") is None
+    assert store.cached_result((2025, 4, 1), False, fingerprint) is None
+
+
+def test_fingerprint_covers_parsing_helpers(tmp_path, monkeypatch):
+    store = ResultStore(tmp_path / "results.json")
+    # Day 8 parses through pyaoc.input.parse_input_as_int_rows
+    solution_cls = SOLUTION_REGISTRY.get_solution((2025, 8, 1))
+    fingerprint = store.fingerprint(solution_cls, sample=True)
+
+    module_digest = store._module_digest
+    monkeypatch.setattr(
+        store,
+        "_module_digest",
+        lambda name: "edited" if name == "pyaoc.input" else module_digest(name),
+    )
+    assert store.fingerprint(solution_cls, sample=True) != fingerprint
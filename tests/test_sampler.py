@@ -0,0 +1,54 @@
+import time
+from collections import Counter
+
+from pyaoc.probes import SamplingProbe
+from pyaoc.sampler import StackSampler, self_counts, trim_common_prefix, write_collapsed
+
+
+def _busy_leaf(seconds: float) -> int:
+    deadline = time.perf_counter() + seconds
+    spins = 0
+    while time.perf_counter() < deadline:
+        spins += 1
+    return spins
+
+
+def _busy(seconds: float) -> int:
+    return _busy_leaf(seconds)
+
+
+def test_sampler_sees_the_hot_function():
+    sampler = StackSampler(interval=0.002)
+    sampler.start()
+    _busy(0.2)
+    samples = sampler.stop()
+
+    assert samples.total() > 0
+    (hottest, _), *_ = self_counts(samples).most_common(1)
+    assert hottest.startswith("_busy_leaf (test_sampler.py:")
+    assert any("_busy (test_sampler.py:" in frame for stack in samples for frame in stack)
+
+
+def test_common_prefix_is_trimmed_to_one_root():
+    samples = Counter({("main", "solve", "a"): 2, ("main", "solve", "b", "c"): 1})
+    assert trim_common_prefix(samples) == Counter({("solve", "a"): 2, ("solve", "b", "c"): 1})
+    assert trim_common_prefix(Counter({("main", "solve"): 3})) == Counter({("solve",): 3})
+
+
+def test_collapsed_format(tmp_path):
+    path = tmp_path / "out" / "stacks.collapsed"
+    write_collapsed(Counter({("solve", "b"): 1, ("solve", "a"): 4}), path)
+    assert path.read_text() == "solve;a 4\nsolve;b 1\n"
+
+
+def test_probe_roots_stacks_at_the_phase(tmp_path, capsys):
+    probe = SamplingProbe(True, rate=500, out_dir=tmp_path)
+    key = (2025, 1, 1)
+    probe.start_key(key)
+    with probe.measure(key, "solve"):
+        _busy(0.1)
+    probe.finish_key(key)
+
+    lines = (tmp_path / "250101-sample.collapsed").read_text().splitlines()
+    assert lines and all(line.startswith("solve;") for line in lines)
+    assert "stack samples saved to" in capsys.readouterr().out
@@ -0,0 +1,51 @@
+import pytest
+
+from pyaoc.gen import get_generator
+from pyaoc.scale import ScaleProfiler, fit_exponent, size_ladder
+
+
+def test_size_ladder_is_geometric_and_distinct():
+    assert size_ladder(10, 2, 4) == [10, 20, 40, 80]
+    assert size_ladder(1, 1.2, 4) == [1, 2]
+    with pytest.raises(ValueError):
+        size_ladder(10, 1, 4)
+
+
+def test_fit_exponent_recovers_power_law():
+    sizes = [10, 20, 40, 80, 160]
+    assert fit_exponent(sizes, [3 * n for n in sizes]) == pytest.approx(1.0)
+    assert fit_exponent(sizes, [n**2 / 7 for n in sizes]) == pytest.approx(2.0)
+    assert fit_exponent(sizes, [5 for _ in sizes]) == pytest.approx(0.0)
+    with pytest.raises(ValueError):
+        fit_exponent([10, 10], [1, 2])
+
+
+def test_scale_reports_every_size(capsys, tmp_path):
+    profiler = ScaleProfiler(
+        to_solve=[(2025, 1, 1)], sizes=[50, 100, 200], repeat=1, inputs_dir=tmp_path
+    )
+    (key_scaling,) = profiler.scale_all()
+    assert [run.size for run in key_scaling.runs] == [50, 100, 200]
+    assert key_scaling.runs[0].input_bytes < key_scaling.runs[-1].input_bytes
+    assert key_scaling.expected_exponent == 1.0
+    assert "time ~ n^" in capsys.readouterr().out
+    assert len(list(tmp_path.rglob("*.txt"))) == 3
+
+
+def test_default_ladder_starts_at_solvable_size(tmp_path):
+    profiler = ScaleProfiler(to_solve=[], inputs_dir=tmp_path)
+    assert profiler._ladder(get_generator(2025, 1)) == [250, 500, 1000, 2000, 4000]
+    sizes = profiler._ladder(get_generator(2025, 8))
+    assert sizes[0] == 1_003
+    assert sizes[-1] == 4 * 1_003
+
+
+def test_failing_key_does_not_stop_the_others(capsys, tmp_path):
+    # Day 8 inputs this small are refused, day 1 still gets scaled
+    profiler = ScaleProfiler(
+        to_solve=[(2025, 8, 1), (2025, 1, 1)], sizes=[20, 40], repeat=1, inputs_dir=tmp_path
+    )
+    scalings = profiler.scale_all()
+    assert profiler.failed == [(2025, 8, 1)]
+    assert [key_scaling.key for key_scaling in scalings] == [(2025, 1, 1)]
+    assert "250801 failed" in capsys.readouterr().out
@@ -0,0 +1,96 @@
+from pyaoc.input import InputBuffer, InputLines
+from pyaoc.parse_cache import DiskParseCache
+from pyaoc.solution import SOLUTION_REGISTRY
+from pyaoc.y_2025.d_08 import Solution250801, Solution250802
+from pyaoc.y_2025.d_09 import Solution250901
+
+
+class TestParseCache:
+    def setup_method(self):
+        SOLUTION_REGISTRY.clear_parse_cache()
+
+    def test_parts_share_parsed_input(self, monkeypatch):
+        parse_calls = 0
+        original_parse = Solution250801._parse_input
+
+        def _counting_parse(self, input_lines):
+            nonlocal parse_calls
+            parse_calls += 1
+            return original_parse(self, input_lines)
+
+        monkeypatch.setattr(Solution250801, "_parse_input", _counting_parse)
+
+        p1 = SOLUTION_REGISTRY.prepare_solution_instance((2025, 8, 1), sample=True)
+        p2 = SOLUTION_REGISTRY.prepare_solution_instance((2025, 8, 2), sample=True)
+
+        assert parse_calls == 1
+        assert isinstance(p1, Solution250801)
+        assert isinstance(p2, Solution250802)
+        assert p1.parsed_input == p2.parsed_input
+
+    def test_solve_does_not_leak_mutations(self):
+        p2 = SOLUTION_REGISTRY.prepare_solution_instance((2025, 8, 2), sample=True)
+        first = p2.solve()
+        again = SOLUTION_REGISTRY.prepare_solution_instance((2025, 8, 2), sample=True)
+        assert again.solve() == first
+
+    def test_in_place_sort_does_not_leak(self):
+        p1 = SOLUTION_REGISTRY.prepare_solution_instance((2025, 9, 1), sample=True)
+        original_order = list(p1.parsed_input)
+        p1.solve()
+
+        p2 = SOLUTION_REGISTRY.prepare_solution_instance((2025, 9, 2), sample=True)
+        assert isinstance(p1, Solution250901)
+        assert p2.parsed_input == original_order
+
+    def test_read_only_days_share_parsed_input(self):
+        p1 = SOLUTION_REGISTRY.prepare_solution_instance((2025, 3, 1), sample=True)
+        p2 = SOLUTION_REGISTRY.prepare_solution_instance((2025, 3, 2), sample=True)
+        assert p2.parsed_input is p1.parsed_input
+
+    def test_unshared_parse_is_not_cached(self, monkeypatch):
+        monkeypatch.setattr(SOLUTION_REGISTRY, "share_parsed", False)
+        p1 = SOLUTION_REGISTRY.prepare_solution_instance((2025, 3, 1), sample=True)
+        p2 = SOLUTION_REGISTRY.prepare_solution_instance((2025, 3, 2), sample=True)
+        assert p2.parsed_input is not p1.parsed_input
+        assert p2.parsed_input == p1.parsed_input
+
+    def test_edited_input_replaces_its_parse(self, tmp_path, monkeypatch):
+        input_path = tmp_path / "d_03.txt"
+        monkeypatch.setattr(
+            "pyaoc.solution.map_input_file",
+            lambda year, day, sample: InputLines(InputBuffer(input_path)),
+        )
+        for content in ("123\n456\n", "789\n"):
+            input_path.write_text(content)
+            p1 = SOLUTION_REGISTRY.prepare_solution_instance((2025, 3, 1), sample=True)
+            p1.parse()
+        p2 = SOLUTION_REGISTRY.prepare_solution_instance((2025, 3, 2), sample=True)
+
+        assert p2.parsed_input == [[7, 8, 9]]
+        assert len(SOLUTION_REGISTRY._parse_cache) == 1
+
+    def test_disk_cache_survives_memory_cache(self, tmp_path):
+        disk_cache = DiskParseCache(tmp_path)
+        p1 = SOLUTION_REGISTRY.prepare_solution_instance(
+            (2025, 8, 1), sample=True, disk_cache=disk_cache
+        )
+        assert len(list(tmp_path.glob("2025/08/*.pickle"))) == 1
+
+        SOLUTION_REGISTRY.clear_parse_cache()
+        p2 = SOLUTION_REGISTRY.prepare_solution_instance(
+            (2025, 8, 2), sample=True, disk_cache=disk_cache
+        )
+        assert p2.parsed_input == p1.parsed_input
+
+
+class TestLazyDiscovery:
+    def test_modules_are_discovered_from_files(self):
+        assert SOLUTION_REGISTRY.modules[(2025, 3)] == "pyaoc.y_2025.d_03"
+        assert SOLUTION_REGISTRY.modules[(2020, 1)] == "pyaoc.y_2020.d_01"
+        assert {2020, 2025} <= set(SOLUTION_REGISTRY.all_years())
+
+    def test_day_is_imported_on_request(self):
+        assert (2025, 5, 2) in SOLUTION_REGISTRY
+        assert SOLUTION_REGISTRY.get_solution((2025, 5, 2)).__module__ == "pyaoc.y_2025.d_05"
+        assert (2025, 25, 1) not in SOLUTION_REGISTRY
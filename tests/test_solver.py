@@ -0,0 +1,92 @@
+from io import StringIO
+
+import pytest
+
+from librarium.grid import Grid
+from pyaoc.keys import short_key
+from pyaoc.probes import CallCountProbe
+from pyaoc.reporters import QuietReporter
+from pyaoc.runs import OK, TIMEOUT
+from pyaoc.solution import SOLUTION_REGISTRY
+from pyaoc.solver import KeyLimits, Solver, solve_supervised
+
+
+def test_supervised_run_matches_in_process():
+    key = (2025, 1, 1)
+    run = solve_supervised(key, "Solution250101", True, KeyLimits(timeout=60))
+
+    assert run.status == OK
+    assert run.result == Solver(to_solve=[], with_sample=True).solve(key).result
+
+
+def test_timeout_is_reported_not_raised():
+    run = solve_supervised((2025, 1, 1), "Solution250101", True, KeyLimits(timeout=1e-6))
+
+    assert run.status == TIMEOUT
+    assert run.result is None
+    assert run.solution_name == "Solution250101"
+
+
+def test_solve_all_keeps_going_after_failure(capsys):
+    keys = [(2025, 1, 1), (2025, 1, 2)]
+    Solver(to_solve=keys, with_sample=True, limits=KeyLimits(timeout=1e-6)).solve_all()
+
+    out = capsys.readouterr().out
+    assert out.count("Result: TIMEOUT") == 2
+    assert "Failed keys: 250101 (TIMEOUT), 250102 (TIMEOUT)" in out
+
+
+def test_solution_is_resolved_before_parse_is_timed(monkeypatch):
+    solver = Solver(to_solve=[], with_sample=True)
+    registry = solver.registry
+    get_solution, prepare = registry.get_solution, registry.prepare_solution_instance
+    calls = []
+
+    def _get_solution(key):
+        calls.append("get_solution")
+        return get_solution(key)
+
+    def _prepare(key, *args, **kwargs):
+        calls.append("prepare")
+        return prepare(key, *args, **kwargs)
+
+    # Resolving the class imports the day module, which must not count as parsing
+    monkeypatch.setattr(registry, "get_solution", _get_solution)
+    monkeypatch.setattr(registry, "prepare_solution_instance", _prepare)
+    solver.solve((2025, 1, 1))
+    assert calls[:2] == ["get_solution", "prepare"]
+
+
+def test_probes_are_finished_when_a_key_raises(monkeypatch):
+    solution_cls = SOLUTION_REGISTRY.get_solution((2025, 1, 1))
+
+    class _Failing(solution_cls):
+        def solve(self) -> int:
+            raise RuntimeError("broken solution")
+
+    monkeypatch.setattr(SOLUTION_REGISTRY, "get_solution", lambda key: _Failing)
+    original_get = Grid.get
+    probe = CallCountProbe()
+
+    with pytest.raises(RuntimeError, match="broken solution"):
+        Solver(to_solve=[], with_sample=True, probes=[probe]).solve((2025, 1, 1))
+    assert not probe.counter.enabled
+    assert Grid.get is original_get
+
+
+def test_parallel_solve_all_matches_sequential():
+    # Listed out of order, so a report sorted or taken as workers finish would differ
+    keys = [(2025, 8, 2), (2025, 1, 1), (2025, 5, 2), (2025, 3, 1), (2025, 1, 2)]
+    reports = {}
+    for jobs in (1, 2):
+        stream = StringIO()
+        Solver(
+            to_solve=keys, with_sample=True, jobs=jobs, reporter=QuietReporter(True, stream)
+        ).solve_all()
+        reports[jobs] = stream.getvalue().splitlines()
+
+    assert [line.split() for line in reports[1]] == [
+        [short_key(key), str(Solver(to_solve=[], with_sample=True).solve(key).result)]
+        for key in keys
+    ]
+    assert reports[2] == reports[1]
@@ -0,0 +1,42 @@
+import os
+
+from pyaoc.config import LIBRARY_ROOT_DIR
+from pyaoc.input import prepare_input_path
+from pyaoc.solution import SOLUTION_REGISTRY
+from pyaoc.watch import DependencyGraph, Watcher
+
+
+def test_graph_maps_files_to_days():
+    graph = DependencyGraph(SOLUTION_REGISTRY, with_sample=True)
+
+    assert (2025, 4) in graph.affected({LIBRARY_ROOT_DIR / "grid.py"})
+    assert (2025, 5) in graph.affected({LIBRARY_ROOT_DIR / "drange.py"})
+    assert (2025, 5) not in graph.affected({LIBRARY_ROOT_DIR / "grid.py"})
+    assert graph.affected({prepare_input_path(2025, 3, sample=True)}) == {(2025, 3)}
+    assert graph.affected({prepare_input_path(2025, 3, sample=False)}) == set()
+
+
+def test_poll_reports_changed_files(tmp_path):
+    inputs = tmp_path / "inputs"
+    inputs.mkdir()
+    kept, edited, removed = inputs / "a.txt", inputs / "b.txt", inputs / "c.txt"
+    for path in (kept, edited, removed):
+        path.write_text("1\n")
+
+    watcher = Watcher(to_solve=[], roots=[(inputs, "*.txt")])
+    assert watcher.poll() == set()
+
+    os.utime(edited, ns=(0, 1))
+    removed.unlink()
+    added = inputs / "d.txt"
+    added.write_text("2\n")
+    assert watcher.poll() == {p.resolve() for p in (edited, removed, added)}
+    assert watcher.poll() == set()
+
+
+def test_only_dependent_keys_are_affected():
+    to_solve = [(2025, 4, 1), (2025, 4, 2), (2025, 5, 1)]
+    watcher = Watcher(to_solve=to_solve, roots=[])
+
+    assert watcher.affected_keys({LIBRARY_ROOT_DIR / "grid.py"}) == [(2025, 4, 1), (2025, 4, 2)]
+    assert watcher.affected_keys({prepare_input_path(2025, 5, sample=True)}) == [(2025, 5, 1)]